@@ -0,0 +1,173 @@
+"""Negotiated brotli / gzip response compression (pure ASGI).
+
+Picks ``br`` when the client accepts it and the ``brotli`` package is
+installed, else ``gzip``. Bodies under ``minimum_size`` bytes, already
+encoded responses and non-text media types pass through untouched.
+Streaming responses are buffered only until ``minimum_size`` bytes, then
+compressed chunk by chunk with a flush after each, so NDJSON/CSV exports
+still arrive incrementally.
+"""
+
+import functools
+import zlib
+
+COMPRESSIBLE_TYPES = (
+    b"application/json",
+    b"application/x-ndjson",
+    b"application/javascript",
+    b"application/xml",
+    b"text/",
+)
+# Server-sent events must reach the client unbuffered
+EXCLUDED_TYPES = (b"text/event-stream",)
+
+
+@functools.lru_cache(maxsize=None)
+def _brotli():
+    try:
+        import brotli  # optional dependency
+    except ImportError:
+        return None
+    return brotli
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        # wbits 31 = gzip container
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._z.compress(data) + self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._z.compress(data) + self._z.flush()
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        self._c = _brotli().Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._c.process(data) + self._c.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._c.process(data) + self._c.finish()
+
+
+def _accepted(scope) -> dict[str, float]:
+    for name, value in scope.get("headers", []):
+        if name == b"accept-encoding":
+            accepted = {}
+            for part in value.decode("latin-1").split(","):
+                coding, _, params = part.strip().partition(";")
+                q = 1.0
+                params = params.strip()
+                if params.startswith("q="):
+                    try:
+                        q = float(params[2:])
+                    except ValueError:
+                        q = 0.0
+                accepted[coding.strip().lower()] = q
+            return accepted
+    return {}
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _choose(self, scope) -> str | None:
+        accepted = _accepted(scope)
+        if accepted.get("br", 0) > 0 and _brotli() is not None:
+            return "br"
+        if accepted.get("gzip", 0) > 0:
+            return "gzip"
+        return None
+
+    def _compressor(self, coding: str):
+        if coding == "br":
+            return _Brotli(self.brotli_quality)
+        return _Gzip(self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        coding = self._choose(scope) if scope["type"] == "http" else None
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+        passthrough = False
+        pending: list[bytes] = []
+
+        async def send_compressed(message):
+            nonlocal start, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                content_type = b""
+                encoded = False
+                for name, value in headers:
+                    if name == b"content-type":
+                        content_type = value.lower()
+                    elif name == b"content-encoding":
+                        encoded = True
+                if (
+                    encoded
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or content_type.startswith(EXCLUDED_TYPES)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message  # hold until we see the first body chunk
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            if compressor is None:
+                # Buffer until we know the body is worth compressing
+                pending.append(body)
+                size = sum(map(len, pending))
+                if more and size < self.minimum_size:
+                    return
+                body = b"".join(pending)
+                pending.clear()
+                if not more and size < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                compressor = self._compressor(coding)
+                headers = [
+                    (k, v)
+                    for k, v in start.get("headers", [])
+                    if k != b"content-length"
+                ]
+                headers.append((b"content-encoding", coding.encode()))
+                headers.append((b"vary", b"Accept-Encoding"))
+                if not more:
+                    body = compressor.finish(body)
+                    headers.append((b"content-length", str(len(body)).encode()))
+                    await send({**start, "headers": headers})
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send({**start, "headers": headers})
+            data = compressor.chunk(body) if more else compressor.finish(body)
+            await send({"type": "http.response.body", "body": data, "more_body": more})
+
+        await self.app(scope, receive, send_compressed)
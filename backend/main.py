@@ -1,17 +1,41 @@
 """FastAPI entry point — wraps existing services layer as REST API."""
 
+import functools
+import hashlib
+import importlib
+import logging
+import re
 import sys
+import threading
+import time
+import uuid
 from pathlib import Path
 
 # Add project root to sys.path so we can import services/database
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Match
 
-from database.connection import init_db
-from backend.routers import crm, projects, network
+from database import query_stats, table_versions
+from database.fieldsets import InvalidFields
+from database.keyset import InvalidCursor
+from database.connection import (
+    REPLICA_MAX_LAG,
+    REPLICA_STICKY_SECONDS,
+    close_async_pool,
+    init_db,
+    replica_configured,
+    track_writes,
+)
+from services import ai_provider
+from services.metrics import Counter, Gauge, Histogram
+from services.nexus import materialize
+from backend.compression import CompressionMiddleware
+from backend.profiling import ProfileMiddleware
+from backend.responses import NEXT_CURSOR_HEADER, ORJSONResponse
+from backend.routers import crm, projects, network, debug, metrics, profiles
 from backend.routers.nexus import (
     clients as nx_clients,
     partners as nx_partners,
@@ -25,48 +49,334 @@ from backend.routers.nexus import (
     search as nx_search,
     telegram as nx_telegram,
     subsidies as nx_subsidies,
+    exports as nx_exports,
+    batch as nx_batch,
+)
+
+app = FastAPI(
+    title="Project Nexus API",
+    version="0.2.0",
+    redirect_slashes=False,
+    default_response_class=ORJSONResponse,
 )
 
-app = FastAPI(title="Project Nexus API", version="0.2.0", redirect_slashes=False)
 
+@app.exception_handler(InvalidCursor)
+@app.exception_handler(InvalidFields)
+async def invalid_query_param(request, exc):
+    # Stale or tampered ?cursor=, unknown name in ?fields=
+    return ORJSONResponse({"detail": str(exc)}, status_code=400)
+
+
+class TrailingSlashMiddleware:
+    """Add a trailing slash to /api/ paths that only match with one.
+
+    Collection routes are declared as "/" (e.g. /api/nx/clients/); this lets
+    /api/nx/clients reach them without a 307 redirect, while paths that
+    already match a route (/api/nx/deals/7) are left alone.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if (
+                path.startswith("/api/")
+                and not path.endswith("/")
+                and "." not in path.rsplit("/", 1)[-1]
+                and _needs_slash(path)
+            ):
+                # In place, so scope["route"] set by the router stays visible
+                # to outer middleware (RequestTimingMiddleware's metrics)
+                scope["path"] = path + "/"
+        await self.app(scope, receive, send)
 
-class TrailingSlashMiddleware(BaseHTTPMiddleware):
-    """Internally add trailing slash so routes match without 307 redirect."""
 
-    async def dispatch(self, request: Request, call_next):
-        path = request.scope["path"]
-        if (
-            path.startswith("/api/")
-            and not path.endswith("/")
-            and "." not in path.split("/")[-1]
-        ):
-            request.scope["path"] = path + "/"
-        return await call_next(request)
+@functools.lru_cache(maxsize=4096)
+def _needs_slash(path: str) -> bool:
+    def matched(p: str) -> bool:
+        scope = {"type": "http", "path": p, "method": "GET", "root_path": ""}
+        # PARTIAL = path matches but not the method; still the right route
+        return any(r.matches(scope)[0] != Match.NONE for r in app.router.routes)
+
+    return not matched(path) and matched(path + "/")
 
 
 app.add_middleware(TrailingSlashMiddleware)
 
+
+class ReadYourWritesMiddleware:
+    """Keep a client on the primary DB for a few seconds after it writes.
+
+    Tracks writes per request (database.connection.track_writes) and sets a
+    short-lived cookie when one happened; while the cookie is valid, that
+    client's readonly queries skip the replica. No-op without a replica.
+    """
+
+    COOKIE = "nx_db_pin"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replica_configured():
+            await self.app(scope, receive, send)
+            return
+
+        with track_writes(pinned=self._pinned(scope)) as state:
+
+            async def send_with_pin(message):
+                if message["type"] == "http.response.start" and state["wrote"]:
+                    until = int(time.time() + REPLICA_STICKY_SECONDS) + 1
+                    cookie = (
+                        f"{self.COOKIE}={until}; Max-Age={int(REPLICA_STICKY_SECONDS) + 1}; "
+                        "Path=/; HttpOnly; SameSite=Lax"
+                    )
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"set-cookie", cookie.encode("latin-1")),
+                        ],
+                    }
+                await send(message)
+
+            await self.app(scope, receive, send_with_pin)
+
+    def _pinned(self, scope) -> bool:
+        for name, value in scope.get("headers", []):
+            if name != b"cookie":
+                continue
+            for part in value.decode("latin-1").split(";"):
+                key, _, val = part.strip().partition("=")
+                if key == self.COOKIE and val.isdigit():
+                    return int(val) > time.time()
+        return False
+
+
+app.add_middleware(ReadYourWritesMiddleware)
+
+
+class ConditionalGetMiddleware:
+    """ETag / If-None-Match for hot list endpoints.
+
+    The ETag is derived from database.table_versions counters for the tables
+    a route reads (plus its query string), computed *before* the handler
+    runs. A matching If-None-Match is answered 304 without touching the
+    database. Routes whose rows depend on NOW() also roll their ETag every
+    ``ttl`` seconds so values like idle_days don't go stale indefinitely.
+    """
+
+    # path -> (tables read, ttl seconds; 0 = only writes invalidate)
+    ROUTES = {
+        "/api/nx/clients": (("nx_client", "nx_deal"), 0),
+        # ?client_id= / ?partner_id= attach partner names
+        "/api/nx/deals": (
+            ("nx_deal", "nx_client", "nx_deal_partner", "nx_partner"),
+            600,
+        ),
+        "/api/nx/intel": (("nx_intel", "nx_file"), 0),
+    }
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        route = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            route = self.ROUTES.get(scope["path"].rstrip("/"))
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+
+        tables, ttl = route
+        settle = REPLICA_MAX_LAG if replica_configured() else 0
+        version = table_versions.token(tables, settle_seconds=settle)
+        if version is None:
+            await self.app(scope, receive, send)
+            return
+        bucket = int(time.time() // ttl) if ttl else 0
+        key = f"{version}|{scope['query_string'].decode('latin-1')}|{bucket}"
+        etag = f'W/"{hashlib.md5(key.encode()).hexdigest()[:16]}"'.encode()
+        cache_headers = [(b"etag", etag), (b"cache-control", b"no-cache")]
+
+        if self._matches(scope, etag):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": cache_headers,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), *cache_headers],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+    @staticmethod
+    def _matches(scope, etag: bytes) -> bool:
+        for name, value in scope.get("headers", []):
+            if name == b"if-none-match":
+                candidates = [v.strip() for v in value.split(b",")]
+                # Weak comparison: W/"x" matches "x"
+                bare = etag.removeprefix(b"W/")
+                return any(
+                    c == b"*" or c.removeprefix(b"W/") == bare for c in candidates
+                )
+        return False
+
+
+app.add_middleware(ConditionalGetMiddleware)
+
+# br / gzip for JSON, NDJSON and CSV bodies over 1 KB
+app.add_middleware(CompressionMiddleware)
+
+ALLOWED_ORIGINS = [
+    "http://localhost:3000",
+    "http://localhost:3333",
+    "http://localhost:8503",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:3333",
+    "https://sales.phyra.uk",
+    "https://api.phyra.uk",
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:3333",
-        "http://localhost:8503",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3333",
-        "https://sales.phyra.uk",
-        "https://api.phyra.uk",
-    ],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "Server-Timing", NEXT_CURSOR_HEADER],
+)
+
+
+HTTP_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being served.")
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template, method and status.",
+    ("route", "method", "status"),
 )
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency (through the last body chunk) by route template.",
+    ("route", "method"),
+)
+
+
+class RequestTimingMiddleware:
+    """Request id + Server-Timing (db / ai / total) on every HTTP response,
+    plus the http_* metrics exposed at /api/metrics.
+
+    Reuses a well-formed incoming X-Request-ID, else generates one; it is
+    echoed back and stored in scope["state"]["request_id"]. DB time comes
+    from the instrumented cursors, AI time from services.ai_provider, both
+    via database.query_stats.request_timings(). "total" is time to the
+    response headers, so for streaming responses it excludes the body.
+    """
+
+    _REQUEST_ID_RE = re.compile(r"^[\w.:-]{1,64}$")
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        origin = None
+        for name, value in scope.get("headers", []):
+            if name == b"x-request-id":
+                candidate = value.decode("latin-1")
+                if self._REQUEST_ID_RE.match(candidate):
+                    request_id = candidate
+            elif name == b"origin":
+                origin = value
+        request_id = request_id or uuid.uuid4().hex
+        scope.setdefault("state", {})["request_id"] = request_id
+        start = time.perf_counter()
+        status = 500
+
+        with query_stats.request_timings() as totals:
+
+            async def send_with_timing(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    headers = [
+                        *message.get("headers", []),
+                        (b"x-request-id", request_id.encode("latin-1")),
+                        (b"server-timing", self._server_timing(totals, start)),
+                    ]
+                    # Lets the frontend's devtools read Server-Timing cross-origin
+                    if (
+                        origin is not None
+                        and origin.decode("latin-1") in ALLOWED_ORIGINS
+                    ):
+                        headers.append((b"timing-allow-origin", origin))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            HTTP_IN_FLIGHT.inc()
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                HTTP_IN_FLIGHT.dec()
+                route = self._route_template(scope)
+                method = scope["method"]
+                HTTP_REQUESTS.inc(route, method, str(status))
+                HTTP_LATENCY.observe(time.perf_counter() - start, route, method)
+
+    @staticmethod
+    def _route_template(scope) -> str:
+        """Matched path template, not the raw path, to keep label cardinality
+        bounded. Newer FastAPI leaves only the router-relative path on
+        scope["route"] and records the prefixed one in its own scope entry."""
+        route = scope.get("route")
+        if route is None:
+            return "unmatched"
+        context = scope.get("fastapi", {}).get("effective_route_context")
+        return getattr(context, "path_format", None) or route.path
+
+    @staticmethod
+    def _server_timing(totals: dict, start: float) -> bytes:
+        parts = []
+        for name in ("db", "ai"):
+            seconds, count = totals.get(name, (0.0, 0))
+            parts.append(f'{name};dur={seconds * 1000:.1f};desc="{count} calls"')
+        parts.append(f"total;dur={(time.perf_counter() - start) * 1000:.1f}")
+        return ", ".join(parts).encode("latin-1")
+
+
+# ?__profile=1 (admin only); inside the timing middleware so profiles are
+# named after the request id
+app.add_middleware(ProfileMiddleware)
+
+# Outermost, so "total" covers every other middleware
+app.add_middleware(RequestTimingMiddleware)
 
 # Legacy SPMS routers
 app.include_router(crm.router, prefix="/api/crm", tags=["CRM (Legacy)"])
 app.include_router(projects.router, prefix="/api/projects", tags=["Projects (Legacy)"])
 app.include_router(network.router, prefix="/api/network", tags=["Network (Legacy)"])
 
+# Operator debug endpoints (disabled unless ADMIN_TOKEN is set)
+app.include_router(debug.router, prefix="/api/debug", tags=["Debug"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["Debug"])
+app.include_router(profiles.router, prefix="/api/debug/profiles", tags=["Debug"])
+
 # Nexus Engine 1 routers
 app.include_router(nx_clients.router, prefix="/api/nx/clients", tags=["Clients"])
 app.include_router(nx_partners.router, prefix="/api/nx/partners", tags=["Partners"])
@@ -80,6 +390,24 @@ app.include_router(nx_tbd.router, prefix="/api/nx/tbd", tags=["TBD"])
 app.include_router(nx_search.router, prefix="/api/nx/search", tags=["Search"])
 app.include_router(nx_telegram.router, prefix="/api/nx/telegram", tags=["Telegram"])
 app.include_router(nx_subsidies.router, prefix="/api/nx/subsidies", tags=["Subsidies"])
+app.include_router(nx_exports.router, prefix="/api/nx/exports", tags=["Exports"])
+app.include_router(nx_batch.router, prefix="/api/nx/batch", tags=["Batch"])
+
+
+def _warm_up():
+    """Load what imports defer (OpenCC dictionaries, the AI SDK, streamlit
+    for the legacy caches) while the app is already serving, so neither
+    startup nor the first request that needs one pays for it."""
+    steps = (
+        materialize.warm_up,
+        ai_provider.warm_up,
+        functools.partial(importlib.import_module, "streamlit"),
+    )
+    for step in steps:
+        try:
+            step()
+        except Exception as e:  # e.g. an optional SDK that isn't installed
+            logging.getLogger(__name__).warning("warm-up step failed: %s", e)
 
 
 @app.on_event("startup")
@@ -87,9 +415,13 @@ def startup():
     try:
         init_db()
     except Exception as e:
-        import logging
-
         logging.getLogger(__name__).warning("DB init skipped: %s", e)
+    threading.Thread(target=_warm_up, name="warm-up", daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_async_pool()
 
 
 @app.get("/api/health")
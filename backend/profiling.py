@@ -0,0 +1,155 @@
+"""Per-request sampling profiler for live debugging (pure ASGI).
+
+``?__profile=1`` with the admin token (X-Admin-Token or a Bearer token, as
+for /api/debug) runs that one request under a wall-clock stack sampler and
+writes the result to PROFILE_DIR in folded-stack format, one
+``frame;frame;frame count`` line per stack, which flamegraph.pl,
+speedscope and inferno read directly. The file name comes back in the
+X-Profile response header; /api/debug/profiles lists and serves them
+(backend/routers/profiles.py).
+
+A sampler rather than cProfile because sync endpoints run on the
+threadpool and cProfile only sees its own thread. Every
+PROFILE_INTERVAL_MS it records the stacks of the event loop thread (async
+endpoints, including time spent waiting on I/O) and of any thread that is
+running project code (sync endpoints). Requests served concurrently by
+other threads show up too, so profile on a quiet instance when you can.
+Webhooks can be profiled by replaying their payload with the admin header.
+"""
+
+import collections
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import HTTPException
+
+from backend.responses import ORJSONResponse
+from backend.routers.debug import require_admin
+
+ROOT = Path(__file__).resolve().parent.parent
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR") or ROOT / "profiles")
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000
+PARAM = "__profile"
+
+
+def _is_project_file(filename: str) -> bool:
+    return filename.startswith(str(ROOT)) and "site-packages" not in filename
+
+
+class _Sampler(threading.Thread):
+    """Collects folded stacks of the interesting threads until stopped."""
+
+    def __init__(self, loop_thread: int, interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.loop_thread = loop_thread
+        self.interval = interval
+        self.stacks: collections.Counter = collections.Counter()
+        self._labels: dict = {}
+        self._done = threading.Event()
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = code.co_filename
+            if _is_project_file(filename):
+                filename = os.path.relpath(filename, ROOT)
+            else:
+                filename = os.path.basename(filename)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            label = self._labels[code] = label.replace(";", ":")
+        return label
+
+    def _fold(self, thread_name: str, frame) -> tuple[str, bool]:
+        frames, ours = [], False
+        while frame is not None:
+            ours = ours or _is_project_file(frame.f_code.co_filename)
+            frames.append(self._label(frame.f_code))
+            frame = frame.f_back
+        return ";".join([thread_name, *reversed(frames)]), ours
+
+    def run(self):
+        me = threading.get_ident()
+        while not self._done.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack, ours = self._fold(names.get(ident, str(ident)), frame)
+                # Idle workers and library housekeeping threads are noise
+                if ours or ident == self.loop_thread:
+                    self.stacks[stack] += 1
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+
+class ProfileMiddleware:
+    """Run requests carrying ``?__profile=1`` under _Sampler (admin only)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or PARAM.encode() not in scope["query_string"]:
+            await self.app(scope, receive, send)
+            return
+        params = parse_qsl(scope["query_string"].decode("latin-1"))
+        if (PARAM, "1") not in params:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers", []))
+        try:
+            require_admin(
+                x_admin_token=_header(headers, b"x-admin-token"),
+                authorization=_header(headers, b"authorization"),
+            )
+        except HTTPException as e:
+            response = ORJSONResponse({"detail": e.detail}, status_code=e.status_code)
+            await response(scope, receive, send)
+            return
+
+        # Handlers never see the flag
+        scope["query_string"] = urlencode(
+            [(k, v) for k, v in params if k != PARAM]
+        ).encode("latin-1")
+        request_id = scope.get("state", {}).get("request_id") or uuid.uuid4().hex
+        slug = re.sub(r"[^A-Za-z0-9.-]+", "_", scope["path"].strip("/")) or "root"
+        name = (
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}-{slug}"
+            f"-{request_id[:12]}.folded"
+        )
+
+        async def send_with_name(message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"x-profile", name.encode()),
+                    ],
+                }
+            await send(message)
+
+        sampler = _Sampler(threading.get_ident(), PROFILE_INTERVAL)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_name)
+        finally:
+            sampler.stop()
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            (PROFILE_DIR / name).write_text(
+                "".join(f"{s} {n}\n" for s, n in sorted(sampler.stacks.items()))
+            )
+
+
+def _header(headers: dict, name: bytes) -> str | None:
+    value = headers.get(name)
+    return value.decode("latin-1") if value is not None else None
@@ -0,0 +1,178 @@
+"""Response classes shared by the API routers."""
+
+import csv
+import datetime
+import decimal
+import functools
+import inspect
+import io
+import itertools
+import json
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+
+from database.connection import Row
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj):
+    """Types orjson doesn't serialize natively, matching jsonable_encoder.
+
+    datetime/date/time, UUID, dict/list (psycopg2 JSON/JSONB) and Enum are
+    handled by orjson itself.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, Row):
+        return obj._asdict()
+    # Rare types (pydantic models, sets, timedelta, ...): defer to FastAPI
+    return jsonable_encoder(obj)
+
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content, default=_json_default, option=_ORJSON_OPTIONS)
+
+
+class ORJSONResponse(Response):
+    """Default JSON response: orjson with Decimal and Row support."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def page_response(rows, keyset, limit: int | None) -> ORJSONResponse:
+    """One page of a keyset-paginated list (see database.keyset).
+
+    The body stays a plain JSON array; the cursor for the next page, if
+    any, goes in the X-Next-Cursor header.
+    """
+    cursor = keyset.next_cursor(rows, limit)
+    return ORJSONResponse(
+        rows, headers={NEXT_CURSOR_HEADER: cursor} if cursor else None
+    )
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that renders plain return values with ORJSONResponse directly.
+
+    FastAPI otherwise runs jsonable_encoder over every returned dict before
+    the response class sees it, which dominates serialization time for row
+    lists. Routes with a response_model keep FastAPI's validation path.
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        model = kwargs.get("response_model")
+        if isinstance(model, DefaultPlaceholder):
+            model = model.value
+        if model is None and not (
+            inspect.isgeneratorfunction(endpoint)
+            or inspect.isasyncgenfunction(endpoint)
+        ):
+            endpoint = _render_with_orjson(endpoint, kwargs.get("status_code") or 200)
+            # Keep FastAPI from inferring a response_model from annotations
+            kwargs["response_model"] = None
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _render_with_orjson(endpoint, status_code: int):
+    def wrap(result):
+        if isinstance(result, Response):
+            return result
+        if status_code == 204 or status_code == 304:
+            return Response(status_code=status_code)
+        return ORJSONResponse(result, status_code=status_code)
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            return wrap(await endpoint(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        return wrap(endpoint(*args, **kwargs))
+
+    return wrapper
+
+
+def wants_event_stream(request: Request) -> bool:
+    """Whether the client asked for server-sent events (Accept header)."""
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+def sse_event(event: str, data) -> bytes:
+    """One server-sent event with a JSON ``data`` line."""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+class EventStreamResponse(StreamingResponse):
+    """Server-sent events; ``content`` yields sse_event() chunks.
+
+    Marked uncacheable and unbuffered so proxies pass each event on as it
+    is produced (CompressionMiddleware skips this media type too).
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content, headers: dict | None = None, **kwargs):
+        headers = {
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            **(headers or {}),
+        }
+        super().__init__(content, headers=headers, **kwargs)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(records, batch: int = 500):
+    """Encode Rows as newline-delimited JSON, ``batch`` rows per chunk."""
+    for chunk in _batched(records, batch):
+        yield b"".join(dumps(r) + b"\n" for r in chunk)
+
+
+def iter_csv(records, batch: int = 500):
+    """Encode Rows as CSV with a header row, ``batch`` rows per chunk.
+
+    Starts with a UTF-8 BOM so Excel detects the encoding of CJK text.
+    """
+    header_written = False
+    for chunk in _batched(records, batch):
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        if not header_written:
+            buf.write("\ufeff")
+            writer.writerow(chunk[0].keys())
+            header_written = True
+        writer.writerows([_csv_value(v) for v in r] for r in chunk)
+        yield buf.getvalue().encode("utf-8")
+
+
+def _batched(records, size: int):
+    it = iter(records)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
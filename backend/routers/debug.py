@@ -0,0 +1,53 @@
+"""Debug API router — runtime introspection for operators.
+
+Disabled (404) unless ADMIN_TOKEN is set; requests must then send it in the
+X-Admin-Token header (or as an Authorization bearer token).
+"""
+
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from backend.responses import ORJSONRoute
+from database import query_stats
+from database.connection import pool_stats as _pool_stats
+
+
+def require_admin(
+    x_admin_token: str | None = Header(None),
+    authorization: str | None = Header(None),
+):
+    """X-Admin-Token, or ``Authorization: Bearer`` for scrapers like Prometheus."""
+    token = os.getenv("ADMIN_TOKEN", "")
+    if not token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    supplied = x_admin_token
+    if not supplied and authorization and authorization.startswith("Bearer "):
+        supplied = authorization[len("Bearer ") :]
+    if not supplied or not hmac.compare_digest(supplied, token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(route_class=ORJSONRoute, dependencies=[Depends(require_admin)])
+
+
+@router.get("/queries")
+def list_query_stats(sort: str = "total_ms", limit: int = 50):
+    """Per-statement latency stats, most expensive first."""
+    return {
+        "enabled": query_stats.ENABLED,
+        "slow_query_ms": query_stats.SLOW_QUERY_MS,
+        "queries": query_stats.snapshot(sort, limit),
+    }
+
+
+@router.delete("/queries", status_code=204)
+def reset_query_stats():
+    query_stats.reset()
+
+
+@router.get("/pool")
+def pool_stats():
+    """Sync pool stats per target (primary / replica)."""
+    return _pool_stats()
@@ -0,0 +1,109 @@
+"""Metrics API router — Prometheus text exposition at /api/metrics.
+
+Guarded like the debug router (ADMIN_TOKEN; Prometheus can send it as
+``authorization: {credentials: ...}``). HTTP and AI metrics are recorded
+as requests happen; pool and queue figures are read at scrape time.
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from backend.responses import ORJSONRoute
+from backend.routers.debug import require_admin
+from database.connection import async_pool_stats, pool_stats
+from services import metrics
+from services import task_queue as task_queue_svc
+
+router = APIRouter(route_class=ORJSONRoute, dependencies=[Depends(require_admin)])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _pool_metrics():
+    sync = pool_stats()
+    yield (
+        "db_pool_connections",
+        "gauge",
+        "Sync pool connections by state.",
+        [
+            ({"target": t, "state": state}, s[state])
+            for t, s in sync.items()
+            for state in ("in_use", "idle", "waiting")
+        ],
+    )
+    yield (
+        "db_pool_max_connections",
+        "gauge",
+        "Sync pool size limit.",
+        [({"target": t}, s["max"]) for t, s in sync.items()],
+    )
+    yield (
+        "db_pool_checkouts_total",
+        "counter",
+        "Sync pool connection checkouts.",
+        [({"target": t}, s["checkouts"]) for t, s in sync.items()],
+    )
+    yield (
+        "db_pool_waits_total",
+        "counter",
+        "Sync pool checkouts that had to wait for a connection.",
+        [({"target": t}, s["waits"]) for t, s in sync.items()],
+    )
+    yield (
+        "db_pool_wait_seconds_total",
+        "counter",
+        "Time spent waiting for a sync pool connection.",
+        [({"target": t}, s["wait_seconds"]) for t, s in sync.items()],
+    )
+    yield (
+        "db_pool_timeouts_total",
+        "counter",
+        "Sync pool checkouts that gave up (PoolTimeout).",
+        [({"target": t}, s["timeouts"]) for t, s in sync.items()],
+    )
+
+    stats = async_pool_stats()
+    yield (
+        "db_async_pool_connections",
+        "gauge",
+        "Async pool connections: open and available.",
+        [
+            ({"target": t, "state": state}, s.get(key, 0))
+            for t, s in stats.items()
+            for state, key in (("open", "pool_size"), ("available", "pool_available"))
+        ],
+    )
+    yield (
+        "db_async_pool_waiting",
+        "gauge",
+        "Async pool requests waiting for a connection.",
+        [({"target": t}, s.get("requests_waiting", 0)) for t, s in stats.items()],
+    )
+    yield (
+        "db_async_pool_wait_seconds_total",
+        "counter",
+        "Time async pool requests spent queued.",
+        [
+            ({"target": t}, s.get("requests_wait_ms", 0) / 1000)
+            for t, s in stats.items()
+        ],
+    )
+
+
+def _queue_metrics():
+    counts = task_queue_svc.count_by_status()
+    yield (
+        "ai_task_queue_tasks",
+        "gauge",
+        "ai_task_queue rows by status (pending = worker backlog).",
+        [({"status": status}, n) for status, n in sorted(counts.items())],
+    )
+
+
+metrics.register_collector(_pool_metrics)
+metrics.register_collector(_queue_metrics)
+
+
+@router.get("", response_class=PlainTextResponse)
+def scrape():
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
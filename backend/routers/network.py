@@ -3,9 +3,10 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute
 from services import network as network_svc
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class RelationCreate(BaseModel):
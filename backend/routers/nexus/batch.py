@@ -0,0 +1,204 @@
+"""Nexus batch router — several /api/nx calls in one HTTP request.
+
+Each sub-request is dispatched in-process through the app's router, so it
+gets the same validation, handlers and error responses as a direct call,
+minus the per-request HTTP and middleware overhead. Consecutive GETs run
+concurrently; when two or more of them are served by sync endpoints, those
+share one read-only unit_of_work (one pooled connection, one snapshot),
+opened and committed off the event loop. Any other method runs alone, in
+order, so a read listed after a write sees it.
+
+Results come back in request order: ``{"responses": [{"status", "headers",
+"body"}, ...]}``. A failing sub-request only fails its own entry, but a DB
+error inside a shared read group aborts that group's transaction.
+"""
+
+import asyncio
+import contextlib
+import inspect
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.routing import Match
+
+from backend.responses import NEXT_CURSOR_HEADER, ORJSONRoute
+from database.connection import unit_of_work_async
+
+router = APIRouter(route_class=ORJSONRoute)
+
+MAX_SUBREQUESTS = 20
+PREFIX = "/api/nx"
+METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+# Streamed files don't fit in a JSON envelope; batches don't nest
+EXCLUDED = ("/api/nx/batch", "/api/nx/exports")
+# Request headers passed on to sub-requests
+FORWARDED_HEADERS = {b"authorization", b"cookie", b"x-admin-token", b"x-request-id"}
+# Response headers returned with each result
+RETURNED_HEADERS = {"location", NEXT_CURSOR_HEADER.lower()}
+
+
+class SubRequest(BaseModel):
+    method: str = "GET"
+    path: str
+    body: object | None = None
+
+
+class BatchRequest(BaseModel):
+    requests: list[SubRequest]
+
+
+def _target(app, sub: SubRequest) -> tuple[str, str]:
+    """``(path, query_string)`` under /api/nx, trailing slash added where
+    only the collection route ("/") matches, as TrailingSlashMiddleware does."""
+    path, _, query = sub.path.partition("?")
+    if not path.startswith(PREFIX + "/"):
+        path = PREFIX + "/" + path.lstrip("/")
+    if path.startswith(EXCLUDED):
+        raise HTTPException(400, f"{sub.path} cannot be batched")
+
+    def matched(p: str) -> bool:
+        scope = {"type": "http", "path": p, "method": sub.method, "root_path": ""}
+        return any(r.matches(scope)[0] != Match.NONE for r in app.router.routes)
+
+    if not path.endswith("/") and not matched(path) and matched(path + "/"):
+        path += "/"
+    return path, query
+
+
+def _endpoint(routes, scope: dict):
+    """The endpoint that would serve ``scope``, descending into routers
+    added with include_router (kept nested, with their prefix, by FastAPI)."""
+    for route in routes:
+        include = getattr(route, "include_context", None)
+        if include is not None:
+            if scope["path"].startswith(include.prefix):
+                sub_scope = {**scope, "path": scope["path"][len(include.prefix) :]}
+                found = _endpoint(include.included_router.routes, sub_scope)
+                if found is not None:
+                    return found
+        elif route.matches(scope)[0] == Match.FULL:
+            return getattr(route, "endpoint", None)
+    return None
+
+
+def _uses_sync_db(app, sub: SubRequest) -> bool:
+    """Whether ``sub`` is served by a sync endpoint, the only kind that joins
+    a shared unit_of_work (async endpoints use their own async connections)."""
+    try:
+        path, _ = _target(app, sub)
+    except HTTPException:
+        return False
+    scope = {
+        "type": "http",
+        "path": path,
+        "method": sub.method.upper(),
+        "root_path": "",
+    }
+    endpoint = _endpoint(app.router.routes, scope)
+    return endpoint is not None and not inspect.iscoroutinefunction(endpoint)
+
+
+async def _dispatch(request: Request, sub: SubRequest) -> dict:
+    method = sub.method.upper()
+    try:
+        if method not in METHODS:
+            raise HTTPException(405, f"Method {sub.method} not allowed")
+        path, query = _target(request.app, sub)
+    except HTTPException as e:
+        return {"status": e.status_code, "headers": {}, "body": {"detail": e.detail}}
+
+    parent = request.scope
+    headers = [(k, v) for k, v in parent["headers"] if k in FORWARDED_HEADERS]
+    body = b""
+    if sub.body is not None:
+        body = orjson.dumps(sub.body)
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+    scope = {
+        **{k: v for k, v in parent.items() if k not in ("router", "route", "endpoint")},
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+        "state": dict(parent.get("state", {})),
+    }
+
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status, response_headers, chunks = 500, {}, []
+
+    async def send(message):
+        nonlocal status, response_headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers = {
+                k.decode("latin-1").lower(): v.decode("latin-1")
+                for k, v in message.get("headers", [])
+            }
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app.router(scope, receive, send)
+    except StarletteHTTPException as e:  # no route matched
+        return {"status": e.status_code, "headers": {}, "body": {"detail": e.detail}}
+    except Exception:  # unhandled in the handler; the other entries still count
+        return {
+            "status": 500,
+            "headers": {},
+            "body": {"detail": "Internal Server Error"},
+        }
+
+    raw = b"".join(chunks)
+    if not raw:
+        payload = None
+    elif response_headers.get("content-type", "").startswith("application/json"):
+        payload = orjson.loads(raw)
+    else:
+        payload = raw.decode("utf-8", "replace")
+    return {
+        "status": status,
+        "headers": {k: v for k, v in response_headers.items() if k in RETURNED_HEADERS},
+        "body": payload,
+    }
+
+
+@router.post("/")
+async def batch(body: BatchRequest, request: Request):
+    if not body.requests:
+        raise HTTPException(400, "No requests")
+    if len(body.requests) > MAX_SUBREQUESTS:
+        raise HTTPException(400, f"At most {MAX_SUBREQUESTS} requests per batch")
+
+    # Runs of consecutive GETs, and every other request on its own
+    groups: list[list[SubRequest]] = []
+    for sub in body.requests:
+        is_read = sub.method.upper() == "GET"
+        if is_read and groups and groups[-1][0].method.upper() == "GET":
+            groups[-1].append(sub)
+        else:
+            groups.append([sub])
+
+    responses = []
+    for group in groups:
+        is_read = group[0].method.upper() == "GET"
+        shared = contextlib.nullcontext()
+        # Sync handlers run in the threadpool with a copy of this context,
+        # so they all pick up the unit's connection; one alone gains nothing
+        if is_read and sum(_uses_sync_db(request.app, s) for s in group) > 1:
+            shared = unit_of_work_async(readonly=True)
+        async with shared:
+            responses += await asyncio.gather(*(_dispatch(request, s) for s in group))
+    return {"responses": responses}
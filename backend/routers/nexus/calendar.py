@@ -3,24 +3,25 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute
 from services.nexus.calendar import (
     create_meeting,
     get_meeting,
-    get_meetings_by_date,
-    get_meetings_by_month,
-    get_meetings_by_range,
-    get_meetings_by_deal,
+    get_meetings_by_date_async,
+    get_meetings_by_month_async,
+    get_meetings_by_range_async,
+    get_meetings_by_deal_async,
     update_meeting,
     complete_meeting,
     delete_meeting,
     create_reminder,
-    get_reminders_by_date,
-    get_reminders_by_month,
+    get_reminders_by_date_async,
+    get_reminders_by_month_async,
     resolve_reminder,
-    get_pending_reminders,
+    get_pending_reminders_async,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class MeetingCreate(BaseModel):
@@ -54,22 +55,22 @@ class ReminderCreate(BaseModel):
 
 
 @router.get("/meetings")
-def list_meetings(date: str | None = None, deal_id: int | None = None):
+async def list_meetings(date: str | None = None, deal_id: int | None = None):
     if date:
-        return get_meetings_by_date(date)
+        return await get_meetings_by_date_async(date)
     if deal_id:
-        return get_meetings_by_deal(deal_id)
+        return await get_meetings_by_deal_async(deal_id)
     return []
 
 
 @router.get("/meetings/range")
-def meetings_by_range(start: str, end: str):
-    return get_meetings_by_range(start, end)
+async def meetings_by_range(start: str, end: str):
+    return await get_meetings_by_range_async(start, end)
 
 
 @router.get("/meetings/month/{year}/{month}")
-def meetings_by_month(year: int, month: int):
-    return get_meetings_by_month(year, month)
+async def meetings_by_month(year: int, month: int):
+    return await get_meetings_by_month_async(year, month)
 
 
 @router.get("/meetings/{meeting_id}")
@@ -112,15 +113,15 @@ def remove_meeting(meeting_id: int):
 
 
 @router.get("/reminders")
-def list_reminders(date: str | None = None):
+async def list_reminders(date: str | None = None):
     if date:
-        return get_reminders_by_date(date)
-    return get_pending_reminders()
+        return await get_reminders_by_date_async(date)
+    return await get_pending_reminders_async()
 
 
 @router.get("/reminders/month/{year}/{month}")
-def reminders_by_month(year: int, month: int):
-    return get_reminders_by_month(year, month)
+async def reminders_by_month(year: int, month: int):
+    return await get_reminders_by_month_async(year, month)
 
 
 @router.post("/reminders", status_code=201)
@@ -1,19 +1,23 @@
 """Nexus clients router."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute, page_response
+from database.connection import unit_of_work
+from database.fieldsets import parse_fields, split_fields
 from services.nexus.clients import (
     create_client,
     get_client,
     get_all_clients,
     update_client,
     delete_client,
+    CLIENT_KEYSET,
 )
 from services.nexus.documents import get_documents_by_client
 from services.nexus.tags import get_entity_tags
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class ClientCreate(BaseModel):
@@ -32,17 +36,27 @@ class ClientUpdate(BaseModel):
 
 
 @router.get("/")
-def list_clients(status: str | None = None):
-    return get_all_clients(status)
+def list_clients(
+    status: str | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
+    rows = get_all_clients(status, limit, cursor, parse_fields(fields))
+    return page_response(rows, CLIENT_KEYSET, limit)
 
 
 @router.get("/{client_id}")
-def read_client(client_id: int):
-    client = get_client(client_id)
-    if not client:
-        raise HTTPException(404, "Client not found")
-    client["documents"] = get_documents_by_client(client_id)
-    client["tags"] = get_entity_tags("client", client_id)
+def read_client(client_id: int, fields: str | None = None):
+    columns, nested = split_fields(parse_fields(fields), {"documents", "tags"})
+    with unit_of_work(readonly=True):
+        client = get_client(client_id, columns)
+        if not client:
+            raise HTTPException(404, "Client not found")
+        if "documents" in nested:
+            client["documents"] = get_documents_by_client(client_id)
+        if "tags" in nested:
+            client["tags"] = get_entity_tags("client", client_id)
     return client
 
 
@@ -1,8 +1,10 @@
 """Nexus contacts router."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute, page_response
+from database.fieldsets import parse_fields
 from services.nexus.contacts import (
     create_contact,
     get_contact,
@@ -10,9 +12,10 @@ from services.nexus.contacts import (
     get_contacts_by_org,
     update_contact,
     delete_contact,
+    CONTACT_KEYSET,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class ContactCreate(BaseModel):
@@ -40,15 +43,22 @@ class ContactUpdate(BaseModel):
 
 
 @router.get("/")
-def list_contacts(org_type: str | None = None, org_id: int | None = None):
+def list_contacts(
+    org_type: str | None = None,
+    org_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
     if org_type and org_id:
         return get_contacts_by_org(org_type, org_id)
-    return get_all_contacts()
+    rows = get_all_contacts(limit, cursor, parse_fields(fields))
+    return page_response(rows, CONTACT_KEYSET, limit)
 
 
 @router.get("/{contact_id}")
-def read_contact(contact_id: int):
-    contact = get_contact(contact_id)
+def read_contact(contact_id: int, fields: str | None = None):
+    contact = get_contact(contact_id, parse_fields(fields))
     if not contact:
         raise HTTPException(404, "Contact not found")
     return contact
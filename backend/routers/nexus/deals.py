@@ -3,18 +3,25 @@
 import json
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from services.ai_provider import check_ai_available, generate_ai_response
+from backend.responses import ORJSONRoute, page_response
+from database.fieldsets import parse_fields
+from services.ai_provider import (
+    check_ai_available,
+    generate_ai_response,
+    set_cache_ttl,
+)
 from services.nexus.deals import (
     create_deal,
     get_deal,
-    get_all_deals,
-    get_deals_by_urgency,
+    get_deal_detail_async,
+    get_all_deals_async,
+    get_deals_by_urgency_async,
     get_deals_needing_push,
-    get_deals_by_client,
-    get_deals_by_partner,
+    get_deals_by_client_async,
+    get_deals_by_partner_async,
     update_deal,
     advance_stage,
     close_deal,
@@ -26,14 +33,12 @@ from services.nexus.deals import (
     get_deal_intel,
     unlink_intel_from_deal,
     MEDDIC_KEYS,
+    DEAL_KEYSET,
 )
-from services.nexus.tbd import get_open_tbds
-from services.nexus.documents import get_files_by_deal
-from services.nexus.tags import get_entity_tags
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class DealCreate(BaseModel):
@@ -70,19 +75,24 @@ class DealIntelLink(BaseModel):
 
 
 @router.get("/")
-def list_deals(
+async def list_deals(
     status: str = "active",
     view: str = "urgency",
     client_id: int | None = None,
     partner_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
 ):
     if client_id:
-        return get_deals_by_client(client_id)
+        return await get_deals_by_client_async(client_id)
     if partner_id:
-        return get_deals_by_partner(partner_id)
+        return await get_deals_by_partner_async(partner_id)
     if view == "urgency":
-        return get_deals_by_urgency()
-    return get_all_deals(status)
+        rows = await get_deals_by_urgency_async(limit, cursor, parse_fields(fields))
+    else:
+        rows = await get_all_deals_async(status, limit, cursor, parse_fields(fields))
+    return page_response(rows, DEAL_KEYSET, limit)
 
 
 @router.get("/needs-push")
@@ -91,16 +101,11 @@ def needs_push(threshold_days: int = 14):
 
 
 @router.get("/{deal_id}")
-def read_deal(deal_id: int):
-    deal = get_deal(deal_id)
+async def read_deal(deal_id: int, fields: str | None = None):
+    # Deal, partners, intel, open TBDs, files, tags, MEDDIC: one statement
+    deal = await get_deal_detail_async(deal_id, parse_fields(fields))
     if not deal:
         raise HTTPException(404, "Deal not found")
-    deal["partners"] = get_deal_partners(deal_id)
-    deal["intel"] = get_deal_intel(deal_id)
-    deal["tbds"] = get_open_tbds("deal", deal_id)
-    deal["files"] = get_files_by_deal(deal_id)
-    deal["tags"] = get_entity_tags("deal", deal_id)
-    deal["meddic_progress"] = get_meddic_progress(deal_id)
     return deal
 
 
@@ -193,6 +198,8 @@ MEDDIC 維度：
 回覆格式：只輸出 JSON，key 為上述六個維度，value 為繁體中文描述。
 如果某維度在情報中找不到線索，該 key 的 value 設為 null。
 不要輸出任何 JSON 以外的內容。"""
+# Re-running ai-fill asks for a fresh analysis, even with AI_CACHE_TTL_SECONDS set
+set_cache_ttl(MEDDIC_AI_PROMPT, 0)
 
 
 @router.post("/{deal_id}/meddic/ai-fill")
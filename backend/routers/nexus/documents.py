@@ -3,10 +3,12 @@
 import os
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
 from fastapi.responses import FileResponse, RedirectResponse
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute, page_response
+from database.fieldsets import parse_fields
 from services.nexus.documents import (
     get_all_documents,
     get_documents_by_client,
@@ -19,12 +21,13 @@ from services.nexus.documents import (
     update_file_parse,
     get_file,
     delete_file,
+    DOCUMENT_KEYSET,
 )
 
 UPLOADS_DIR = Path(__file__).resolve().parent.parent.parent / "uploads"
 UPLOADS_DIR.mkdir(exist_ok=True)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class DocumentUpdate(BaseModel):
@@ -59,10 +62,16 @@ class FileParse(BaseModel):
 
 
 @router.get("/nda-mou")
-def list_documents(client_id: int | None = None):
+def list_documents(
+    client_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
     if client_id:
         return get_documents_by_client(client_id)
-    return get_all_documents()
+    rows = get_all_documents(limit, cursor, parse_fields(fields))
+    return page_response(rows, DOCUMENT_KEYSET, limit)
 
 
 @router.get("/nda-mou/expiring")
@@ -0,0 +1,44 @@
+"""Nexus exports router — streaming NDJSON/CSV dumps of whole tables."""
+
+import datetime
+import itertools
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.responses import ORJSONRoute, iter_csv, iter_ndjson
+from services.nexus.export import EXPORT_QUERIES, iter_export
+
+router = APIRouter(route_class=ORJSONRoute)
+
+_FORMATS = {
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+    "csv": ("text/csv; charset=utf-8", iter_csv),
+}
+
+
+@router.get("/{entity}")
+def export_entity(
+    entity: str,
+    format: str = "ndjson",
+    since: datetime.date | None = None,
+    until: datetime.date | None = None,
+):
+    """Stream ``entity`` (deals | intel | contacts | work_logs) created in
+    [since, until) as NDJSON or CSV, in constant memory."""
+    if entity not in EXPORT_QUERIES:
+        raise HTTPException(status_code=404, detail=f"Unknown export '{entity}'")
+    if format not in _FORMATS:
+        raise HTTPException(status_code=400, detail="format must be ndjson or csv")
+    media_type, encode = _FORMATS[format]
+
+    rows = iter_export(entity, since, until)
+    # Run the query now so DB errors surface as a 500, not a truncated body
+    first = next(rows, None)
+    if first is not None:
+        rows = itertools.chain((first,), rows)
+    return StreamingResponse(
+        encode(rows),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
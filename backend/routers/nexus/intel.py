@@ -3,20 +3,36 @@
 import json
 import logging
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-
-from services.ai_provider import check_ai_available, generate_ai_response
+from starlette.concurrency import run_in_threadpool
+
+from backend.responses import (
+    EventStreamResponse,
+    ORJSONRoute,
+    page_response,
+    sse_event,
+    wants_event_stream,
+)
+from database.connection import unit_of_work
+from database.fieldsets import parse_fields, split_fields
+from services.ai_provider import (
+    check_ai_available,
+    generate_ai_response,
+    set_cache_ttl,
+    stream_ai_response_async,
+)
 from services.nexus.intel import (
     create_intel,
     get_intel,
     get_intel_by_ids,
-    get_all_intel,
+    get_all_intel_async,
     confirm_intel,
     update_intel,
     delete_intel,
     get_intel_entities,
     get_entity_intel,
+    INTEL_KEYSET,
 )
 from services.nexus.clients import find_client_by_name
 from services.nexus.contacts import get_contacts_by_org
@@ -27,10 +43,22 @@ from services.nexus.materialize import materialize_intel, _normalize_company_nam
 from services.nexus.partners import find_partner_by_name
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Reuse prompts from telegram module
-from backend.routers.nexus.telegram import INTEL_PARSE_PROMPT, FOLLOWUP_PROMPT
+from backend.routers.nexus.telegram import (
+    INTEL_PARSE_PROMPT,
+    FOLLOWUP_PROMPT,
+    is_json_reply,
+)
+
+CHAT_SYSTEM_PROMPT = (
+    "You are a B2B sales assistant chatbot. Reply in Traditional Chinese."
+)
+# A chat turn is never replayed, even with AI_CACHE_TTL_SECONDS set
+set_cache_ttl(CHAT_SYSTEM_PROMPT, 0)
+# Separates the chat reply from the JSON of new fields in FOLLOWUP_PROMPT answers
+REPLY_SEPARATOR = "---"
 
 
 class IntelCreate(BaseModel):
@@ -122,8 +150,14 @@ def _enrich_from_db(parsed: dict) -> tuple[dict, str]:
 
 
 @router.get("/")
-def list_intel(status: str | None = None, limit: int = 50):
-    return get_all_intel(status, limit)
+async def list_intel(
+    status: str | None = None,
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
+):
+    rows = await get_all_intel_async(status, limit, cursor, parse_fields(fields))
+    return page_response(rows, INTEL_KEYSET, limit)
 
 
 @router.get("/by-entity/{entity_type}/{entity_id}")
@@ -154,8 +188,12 @@ INTEL_SUMMARIZE_PROMPT = """你是 B2B 業務情報分析師。根據以下多
 
 
 @router.post("/summarize")
-def summarize_intel(body: IntelSummarize):
-    """AI-generated summary from multiple intel records."""
+def summarize_intel(body: IntelSummarize, request: Request):
+    """AI-generated summary from multiple intel records.
+
+    With ``Accept: text/event-stream`` the summary streams as ``delta``
+    events, followed by a ``done`` event carrying the usual response body.
+    """
     if not body.intel_ids:
         raise HTTPException(422, "No intel IDs provided")
 
@@ -187,8 +225,14 @@ def summarize_intel(body: IntelSummarize):
     if len(user_prompt) > 8000:
         user_prompt = user_prompt[:8000] + "\n\n（內容已截斷）"
 
+    if wants_event_stream(request):
+        return EventStreamResponse(_stream_summary(intels, user_prompt))
+
     summary = generate_ai_response(INTEL_SUMMARIZE_PROMPT, user_prompt)
+    return _summary_result(intels, summary)
+
 
+def _summary_result(intels: list, summary: str) -> dict:
     return {
         "summary": summary.strip(),
         "intel_count": len(intels),
@@ -196,13 +240,32 @@ def summarize_intel(body: IntelSummarize):
     }
 
 
+async def _stream_summary(intels: list, user_prompt: str):
+    chunks = []
+    try:
+        async for chunk in stream_ai_response_async(
+            INTEL_SUMMARIZE_PROMPT, user_prompt
+        ):
+            chunks.append(chunk)
+            yield sse_event("delta", {"text": chunk})
+    except Exception:
+        logger.exception("Streamed intel summary failed")
+        yield sse_event("error", {"detail": "AI summary failed"})
+        return
+    yield sse_event("done", _summary_result(intels, "".join(chunks)))
+
+
 @router.get("/{intel_id}")
-def read_intel(intel_id: int):
-    intel = get_intel(intel_id)
-    if not intel:
-        raise HTTPException(404, "Intel not found")
-    intel["files"] = get_files_by_intel(intel_id)
-    intel["linked_deals"] = get_intel_linked_deals(intel_id)
+def read_intel(intel_id: int, fields: str | None = None):
+    columns, nested = split_fields(parse_fields(fields), {"files", "linked_deals"})
+    with unit_of_work(readonly=True):
+        intel = get_intel(intel_id, columns)
+        if not intel:
+            raise HTTPException(404, "Intel not found")
+        if "files" in nested:
+            intel["files"] = get_files_by_intel(intel_id)
+        if "linked_deals" in nested:
+            intel["linked_deals"] = get_intel_linked_deals(intel_id)
     return intel
 
 
@@ -257,7 +320,7 @@ def initial_parse(intel_id: int):
         raise HTTPException(503, "AI service not available")
 
     raw = intel["raw_input"]
-    ai_raw = generate_ai_response(INTEL_PARSE_PROMPT, raw)
+    ai_raw = generate_ai_response(INTEL_PARSE_PROMPT, raw, validate=is_json_reply)
 
     parsed = {}
     try:
@@ -284,14 +347,11 @@ def initial_parse(intel_id: int):
         current_json=json.dumps(parsed, ensure_ascii=False, indent=2),
         user_msg=f"（使用者剛輸入了情報原文，請根據已解析的內容做簡短摘要，並問第一個追問）{extra_context}",
     )
-    greeting_raw = generate_ai_response(
-        "You are a B2B sales assistant chatbot. Reply in Traditional Chinese.",
-        greeting_prompt,
-    )
+    greeting_raw = generate_ai_response(CHAT_SYSTEM_PROMPT, greeting_prompt)
     # Split on --- to get reply part
     ai_reply = (
-        greeting_raw.split("---")[0].strip()
-        if "---" in greeting_raw
+        greeting_raw.split(REPLY_SEPARATOR)[0].strip()
+        if REPLY_SEPARATOR in greeting_raw
         else greeting_raw.strip()
     )
 
@@ -311,8 +371,13 @@ def initial_parse(intel_id: int):
 
 
 @router.post("/{intel_id}/chat")
-def chat_followup(intel_id: int, body: ChatMessage):
-    """Conversational followup — AI asks questions, user replies, returns updated fields."""
+def chat_followup(intel_id: int, body: ChatMessage, request: Request):
+    """Conversational followup — AI asks questions, user replies, returns updated fields.
+
+    With ``Accept: text/event-stream`` the reply streams as ``delta``
+    events; the new-fields JSON after the separator is parsed once the
+    answer is complete and a ``done`` event carries the usual response body.
+    """
     intel = get_intel(intel_id)
     if not intel:
         raise HTTPException(404, "Intel not found")
@@ -329,16 +394,82 @@ def chat_followup(intel_id: int, body: ChatMessage):
         current_json=json.dumps(enriched_before, ensure_ascii=False, indent=2),
         user_msg=body.message,
     )
-    ai_raw = generate_ai_response(
-        "You are a B2B sales assistant chatbot. Reply in Traditional Chinese.",
-        prompt,
-    )
+    if wants_event_stream(request):
+        return EventStreamResponse(
+            _stream_chat(intel, enriched_before, body.message, prompt)
+        )
+
+    ai_raw = generate_ai_response(CHAT_SYSTEM_PROMPT, prompt)
+    return _save_chat_turn(intel, enriched_before, body.message, ai_raw)
+
+
+class _ReplyStream:
+    """Passes on the reply part of a streamed FOLLOWUP_PROMPT answer,
+    withholding everything from REPLY_SEPARATOR on."""
+
+    def __init__(self):
+        self.text = ""
+        self._sent = 0
+        self._closed = False
+
+    def feed(self, chunk: str) -> str:
+        """Add ``chunk``; return the new reply text that can go out."""
+        self.text += chunk
+        if self._closed:
+            return ""
+        end = self.text.find(REPLY_SEPARATOR, self._sent)
+        if end >= 0:
+            self._closed = True
+        else:
+            # Hold back a tail that may be the start of the separator
+            end = len(self.text)
+            for n in range(len(REPLY_SEPARATOR) - 1, 0, -1):
+                if self.text.endswith(REPLY_SEPARATOR[:n]):
+                    end -= n
+                    break
+        delta = self.text[self._sent : end]
+        self._sent = end
+        return delta
+
+    def flush(self) -> str:
+        """Reply text still held back once the answer is complete."""
+        if self._closed:
+            return ""
+        self._closed = True
+        delta = self.text[self._sent :]
+        self._sent = len(self.text)
+        return delta
+
+
+async def _stream_chat(intel: dict, current: dict, message: str, prompt: str):
+    reply = _ReplyStream()
+    try:
+        async for chunk in stream_ai_response_async(CHAT_SYSTEM_PROMPT, prompt):
+            delta = reply.feed(chunk)
+            if delta:
+                yield sse_event("delta", {"text": delta})
+        delta = reply.flush()
+        if delta:
+            yield sse_event("delta", {"text": delta})
+        result = await run_in_threadpool(
+            _save_chat_turn, intel, current, message, reply.text
+        )
+    except Exception:
+        logger.exception("Streamed chat failed for intel #%d", intel["id"])
+        yield sse_event("error", {"detail": "AI reply failed"})
+        return
+    yield sse_event("done", result)
+
 
+def _save_chat_turn(intel: dict, current: dict, message: str, ai_raw: str) -> dict:
+    """Split the AI answer, merge its new fields and append the turn to
+    the intel's chat history."""
+    intel_id = intel["id"]
     ai_reply = ai_raw.strip()
     new_fields = {}
 
-    if "---" in ai_raw:
-        parts = ai_raw.split("---", 1)
+    if REPLY_SEPARATOR in ai_raw:
+        parts = ai_raw.split(REPLY_SEPARATOR, 1)
         ai_reply = parts[0].strip()
         json_part = parts[1].strip()
         try:
@@ -351,7 +482,7 @@ def chat_followup(intel_id: int, body: ChatMessage):
             )
 
     # Merge new fields into current
-    merged = {**enriched_before}
+    merged = {**current}
     for k, v in new_fields.items():
         if v is not None:
             merged[k] = v
@@ -377,7 +508,7 @@ def chat_followup(intel_id: int, body: ChatMessage):
         system_note = db_context.replace("[系統] ", "✅ ")
         ai_reply = f"{system_note}\n\n{ai_reply}"
 
-    existing_history.append({"role": "user", "text": body.message})
+    existing_history.append({"role": "user", "text": message})
     existing_history.append({"role": "ai", "text": ai_reply})
 
     update_intel(
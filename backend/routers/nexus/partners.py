@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute
 from services.nexus.partners import (
     create_partner,
     get_partner,
@@ -13,7 +14,7 @@ from services.nexus.partners import (
 )
 from services.nexus.tags import get_entity_tags
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class PartnerCreate(BaseModel):
@@ -3,6 +3,8 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute
+from database.connection import unit_of_work
 from services.nexus.subsidies import (
     create_subsidy,
     get_subsidy,
@@ -22,7 +24,7 @@ from services.nexus.subsidies import (
 )
 from services.nexus.intel import get_entity_intel
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class SubsidyCreate(BaseModel):
@@ -98,12 +100,13 @@ def expiring(within_days: int = 30):
 
 @router.get("/{subsidy_id}")
 def read_subsidy(subsidy_id: int):
-    sub = get_subsidy(subsidy_id)
-    if not sub:
-        raise HTTPException(404, "Subsidy not found")
-    sub["deals"] = get_subsidy_deals(subsidy_id)
-    sub["intel"] = get_entity_intel("subsidy", subsidy_id)
-    sub["deadlines"] = get_deadlines(subsidy_id)
+    with unit_of_work(readonly=True):
+        sub = get_subsidy(subsidy_id)
+        if not sub:
+            raise HTTPException(404, "Subsidy not found")
+        sub["deals"] = get_subsidy_deals(subsidy_id)
+        sub["intel"] = get_entity_intel("subsidy", subsidy_id)
+        sub["deadlines"] = get_deadlines(subsidy_id)
     return sub
 
 
@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute
 from services.nexus.tags import (
     create_tag,
     get_all_tags,
@@ -12,7 +13,7 @@ from services.nexus.tags import (
     search_by_tag_name,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class TagCreate(BaseModel):
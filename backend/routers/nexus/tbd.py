@@ -1,8 +1,10 @@
 """Nexus TBD router."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from backend.responses import ORJSONRoute, page_response
+from database.fieldsets import parse_fields
 from services.nexus.tbd import (
     create_tbd,
     get_tbd,
@@ -11,9 +13,10 @@ from services.nexus.tbd import (
     resolve_tbd,
     get_stale_tbds,
     delete_tbd,
+    TBD_KEYSET,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 class TbdCreate(BaseModel):
@@ -29,10 +32,14 @@ def list_tbds(
     linked_type: str | None = None,
     linked_id: int | None = None,
     include_resolved: bool = False,
+    limit: int | None = Query(None, ge=1, le=1000),
+    cursor: str | None = None,
+    fields: str | None = None,
 ):
     if linked_type and linked_id:
         return get_open_tbds(linked_type, linked_id)
-    return get_all_tbds(include_resolved)
+    rows = get_all_tbds(include_resolved, limit, cursor, parse_fields(fields))
+    return page_response(rows, TBD_KEYSET, limit)
 
 
 @router.get("/stale")
@@ -41,8 +48,8 @@ def stale_tbds(older_than_days: int = 7):
 
 
 @router.get("/{tbd_id}")
-def read_tbd(tbd_id: int):
-    tbd = get_tbd(tbd_id)
+def read_tbd(tbd_id: int, fields: str | None = None):
+    tbd = get_tbd(tbd_id, parse_fields(fields))
     if not tbd:
         raise HTTPException(404, "TBD not found")
     return tbd
@@ -6,20 +6,25 @@ import logging
 import os
 from pathlib import Path
 
-import httpx
 from fastapi import APIRouter, Header, HTTPException, Query, Request
 
+from backend.responses import ORJSONRoute
 from services.ai_provider import (
     check_ai_available,
-    generate_ai_response,
-    generate_ai_vision_response,
+    generate_ai_response_async,
+    generate_ai_vision_response_async,
+    set_cache_ttl,
 )
 from services.nexus.documents import create_file
-from services.nexus.intel import confirm_intel, create_intel, update_intel
-from services.nexus.deals import get_deals_by_client, link_intel_to_deal
+from services.nexus.intel import (
+    confirm_intel_async,
+    create_intel_async,
+    update_intel_async,
+)
+from services.nexus.deals import get_deals_by_client_async, link_intel_to_deal_async
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 UPLOADS_DIR = Path(__file__).resolve().parent.parent.parent.parent / "uploads"
 
@@ -149,6 +154,11 @@ Example 5: "永豐紙業想做 IOT，目前合作夥伴是中華電信，對方
 → {"role":"client","company_name":"永豐紙業","industry":"manufacturing","pain_points":["iot"],"partner_name":"中華電信","partner_contact_name":"吳欣曄"}
 """
 
+# Parsing is a pure function of the raw text: re-parses and retried updates
+# reuse the cached result for a month. Callers pass validate=is_json_reply,
+# so a malformed reply is never replayed.
+set_cache_ttl(INTEL_PARSE_PROMPT, 30 * 86400)
+
 FOLLOWUP_PROMPT = """\
 You are a sharp B2B sales assistant chatbot speaking Traditional Chinese.
 You are helping the user capture intel from a sales interaction through natural conversation.
@@ -284,6 +294,8 @@ def _webhook_secret() -> str:
 
 async def _tg_api(method: str, **kwargs) -> dict:
     """Call Telegram Bot API."""
+    import httpx  # lazy: keeps it off the API's import path
+
     url = f"https://api.telegram.org/bot{_bot_token()}/{method}"
     async with httpx.AsyncClient(timeout=30) as client:
         resp = await client.post(url, json=kwargs)
@@ -295,6 +307,8 @@ async def _tg_get_file(file_id: str) -> tuple[str, bytes]:
     """Download a file from Telegram. Returns (file_path, content)."""
     info = await _tg_api("getFile", file_id=file_id)
     file_path = info["result"]["file_path"]
+    import httpx
+
     url = f"https://api.telegram.org/file/bot{_bot_token()}/{file_path}"
     async with httpx.AsyncClient(timeout=60) as client:
         resp = await client.get(url)
@@ -320,6 +334,15 @@ def _strip_json_fences(text: str) -> str:
     return text.strip()
 
 
+def is_json_reply(text: str) -> bool:
+    """Cache check for parse prompts: a reply that isn't JSON is retried."""
+    try:
+        json.loads(_strip_json_fences(text))
+    except ValueError:
+        return False
+    return True
+
+
 BUSINESS_CARD_PROMPT = """\
 You are an OCR and business card parser for a B2B sales assistant.
 Analyze the image of a business card and extract all visible information.
@@ -358,8 +381,8 @@ async def _auto_parse(raw_input: str) -> dict | None:
         logger.warning("AI not available for auto-parse: %s", info)
         return None
     try:
-        response = await asyncio.to_thread(
-            generate_ai_response, INTEL_PARSE_PROMPT, raw_input
+        response = await generate_ai_response_async(
+            INTEL_PARSE_PROMPT, raw_input, validate=is_json_reply
         )
         return json.loads(_strip_json_fences(response))
     except Exception as e:
@@ -378,8 +401,7 @@ async def _parse_business_card(image_bytes: bytes, caption: str = "") -> list[di
             caption
             or "請辨識這張圖片中所有名片的資訊，每張名片各自回傳一個 JSON object"
         )
-        response = await asyncio.to_thread(
-            generate_ai_vision_response,
+        response = await generate_ai_vision_response_async(
             BUSINESS_CARD_PROMPT
             + "\n\nIMPORTANT: If the image contains MULTIPLE business cards, return a JSON ARRAY of objects, one per card. If only one card, still return a single JSON object (not an array).",
             user_text,
@@ -408,8 +430,7 @@ async def _followup_parse(current_parsed: dict, user_msg: str) -> tuple[str, dic
         user_msg=user_msg,
     )
     try:
-        response = await asyncio.to_thread(
-            generate_ai_response,
+        response = await generate_ai_response_async(
             "You are a helpful B2B sales assistant.",
             prompt,
         )
@@ -619,7 +640,7 @@ async def _auto_create_deal(
     intel_id: int, client_id: int, client_name: str, parsed: dict
 ) -> dict | None:
     """Auto-create a deal from parsed intel. Returns deal dict or None."""
-    from services.nexus.deals import create_deal
+    from services.nexus.deals import create_deal_async
 
     pains = parsed.get("pain_points", [])
     pain_labels = [_PAIN_LABELS.get(p, p) for p in pains[:2]] if pains else []
@@ -644,14 +665,13 @@ async def _auto_create_deal(
             pass
 
     try:
-        deal = await asyncio.to_thread(
-            create_deal,
+        deal = await create_deal_async(
             name=deal_name,
             client_id=client_id,
             budget_range=budget_range,
             budget_amount=budget_amount,
         )
-        await asyncio.to_thread(link_intel_to_deal, deal["id"], intel_id)
+        await link_intel_to_deal_async(deal["id"], intel_id)
         return {"id": deal["id"], "name": deal_name}
     except Exception as e:
         logger.error("Auto-create deal failed: %s", e)
@@ -677,7 +697,7 @@ async def _handle_done(chat_id: int) -> None:
 
     parsed_json = json.dumps(parsed, ensure_ascii=False) if parsed else None
 
-    await asyncio.to_thread(confirm_intel, intel_id, parsed_json)
+    await confirm_intel_async(intel_id, parsed_json)
 
     # Auto-materialize entities
     mat_result = await asyncio.to_thread(materialize_intel, intel_id)
@@ -712,11 +732,11 @@ async def _handle_done(chat_id: int) -> None:
     # Find and auto-link existing deals for matched client or partner
     existing_deals = []
     if client_info:
-        existing_deals = await asyncio.to_thread(get_deals_by_client, client_info["id"])
+        existing_deals = await get_deals_by_client_async(client_info["id"])
     if existing_deals:
         for d in existing_deals:
             try:
-                await asyncio.to_thread(link_intel_to_deal, d["id"], intel_id)
+                await link_intel_to_deal_async(d["id"], intel_id)
             except Exception:
                 pass  # may already be linked
         deal_names = "、".join(f"「{d['name']}」" for d in existing_deals[:3])
@@ -874,7 +894,7 @@ async def _handle_new_intel(chat_id: int, text: str, message: dict) -> None:
     input_type = "photo" if has_photo else "text"
     raw = text or ("(名片/照片)" if has_photo else "(file)")
 
-    intel = await asyncio.to_thread(create_intel, raw_input=raw, input_type=input_type)
+    intel = await create_intel_async(raw_input=raw, input_type=input_type)
     intel_id = intel["id"]
 
     # Handle attachments + vision parse for photos
@@ -906,7 +926,7 @@ async def _handle_new_intel(chat_id: int, text: str, message: dict) -> None:
             raw = "📇 名片辨識（共 {} 張）\n\n{}".format(
                 len(cards), "\n\n".join(raw_parts)
             )
-            await asyncio.to_thread(update_intel, intel_id, raw_input=raw)
+            await update_intel_async(intel_id, raw_input=raw)
 
             # First card goes to current intel
             parsed = cards[0]
@@ -915,11 +935,10 @@ async def _handle_new_intel(chat_id: int, text: str, message: dict) -> None:
             extra_lines = []
             for card in cards[1:]:
                 card_raw = "📇 名片辨識\n" + _format_card_raw(card)
-                extra_intel = await asyncio.to_thread(
-                    create_intel, raw_input=card_raw, input_type="photo"
+                extra_intel = await create_intel_async(
+                    raw_input=card_raw, input_type="photo"
                 )
-                await asyncio.to_thread(
-                    update_intel,
+                await update_intel_async(
                     extra_intel["id"],
                     parsed_json=json.dumps(card, ensure_ascii=False),
                 )
@@ -940,7 +959,7 @@ async def _handle_new_intel(chat_id: int, text: str, message: dict) -> None:
         elif len(cards) == 1:
             parsed = cards[0]
             raw = "📇 名片辨識\n" + _format_card_raw(parsed)
-            await asyncio.to_thread(update_intel, intel_id, raw_input=raw)
+            await update_intel_async(intel_id, raw_input=raw)
             logger.info(
                 "Card parse result for intel #%d: %s",
                 intel_id,
@@ -952,8 +971,7 @@ async def _handle_new_intel(chat_id: int, text: str, message: dict) -> None:
 
     # Save to DB (as draft with partial parsed_json)
     if parsed:
-        await asyncio.to_thread(
-            update_intel,
+        await update_intel_async(
             intel_id,
             parsed_json=json.dumps(parsed, ensure_ascii=False),
         )
@@ -1017,8 +1035,7 @@ async def _handle_followup(chat_id: int, text: str) -> None:
         if matched_role:
             conv["parsed"]["role"] = matched_role
             conv["pending_role_confirm"] = False
-            await asyncio.to_thread(
-                update_intel,
+            await update_intel_async(
                 intel_id,
                 parsed_json=json.dumps(conv["parsed"], ensure_ascii=False),
             )
@@ -1044,8 +1061,7 @@ async def _handle_followup(chat_id: int, text: str) -> None:
         if low in ("是", "yes", "ok", "確認", "對"):
             # Confirmed — keep the industry as-is
             conv["pending_industry_confirm"] = False
-            await asyncio.to_thread(
-                update_intel,
+            await update_intel_async(
                 intel_id,
                 parsed_json=json.dumps(conv["parsed"], ensure_ascii=False),
             )
@@ -1069,8 +1085,7 @@ async def _handle_followup(chat_id: int, text: str) -> None:
             _custom_industries[new_key] = text.strip()
             conv["parsed"]["industry"] = new_key
             conv["pending_industry_confirm"] = False
-            await asyncio.to_thread(
-                update_intel,
+            await update_intel_async(
                 intel_id,
                 parsed_json=json.dumps(conv["parsed"], ensure_ascii=False),
             )
@@ -1086,7 +1101,7 @@ async def _handle_followup(chat_id: int, text: str) -> None:
 
     # Append to raw_input in DB
     full_raw = "\n---\n".join(conv["raw_history"])
-    await asyncio.to_thread(update_intel, intel_id, raw_input=full_raw)
+    await update_intel_async(intel_id, raw_input=full_raw)
 
     # AI follow-up parse
     reply_text, new_fields = await _followup_parse(conv["parsed"], text)
@@ -1104,8 +1119,7 @@ async def _handle_followup(chat_id: int, text: str) -> None:
 
     if new_fields or card_base:
         # Update DB
-        await asyncio.to_thread(
-            update_intel,
+        await update_intel_async(
             intel_id,
             parsed_json=json.dumps(conv["parsed"], ensure_ascii=False),
         )
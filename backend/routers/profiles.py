@@ -0,0 +1,42 @@
+"""Profiles API router — request profiles written by backend.profiling.
+
+Guarded like the debug router. Files are folded stacks; feed them to
+flamegraph.pl, speedscope or inferno.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from backend.profiling import PROFILE_DIR
+from backend.responses import ORJSONRoute
+from backend.routers.debug import require_admin
+
+router = APIRouter(route_class=ORJSONRoute, dependencies=[Depends(require_admin)])
+
+
+@router.get("")
+def list_profiles(limit: int = 50):
+    """Newest first."""
+    if not PROFILE_DIR.is_dir():
+        return []
+    files = sorted(
+        PROFILE_DIR.glob("*.folded"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    return [
+        {"name": p.name, "bytes": p.stat().st_size, "samples": _samples(p)}
+        for p in files[:limit]
+    ]
+
+
+@router.get("/{name}")
+def read_profile(name: str):
+    path = PROFILE_DIR / name
+    # Names only, never paths out of PROFILE_DIR
+    if "/" in name or not name.endswith(".folded") or not path.is_file():
+        raise HTTPException(404, "Profile not found")
+    return FileResponse(path, media_type="text/plain; charset=utf-8")
+
+
+def _samples(path) -> int:
+    with path.open() as f:
+        return sum(int(line.rsplit(" ", 1)[1]) for line in f if line.strip())
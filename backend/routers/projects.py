@@ -2,9 +2,10 @@
 
 from fastapi import APIRouter, HTTPException
 
+from backend.responses import ORJSONRoute
 from services import project as project_svc
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.get("/")
@@ -2,52 +2,674 @@
 
 Reads DATABASE_URL from environment. Uses a connection pool to avoid
 the ~800ms overhead of establishing a new TLS connection per request.
+
+The pool blocks (FIFO) when all connections are checked out instead of
+raising, so a burst of requests turns into queueing latency rather than
+500s. Sizing and timeouts come from env:
+
+    DB_POOL_MIN            connections opened eagerly (default 2)
+    DB_POOL_MAX            hard cap on open connections (default 10)
+    DB_POOL_TIMEOUT        seconds to wait for a free connection (default 30)
+    DB_POOL_CHECK_IDLE     idle seconds after which a connection is pinged
+                           with SELECT 1 before reuse (default 30)
+    DB_STREAM_ITERSIZE     rows per round trip for stream_records() (default 2000)
+
+An asyncio twin (``get_async_connection``) runs on psycopg 3's
+AsyncConnectionPool with the same sizing, for routers that want to stay
+on the event loop. psycopg 3 uses the same ``%s`` placeholders, so SQL
+text is shared between the sync and async service variants.
+
+``unit_of_work()`` pins one connection/transaction to the current context;
+every ``get_connection()`` inside the block joins it instead of checking
+out its own, so composite endpoints commit once on a single snapshot.
+``unit_of_work_async()`` opens one from async code off the event loop.
+
+Cursors from both pools are timed per statement (see query_stats.py).
+
+Read replica: ``get_connection(readonly=True)`` (and the async twin) go to
+a separate pool on DATABASE_REPLICA_URL when it is set, otherwise to the
+primary. Reads stay on the primary when
+
+    - the current request already wrote (see ``track_writes()``), or the
+      client wrote within DB_REPLICA_STICKY_SECONDS (default 5) — the
+      backend pins it with a cookie, so users read their own writes;
+    - the replica is more than DB_REPLICA_MAX_LAG seconds behind
+      (default 10, checked at most every 5s; 0 disables the check).
 """
 
 import logging
 import os
+import threading
+import time
+from collections import deque
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+import asyncio
+import contextvars
+import functools
+import io
+import itertools
+import json
+
 import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
 import psycopg2.pool
-from contextlib import contextmanager
+import psycopg2.sql
+from contextlib import asynccontextmanager, contextmanager
+
+from database import table_versions
+from database.query_stats import InstrumentedCursor, async_cursor_class
 
 logger = logging.getLogger(__name__)
 
 _DATABASE_URL = os.getenv("DATABASE_URL", "")
 
-# Connection pool: min 2, max 10 connections kept alive
-_pool: psycopg2.pool.ThreadedConnectionPool | None = None
+_POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))
+_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+_POOL_CHECK_IDLE = float(os.getenv("DB_POOL_CHECK_IDLE", "30"))
+_STREAM_ITERSIZE = int(os.getenv("DB_STREAM_ITERSIZE", "2000"))
 
+_DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL", "")
+REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", "5"))
+REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "10"))
+_REPLICA_LAG_CHECK_EVERY = 5.0
+
+PRIMARY = "primary"
+REPLICA = "replica"
+
+
+class PoolTimeout(psycopg2.pool.PoolError):
+    """Raised when no connection frees up within the pool timeout."""
+
+
+class _Waiter:
+    """A caller queued for a connection; filled in by the releasing thread."""
+
+    __slots__ = ("event", "conn", "may_open")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.conn = None
+        self.may_open = False
+
+
+class BlockingConnectionPool:
+    """Thread-safe psycopg2 pool that waits for a free connection.
+
+    - Waiters are served strictly FIFO: a returned connection is handed
+      directly to the oldest waiter, so late arrivals cannot starve it.
+    - Idle connections older than ``check_idle`` seconds are pinged before
+      reuse; dead ones (e.g. TLS dropped by Supabase's pooler) are replaced.
+    - Connections returned closed or in a broken state are discarded.
+    """
+
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        dsn: str,
+        timeout: float = 30.0,
+        check_idle: float = 30.0,
+        cursor_factory=InstrumentedCursor,
+    ):
+        if maxconn < 1 or minconn > maxconn:
+            raise ValueError(f"Invalid pool size {minconn}-{maxconn}")
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.check_idle = check_idle
+        self._dsn = dsn
+        self._cursor_factory = cursor_factory
+        self._lock = threading.Lock()
+        self._idle: deque[tuple[psycopg2.extensions.connection, float]] = deque()
+        self._waiters: deque[_Waiter] = deque()
+        self._size = 0  # open connections, idle + checked out + being opened
+        self.closed = False
+        # Cumulative checkout counters, for metrics
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._timeouts = 0
+
+        for _ in range(minconn):
+            self._size += 1
+            try:
+                self._idle.append((self._connect(), time.monotonic()))
+            except Exception:
+                self._size -= 1
+                self.closeall()
+                raise
+
+    # -- public API ---------------------------------------------------------
+
+    def getconn(self, timeout: float | None = None):
+        """Check out a connection, waiting up to ``timeout`` seconds."""
+        timeout = self.timeout if timeout is None else timeout
+        while True:
+            conn, idle_since, may_open = self._acquire(timeout)
+            if may_open:
+                try:
+                    return self._connect()
+                except Exception:
+                    self._release_slot()
+                    raise
+            if self._is_healthy(conn, idle_since):
+                return conn
+            logger.warning("Discarding dead pooled connection")
+            self._discard(conn)
+            self._release_slot()
+
+    def putconn(self, conn, close: bool = False) -> None:
+        """Return a connection to the pool (or discard it if broken)."""
+        if close or self.closed or not self._reset(conn):
+            self._discard(conn)
+            self._release_slot()
+            return
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.conn = conn
+                waiter.event.set()
+                return
+            self._idle.append((conn, time.monotonic()))
+
+    def closeall(self) -> None:
+        with self._lock:
+            self.closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict:
+        """Snapshot of pool occupancy."""
+        with self._lock:
+            return {
+                "size": self._size,
+                "max": self.maxconn,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "waiting": len(self._waiters),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_seconds, 6),
+                "timeouts": self._timeouts,
+            }
+
+    # -- internals ----------------------------------------------------------
+
+    def _connect(self):
+        return psycopg2.connect(self._dsn, cursor_factory=self._cursor_factory)
+
+    def _acquire(self, timeout: float):
+        """Return (conn, idle_since, False) for a pooled connection, or
+        (None, None, True) for a reserved slot the caller must fill by
+        opening a new connection."""
+        with self._lock:
+            if self.closed:
+                raise psycopg2.pool.PoolError("connection pool is closed")
+            self._checkouts += 1
+            if self._idle and not self._waiters:
+                conn, idle_since = self._idle.pop()
+                return conn, idle_since, False
+            if self._size < self.maxconn and not self._waiters:
+                self._size += 1
+                return None, None, True
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+            self._waits += 1
+
+        start = time.monotonic()
+        got = waiter.event.wait(timeout)
+        with self._lock:
+            self._wait_seconds += time.monotonic() - start
+        if not got:
+            with self._lock:
+                # A releaser may have handed us something just as we timed out
+                if not waiter.event.is_set():
+                    self._waiters.remove(waiter)
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"No database connection available within {timeout:g}s "
+                        f"(pool max {self.maxconn})"
+                    )
+        # Handed over straight from a releasing thread, so it was just in use
+        return waiter.conn, time.monotonic(), waiter.may_open
+
+    def _release_slot(self) -> None:
+        """Free one connection slot, letting the oldest waiter open a new one."""
+        with self._lock:
+            if self._waiters and not self.closed:
+                waiter = self._waiters.popleft()
+                waiter.may_open = True
+                waiter.event.set()
+                return
+            self._size -= 1
+
+    def _is_healthy(self, conn, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.check_idle:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    def _reset(self, conn) -> bool:
+        """Leave ``conn`` idle and usable. Returns False if it is broken."""
+        if conn.closed:
+            return False
+        status = conn.info.transaction_status
+        if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                return False
+        return True
+
+    @staticmethod
+    def _discard(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Primary / replica routing
+# ---------------------------------------------------------------------------
+
+# Statement tags (cursor.statusmessage) that mean the transaction wrote
+_WRITE_TAGS = (
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "MERGE",
+    "COPY",
+    "CREATE",
+    "ALTER",
+    "DROP",
+    "TRUNCATE",
+)
+
+# Per-request routing state installed by track_writes(). A mutable dict so
+# threadpool copies of the request context all see the same object.
+_route_state: contextvars.ContextVar = contextvars.ContextVar(
+    "db_route_state", default=None
+)
+
+
+def replica_configured() -> bool:
+    return bool(_DATABASE_REPLICA_URL)
+
+
+@contextmanager
+def track_writes(pinned: bool = False):
+    """Scope read-your-writes routing to one request.
+
+    Inside the block, readonly connections use the primary once anything
+    has written through a primary connection, or from the start when
+    ``pinned`` (the client wrote recently). Yields the state dict; after the
+    block ``state["wrote"]`` tells the caller to pin the client.
+    """
+    state = {"pinned": pinned, "wrote": False}
+    token = _route_state.set(state)
+    try:
+        yield state
+    finally:
+        _route_state.reset(token)
+
+
+def _note_status(status: str | None, query) -> None:
+    if status and status.startswith(_WRITE_TAGS):
+        state = _route_state.get()
+        if state is not None:
+            state["wrote"] = True
+        table_versions.note_write(query)
+
+
+class _PrimaryCursor(InstrumentedCursor):
+    """Flags the request as having written, so later reads skip the replica,
+    and reports the written tables to database.table_versions."""
+
+    def execute(self, query, vars=None):
+        try:
+            return super().execute(query, vars)
+        finally:
+            _note_status(self.statusmessage, self.query)
+
+    def executemany(self, query, vars_list):
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            _note_status(self.statusmessage, self.query)
+
+    def copy_expert(self, sql, file, size=8192):
+        try:
+            return super().copy_expert(sql, file, size)
+        finally:
+            _note_status(self.statusmessage, sql)
+
+
+def _read_target(readonly: bool) -> str:
+    if not readonly or not _DATABASE_REPLICA_URL:
+        return PRIMARY
+    state = _route_state.get()
+    if state is not None and (state["pinned"] or state["wrote"]):
+        return PRIMARY
+    return REPLICA
+
+
+# Seconds the replica is behind on replay; 0 when caught up or not a standby
+_REPLICA_LAG_SQL = """SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END"""
+
+_replica_lag = {"checked_at": float("-inf"), "fresh": True}
+
+
+def _replica_lag_due() -> bool:
+    return (
+        REPLICA_MAX_LAG > 0
+        and time.monotonic() - _replica_lag["checked_at"] >= _REPLICA_LAG_CHECK_EVERY
+    )
+
+
+def _record_replica_lag(lag) -> bool:
+    fresh = float(lag or 0) <= REPLICA_MAX_LAG
+    if not fresh and _replica_lag["fresh"]:
+        logger.warning("Replica %.1fs behind; routing reads to primary", float(lag))
+    _replica_lag.update(checked_at=time.monotonic(), fresh=fresh)
+    return fresh
+
+
+def _replica_fresh(conn) -> bool:
+    """Lag guard for a replica connection (a query at most every 5s).
+
+    The probe's transaction is rolled back so the caller starts a fresh
+    one (unit_of_work() must SET TRANSACTION before any query).
+    """
+    if not _replica_lag_due():
+        return _replica_lag["fresh"]
+    with conn.cursor() as cur:
+        cur.execute(_REPLICA_LAG_SQL)
+        lag = cur.fetchone()[0]
+    conn.rollback()
+    return _record_replica_lag(lag)
 
-def _get_pool() -> psycopg2.pool.ThreadedConnectionPool:
-    global _pool
-    if _pool is None or _pool.closed:
-        _pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=2, maxconn=10, dsn=_DATABASE_URL
-        )
-        logger.info("Connection pool created (2-10 connections)")
-    return _pool
+
+_pools: dict[str, BlockingConnectionPool] = {}
+_pool_lock = threading.Lock()
+
+
+def _get_pool(target: str = PRIMARY) -> BlockingConnectionPool:
+    pool = _pools.get(target)
+    if pool is None or pool.closed:
+        with _pool_lock:
+            pool = _pools.get(target)
+            if pool is None or pool.closed:
+                replica = target == REPLICA
+                pool = _pools[target] = BlockingConnectionPool(
+                    minconn=_POOL_MIN,
+                    maxconn=_POOL_MAX,
+                    dsn=_DATABASE_REPLICA_URL if replica else _DATABASE_URL,
+                    timeout=_POOL_TIMEOUT,
+                    check_idle=_POOL_CHECK_IDLE,
+                    cursor_factory=InstrumentedCursor if replica else _PrimaryCursor,
+                )
+                logger.info(
+                    "Connection pool created (%s, %d-%d connections, %.0fs wait)",
+                    target,
+                    _POOL_MIN,
+                    _POOL_MAX,
+                    _POOL_TIMEOUT,
+                )
+    return pool
+
+
+def pool_stats() -> dict[str, dict]:
+    """stats() of every open pool, keyed by target."""
+    return {target: pool.stats() for target, pool in _pools.items()}
+
+
+def async_pool_stats() -> dict[str, dict]:
+    """psycopg_pool get_stats() of every open async pool, keyed by target."""
+    return {
+        target: pool.get_stats()
+        for target, pool in _async_pools.items()
+        if not pool.closed
+    }
+
+
+# Connection owned by the active unit_of_work() in this context, if any
+_uow_conn: contextvars.ContextVar = contextvars.ContextVar("db_uow_conn", default=None)
 
 
 @contextmanager
-def get_connection():
-    """Get a pooled PostgreSQL connection. Auto-commits on success, rolls back on error."""
-    pool = _get_pool()
+def get_connection(readonly: bool = False):
+    """Get a pooled PostgreSQL connection. Auto-commits on success, rolls back on error.
+
+    Blocks up to DB_POOL_TIMEOUT seconds when the pool is exhausted and
+    raises PoolTimeout if nothing frees up. Inside unit_of_work() this
+    yields the unit's connection and leaves commit/rollback to the unit.
+    ``readonly=True`` marks a read that may be served by the replica.
+    """
+    active = _uow_conn.get()
+    if active is not None:
+        yield active
+        return
+    target = _read_target(readonly)
+    pool = _get_pool(target)
     conn = pool.getconn()
+    if target == REPLICA:
+        try:
+            fresh = _replica_fresh(conn)
+        except Exception:
+            pool.putconn(conn)
+            raise
+        if not fresh:
+            pool.putconn(conn)
+            pool = _get_pool(PRIMARY)
+            conn = pool.getconn()
     try:
-        yield conn
-        conn.commit()
+        with table_versions.collect_writes() as written:
+            yield conn
+            conn.commit()
+        table_versions.bump(written)
     except Exception:
-        conn.rollback()
+        if not conn.closed:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                pass
         raise
     finally:
         pool.putconn(conn)
 
 
+@contextmanager
+def unit_of_work(readonly: bool = False):
+    """Run every get_connection() in this block on one connection and transaction.
+
+    Commits once when the block exits, rolls back everything if it raises.
+    With readonly=True the transaction is REPEATABLE READ, READ ONLY, so all
+    reads see the same snapshot, and it may run on the replica. Nested units join the outermost one.
+    Note an error raised by any service inside the block aborts the whole
+    transaction, so don't swallow DB errors and keep going inside a unit.
+    """
+    active = _uow_conn.get()
+    if active is not None:
+        yield active
+        return
+    with get_connection(readonly=readonly) as conn:
+        if readonly:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"
+                )
+        token = _uow_conn.set(conn)
+        try:
+            yield conn
+        finally:
+            _uow_conn.reset(token)
+
+
+@asynccontextmanager
+async def unit_of_work_async(readonly: bool = False):
+    """unit_of_work() entered from async code without blocking the event loop.
+
+    The pool checkout, SET TRANSACTION and the final commit run in a worker
+    thread; both run in one copied context, so the unit's own context
+    variables are set and restored consistently. Sync code called from the
+    block joins the unit as usual, e.g. sync endpoints, which run on the
+    threadpool with a copy of this context. The connection is a sync
+    (psycopg2) one, so don't run queries on it from the event loop.
+    """
+    active = _uow_conn.get()
+    if active is not None:
+        yield active
+        return
+    unit = unit_of_work(readonly=readonly)
+    ctx = contextvars.copy_context()
+    conn = await asyncio.to_thread(ctx.run, unit.__enter__)
+    token = _uow_conn.set(conn)
+    exc_info = (None, None, None)
+    try:
+        yield conn
+    except BaseException as e:
+        exc_info = (type(e), e, e.__traceback__)
+        raise
+    finally:
+        _uow_conn.reset(token)
+        await asyncio.to_thread(ctx.run, unit.__exit__, *exc_info)
+
+
+def in_unit_of_work() -> bool:
+    """Whether get_connection() here would join an open unit_of_work()."""
+    return _uow_conn.get() is not None
+
+
+# ---------------------------------------------------------------------------
+# Async access (psycopg 3)
+# ---------------------------------------------------------------------------
+
+_async_pools: dict = {}
+_async_pool_lock = asyncio.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _async_primary_cursor_class():
+    class _AsyncPrimaryCursor(async_cursor_class()):
+        async def execute(self, query, params=None, **kwargs):
+            try:
+                return await super().execute(query, params, **kwargs)
+            finally:
+                if not isinstance(query, (str, bytes)):
+                    query = query.as_string(self)
+                _note_status(self.statusmessage, query)
+
+    return _AsyncPrimaryCursor
+
+
+async def _get_async_pool(target: str = PRIMARY):
+    pool = _async_pools.get(target)
+    if pool is None or pool.closed:
+        async with _async_pool_lock:
+            pool = _async_pools.get(target)
+            if pool is None or pool.closed:
+                from psycopg_pool import AsyncConnectionPool  # lazy import
+
+                replica = target == REPLICA
+                pool = AsyncConnectionPool(
+                    _DATABASE_REPLICA_URL if replica else _DATABASE_URL,
+                    min_size=_POOL_MIN,
+                    max_size=_POOL_MAX,
+                    timeout=_POOL_TIMEOUT,
+                    # Supabase's transaction-mode pooler cannot hold
+                    # server-side prepared statements across transactions
+                    kwargs={
+                        "prepare_threshold": None,
+                        "cursor_factory": (
+                            async_cursor_class()
+                            if replica
+                            else _async_primary_cursor_class()
+                        ),
+                    },
+                    check=AsyncConnectionPool.check_connection,
+                    open=False,
+                )
+                await pool.open()
+                _async_pools[target] = pool
+                logger.info(
+                    "Async connection pool created (%s, %d-%d connections)",
+                    target,
+                    _POOL_MIN,
+                    _POOL_MAX,
+                )
+    return pool
+
+
+async def _async_replica_fresh(conn) -> bool:
+    if not _replica_lag_due():
+        return _replica_lag["fresh"]
+    async with conn.cursor() as cur:
+        await cur.execute(_REPLICA_LAG_SQL)
+        lag = (await cur.fetchone())[0]
+    await conn.rollback()
+    return _record_replica_lag(lag)
+
+
+@asynccontextmanager
+async def get_async_connection(readonly: bool = False):
+    """Async counterpart of get_connection(). Commits on success, rolls back on error."""
+    target = _read_target(readonly)
+    if target == REPLICA:
+        pool = await _get_async_pool(REPLICA)
+        async with pool.connection() as conn:
+            if await _async_replica_fresh(conn):
+                async with _async_transaction(conn) as conn:
+                    yield conn
+                return
+        # Replica lagging: fall through to the primary
+    pool = await _get_async_pool(PRIMARY)
+    async with pool.connection() as conn:
+        async with _async_transaction(conn) as conn:
+            yield conn
+
+
+@asynccontextmanager
+async def _async_transaction(conn):
+    try:
+        with table_versions.collect_writes() as written:
+            yield conn
+            await conn.commit()
+        table_versions.bump(written)
+    except Exception:
+        if not conn.closed:
+            await conn.rollback()
+        raise
+
+
+async def close_async_pool() -> None:
+    """Close the async pools (call on application shutdown)."""
+    for pool in list(_async_pools.values()):
+        await pool.close()
+    _async_pools.clear()
+
+
 def read_sql_file(file_name: str) -> str:
     query_path = os.path.join(os.path.dirname(__file__), "queries", file_name)
     try:
@@ -73,20 +695,278 @@ def rows_to_dicts(cur):
     return [dict(zip(cols, row)) for row in cur.fetchall()]
 
 
+async def async_row_to_dict(cur):
+    """Async row_to_dict for psycopg 3 async cursors."""
+    row = await cur.fetchone()
+    if row is None:
+        return None
+    cols = [d[0] for d in cur.description]
+    return dict(zip(cols, row))
+
+
+async def async_rows_to_dicts(cur):
+    """Async rows_to_dicts for psycopg 3 async cursors."""
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row)) for row in await cur.fetchall()]
+
+
+# ---------------------------------------------------------------------------
+# Compact rows — one shared column schema per result set, no dict per row
+# ---------------------------------------------------------------------------
+
+
+class Row(tuple):
+    """Immutable result row: the driver's tuple plus a column schema shared
+    by every row of the same result set.
+
+    Reads like a dict (``row["name"]``, ``get``, ``keys``, ``items``,
+    ``"name" in row``) but iterates values like a tuple. Call ``_asdict()``
+    for a mutable copy.
+    """
+
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _index: dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return tuple.__getitem__(self, self._index[key])
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def get(self, key: str, default=None):
+        i = self._index.get(key)
+        return default if i is None else tuple.__getitem__(self, i)
+
+    def keys(self) -> tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> tuple:
+        return tuple(self)
+
+    def items(self):
+        return zip(self._fields, self)
+
+    def _asdict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+    def __repr__(self) -> str:
+        return f"Row({self._asdict()!r})"
+
+
+@functools.lru_cache(maxsize=512)
+def _row_class(cols: tuple[str, ...]) -> type[Row]:
+    index = {c: i for i, c in enumerate(cols)}
+    return type("Row", (Row,), {"__slots__": (), "_fields": cols, "_index": index})
+
+
+def _row_class_for(cur) -> type[Row]:
+    return _row_class(tuple(d[0] for d in cur.description))
+
+
+def rows_to_records(cur) -> list[Row]:
+    """Like rows_to_dicts() but returns compact Row objects."""
+    cls = _row_class_for(cur)
+    return [cls(row) for row in cur.fetchall()]
+
+
+def iter_records(cur, batch_size: int = 500):
+    """Yield Row objects from ``cur`` in batches of ``batch_size``."""
+    cls = _row_class_for(cur)
+    while True:
+        batch = cur.fetchmany(batch_size)
+        if not batch:
+            return
+        for row in batch:
+            yield cls(row)
+
+
+_stream_ids = itertools.count(1)
+
+
+def stream_records(query, params=None, *, itersize: int | None = None):
+    """Yield Row objects from a server-side (named) cursor.
+
+    Rows arrive ``itersize`` at a time (default DB_STREAM_ITERSIZE), so
+    memory stays flat however large the result is. The generator holds a
+    pooled connection until it is exhausted or closed.
+    """
+    itersize = itersize or _STREAM_ITERSIZE
+    with get_connection() as conn:
+        with conn.cursor(name=f"stream_{next(_stream_ids)}") as cur:
+            cur.itersize = itersize
+            cur.execute(query, params)
+            cls = None
+            while True:
+                batch = cur.fetchmany(itersize)
+                if not batch:
+                    return
+                if cls is None:
+                    cls = _row_class_for(cur)
+                for row in batch:
+                    yield cls(row)
+
+
+async def async_rows_to_records(cur) -> list[Row]:
+    """Async rows_to_records for psycopg 3 async cursors."""
+    cls = _row_class_for(cur)
+    return [cls(row) for row in await cur.fetchall()]
+
+
+# ---------------------------------------------------------------------------
+# Bulk writes — a few round trips instead of one INSERT per row
+# ---------------------------------------------------------------------------
+
+
+def _chunks(rows, size: int):
+    it = iter(rows)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _as_columns(columns) -> list[str]:
+    return [columns] if isinstance(columns, str) else list(columns)
+
+
+def insert_many(
+    cur,
+    table: str,
+    columns,
+    rows,
+    *,
+    on_conflict: str | None = None,
+    returning=None,
+    page_size: int = 1000,
+):
+    """Multi-row ``INSERT ... VALUES`` with ``page_size`` rows per round trip.
+
+    ``on_conflict`` is the clause after ON CONFLICT, e.g.
+    ``"(client_id) DO NOTHING"``. Returns the RETURNING tuples when
+    ``returning`` (column name or names) is given, else the number of rows
+    inserted. Runs on the caller's cursor, so it joins the caller's
+    transaction.
+    """
+    columns = _as_columns(columns)
+    query = psycopg2.sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        psycopg2.sql.Identifier(table),
+        psycopg2.sql.SQL(", ").join(map(psycopg2.sql.Identifier, columns)),
+    )
+    if on_conflict:
+        query += psycopg2.sql.SQL(" ON CONFLICT " + on_conflict)
+    if returning:
+        query += psycopg2.sql.SQL(" RETURNING {}").format(
+            psycopg2.sql.SQL(", ").join(
+                map(psycopg2.sql.Identifier, _as_columns(returning))
+            )
+        )
+    query = query.as_string(cur)
+
+    returned: list[tuple] = []
+    count = 0
+    for chunk in _chunks(rows, page_size):
+        result = psycopg2.extras.execute_values(
+            cur, query, chunk, page_size=len(chunk), fetch=bool(returning)
+        )
+        if returning:
+            returned.extend(result)
+        else:
+            count += max(cur.rowcount, 0)
+    return returned if returning else count
+
+
+def upsert_many(
+    cur,
+    table: str,
+    columns,
+    rows,
+    *,
+    key,
+    update=None,
+    returning=None,
+    page_size: int = 1000,
+):
+    """insert_many() with ``ON CONFLICT (key) DO UPDATE``.
+
+    ``update`` lists the columns overwritten from EXCLUDED (default: every
+    non-key column); an empty list means DO NOTHING. Rows in one call must
+    not share a key, since Postgres cannot update the same row twice in one
+    statement.
+    """
+    columns = _as_columns(columns)
+    key = _as_columns(key)
+    if update is None:
+        update = [c for c in columns if c not in key]
+    conflict = "({})".format(", ".join(key))
+    if update:
+        conflict += " DO UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in update)
+    else:
+        conflict += " DO NOTHING"
+    return insert_many(
+        cur,
+        table,
+        columns,
+        rows,
+        on_conflict=conflict,
+        returning=returning,
+        page_size=page_size,
+    )
+
+
+def _copy_field(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, psycopg2.extras.Json):
+        value = json.dumps(value.adapted, ensure_ascii=False)
+    elif isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False)
+    elif hasattr(value, "isoformat"):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    # Quoted fields never match the NULL marker, so a literal "\N" survives
+    return '"' + value.replace('"', '""') + '"'
+
+
+def copy_rows(cur, table: str, columns, rows, *, buffer_rows: int = 10000) -> int:
+    """Load rows with ``COPY ... FROM STDIN`` (CSV), the fastest path for
+    large loads. No conflict handling: target an empty or staging table, or
+    use insert_many() when duplicates are possible. Returns rows copied.
+    """
+    columns = _as_columns(columns)
+    query = psycopg2.sql.SQL(
+        "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    ).format(
+        psycopg2.sql.Identifier(table),
+        psycopg2.sql.SQL(", ").join(map(psycopg2.sql.Identifier, columns)),
+    )
+    total = 0
+    for chunk in _chunks(rows, buffer_rows):
+        buf = io.StringIO()
+        for row in chunk:
+            buf.write(",".join(_copy_field(v) for v in row))
+            buf.write("\n")
+        buf.seek(0)
+        cur.copy_expert(query, buf)
+        total += len(chunk)
+    return total
+
+
 def init_db():
-    """Execute schema file to create all tables."""
-    db_dir = os.path.dirname(__file__)
-    schema_path = os.path.join(db_dir, "schema.sql")
-    pool = _get_pool()
-    conn = pool.getconn()
-    try:
-        with conn.cursor() as cur:
-            with open(schema_path, "r") as f:
-                cur.execute(f.read())
-        conn.commit()
-        logger.info("Database initialized via %s", schema_path)
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        pool.putconn(conn)
+    """Bring the schema up to date via versioned migrations.
+
+    A single query when nothing changed; see database/migrate.py.
+    """
+    from database.migrate import migrate
+
+    version = migrate()
+    logger.info("Database schema at version %s", version)
@@ -0,0 +1,66 @@
+"""Sparse fieldsets: narrow a query's SELECT list to the fields asked for.
+
+``?fields=id,name,stage`` becomes ``SELECT d.id, d.name, d.stage`` instead
+of ``SELECT d.*`` trimmed afterwards, so unrequested columns (intel
+``raw_input`` / ``parsed_json`` / ``chat_history``, deal ``meddic_json``)
+are never read, sent by Postgres or serialized. Without ``fields`` a
+query keeps its full default projection.
+
+Field names are looked up in a fixed per-entity whitelist, never
+interpolated from the request; unknown names raise InvalidFields.
+"""
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+def parse_fields(raw: str | None) -> list[str] | None:
+    """``"a, b,,c"`` -> ``["a", "b", "c"]``; None or blank -> None (all)."""
+    if raw is None:
+        return None
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    return fields or None
+
+
+def split_fields(fields: list[str] | None, nested) -> tuple[list[str] | None, set]:
+    """Separate nested resources (e.g. a deal's ``partners``) from columns.
+
+    Returns ``(columns, wanted_nested)``; with no ``fields`` that is
+    ``(None, set(nested))``: every column and every nested resource.
+    """
+    if fields is None:
+        return None, set(nested)
+    return [f for f in fields if f not in nested], {f for f in fields if f in nested}
+
+
+class Fieldset:
+    """Selectable fields of one entity query.
+
+    ``columns`` are the table's own columns, read through ``alias``;
+    ``computed`` maps further output names to SQL expressions (joined
+    names, subqueries). The default projection is ``alias.*`` plus every
+    computed field.
+    """
+
+    def __init__(self, name: str, alias: str, columns, computed: dict | None = None):
+        self.name = name
+        prefix = f"{alias}." if alias else ""
+        self._exprs = {c: f"{prefix}{c}" for c in columns}
+        for field, expr in (computed or {}).items():
+            self._exprs[field] = f"{expr} AS {field}"
+        computed_exprs = [self._exprs[f] for f in computed or {}]
+        self.default = ", ".join([f"{prefix}*", *computed_exprs])
+
+    def select(self, fields: list[str] | None, required=("id",)) -> str:
+        """SQL select list for ``fields`` plus ``required`` (always sent:
+        the id, and any pagination key the next cursor is built from)."""
+        if fields is None:
+            return self.default
+        unknown = [f for f in fields if f not in self._exprs]
+        if unknown:
+            raise InvalidFields(
+                f"Unknown field(s) for {self.name}: {', '.join(unknown)}"
+            )
+        wanted = dict.fromkeys([*required, *fields])  # ordered, de-duplicated
+        return ", ".join(self._exprs[f] for f in wanted)
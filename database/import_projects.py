@@ -9,7 +9,7 @@ Usage:
 
 from datetime import date
 
-from database.connection import get_connection, init_db
+from database.connection import get_connection, init_db, insert_many
 
 # ---------------------------------------------------------------------------
 # 1. Products (annual_plan)
@@ -575,103 +575,104 @@ def run():
     with get_connection() as conn:
         with conn.cursor() as cur:
             # --- 1. Products ---
-            for product_id, product_name in PRODUCTS:
-                cur.execute(
-                    """INSERT INTO annual_plan (product_id, product_name)
-                       VALUES (%s, %s)
-                       ON CONFLICT (product_id) DO NOTHING""",
-                    (product_id, product_name),
-                )
+            insert_many(
+                cur,
+                "annual_plan",
+                ("product_id", "product_name"),
+                PRODUCTS,
+                on_conflict="(product_id) DO NOTHING",
+            )
             print(f"✓ Products: {len(PRODUCTS)} upserted")
 
             # --- 2. Clients ---
-            inserted_clients = 0
-            for client_id, company_name in NEW_CLIENTS:
-                cur.execute(
-                    """INSERT INTO crm (client_id, company_name, data_year)
-                       VALUES (%s, %s, 2026)
-                       ON CONFLICT (client_id) DO NOTHING""",
-                    (client_id, company_name),
-                )
-                if cur.rowcount > 0:
-                    inserted_clients += 1
+            inserted_clients = insert_many(
+                cur,
+                "crm",
+                ("client_id", "company_name", "data_year"),
+                [(client_id, name, 2026) for client_id, name in NEW_CLIENTS],
+                on_conflict="(client_id) DO NOTHING",
+            )
             print(f"✓ Clients: {inserted_clients} new / {len(NEW_CLIENTS)} total")
 
             # --- 3. Projects ---
-            inserted_projects = 0
-            project_ids = {}  # name → project_id (for work_log)
-            for (
-                name,
-                client_id,
-                product_id,
-                status_code,
-                sales_owner,
-                presale_owner,
-                channel,
-                notes,
-            ) in PROJECTS:
-                # Check if project already exists (by name + client)
-                cur.execute(
-                    "SELECT project_id FROM project_list WHERE project_name = %s AND client_id = %s",
-                    (name, client_id),
-                )
-                existing = cur.fetchone()
-                if existing:
-                    project_ids[name] = existing[0]
-                    continue
-
-                cur.execute(
-                    """INSERT INTO project_list
-                       (project_name, client_id, product_id, status_code,
-                        sales_owner, presale_owner, channel, priority)
-                       VALUES (%s, %s, %s, %s, %s, %s, %s, 'Medium')
-                       RETURNING project_id""",
-                    (
-                        name,
-                        client_id,
-                        product_id,
-                        status_code,
-                        sales_owner,
-                        presale_owner,
-                        channel,
-                    ),
+            # Existing projects (by name + client) are kept, not duplicated
+            cur.execute(
+                "SELECT project_name, client_id, project_id FROM project_list "
+                "WHERE client_id = ANY(%s)",
+                (list({p[1] for p in PROJECTS}),),
+            )
+            project_ids = {(name, cid): pid for name, cid, pid in cur.fetchall()}
+            new_projects = [
+                (
+                    name,
+                    client_id,
+                    product_id,
+                    status_code,
+                    sales,
+                    presale,
+                    channel,
+                    "Medium",
                 )
-                project_ids[name] = cur.fetchone()[0]
-                inserted_projects += 1
-            print(f"✓ Projects: {inserted_projects} new / {len(PROJECTS)} total")
+                for (
+                    name,
+                    client_id,
+                    product_id,
+                    status_code,
+                    sales,
+                    presale,
+                    channel,
+                    _notes,
+                ) in PROJECTS
+                if (name, client_id) not in project_ids
+            ]
+            returned = insert_many(
+                cur,
+                "project_list",
+                (
+                    "project_name",
+                    "client_id",
+                    "product_id",
+                    "status_code",
+                    "sales_owner",
+                    "presale_owner",
+                    "channel",
+                    "priority",
+                ),
+                new_projects,
+                returning=("project_name", "client_id", "project_id"),
+            )
+            project_ids.update({(name, cid): pid for name, cid, pid in returned})
+            print(f"✓ Projects: {len(returned)} new / {len(PROJECTS)} total")
 
             # --- 4. Work logs (for projects with notes) ---
-            inserted_logs = 0
+            # Skip logs already written for the same project + content
+            pids = [project_ids[(p[0], p[1])] for p in PROJECTS if p[7]]
+            cur.execute(
+                "SELECT project_id, content FROM work_log WHERE project_id = ANY(%s)",
+                (pids,),
+            )
+            existing_logs = set(cur.fetchall())
             today = date.today()
-            for (
-                name,
-                client_id,
-                product_id,
-                status_code,
-                sales_owner,
-                presale_owner,
-                channel,
-                notes,
-            ) in PROJECTS:
-                if not notes:
+            new_logs = []
+            for name, client_id, *_rest, notes in PROJECTS:
+                pid = project_ids.get((name, client_id))
+                if not notes or not pid or (pid, notes) in existing_logs:
                     continue
-                pid = project_ids.get(name)
-                if not pid:
-                    continue
-                # Check if we already wrote a log for this project+content
-                cur.execute(
-                    "SELECT 1 FROM work_log WHERE project_id = %s AND content = %s",
-                    (pid, notes),
-                )
-                if cur.fetchone():
-                    continue
-                cur.execute(
-                    """INSERT INTO work_log
-                       (project_id, log_date, action_type, content, duration_hours, source)
-                       VALUES (%s, %s, '文件', %s, 0.5, 'import')""",
-                    (pid, today, notes),
-                )
-                inserted_logs += 1
+                existing_logs.add((pid, notes))
+                new_logs.append((pid, today, "文件", notes, 0.5, "import"))
+            inserted_logs = insert_many(
+                cur,
+                "work_log",
+                (
+                    "project_id",
+                    "log_date",
+                    "action_type",
+                    "content",
+                    "duration_hours",
+                    "source",
+                ),
+                new_logs,
+            )
             print(f"✓ Work logs: {inserted_logs} entries")
 
     print("\n=== Import complete ===")
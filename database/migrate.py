@@ -0,0 +1,246 @@
+"""Versioned schema migrations.
+
+Version 0 is the baseline ``database/schema.sql``. Numbered files in
+``database/migrations/`` (``NNNN_description.sql``) are applied in order on
+top of it, and each applied version is recorded in ``schema_version``.
+
+When the database is already current, ``migrate()`` costs one query:
+``SELECT max(version) FROM schema_version`` compared against the highest
+file number on disk. No SQL files are read and no DDL locks are taken.
+
+A migration whose first line is ``-- migrate:no-transaction`` runs in
+autocommit mode, one statement at a time (split on ``;``), which
+``CREATE INDEX CONCURRENTLY`` requires. Such files must be idempotent
+(``IF NOT EXISTS``), since a failure midway cannot be rolled back. If a
+concurrent build fails it leaves an INVALID index behind; the migration
+then refuses to record itself until that index is dropped.
+
+Concurrent boots are serialized by a session-level advisory lock held for the
+whole run, since autocommit statements would release a transaction-level one.
+
+Usage:
+    python -m database.migrate            # apply pending migrations
+    python -m database.migrate --status   # print current / latest version
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+
+import psycopg2.errors
+
+from database.connection import _get_pool
+
+logger = logging.getLogger(__name__)
+
+DB_DIR = os.path.dirname(__file__)
+SCHEMA_PATH = os.path.join(DB_DIR, "schema.sql")
+MIGRATIONS_DIR = os.path.join(DB_DIR, "migrations")
+
+NO_TRANSACTION = "-- migrate:no-transaction"
+
+# Arbitrary constant for pg_advisory_lock; serializes concurrent boots.
+_LOCK_KEY = 7_140_521
+_LOCK_POLL_SECONDS = 0.5
+
+_FILE_RE = re.compile(r"^(\d{4})_[\w-]+\.sql$")
+
+_CREATE_VERSION_TABLE_SQL = """CREATE TABLE IF NOT EXISTS schema_version (
+    version     INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    applied_at  TIMESTAMPTZ DEFAULT NOW()
+)"""
+
+_RECORD_VERSION_SQL = """INSERT INTO schema_version (version, name) VALUES (%s, %s)
+                         ON CONFLICT (version) DO NOTHING"""
+
+_INVALID_INDEXES_SQL = """SELECT c.relname FROM pg_index i
+                          JOIN pg_class c ON c.oid = i.indexrelid
+                          WHERE NOT i.indisvalid AND c.relname = ANY(%s)"""
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+def discover_migrations() -> list[tuple[int, str, str]]:
+    """Return (version, name, path) for each migration file, ordered by version."""
+    found = []
+    for fname in os.listdir(MIGRATIONS_DIR):
+        m = _FILE_RE.match(fname)
+        if m:
+            found.append((int(m.group(1)), fname, os.path.join(MIGRATIONS_DIR, fname)))
+    found.sort()
+    versions = [v for v, _, _ in found]
+    if len(versions) != len(set(versions)):
+        raise MigrationError(f"Duplicate migration version in {MIGRATIONS_DIR}")
+    return found
+
+
+def latest_version() -> int:
+    migrations = discover_migrations()
+    return migrations[-1][0] if migrations else 0
+
+
+def current_version(conn) -> int | None:
+    """Highest applied version, or None if the database was never migrated."""
+    with conn.cursor() as cur:
+        try:
+            cur.execute("SELECT max(version) FROM schema_version")
+        except psycopg2.errors.UndefinedTable:
+            conn.rollback()
+            return None
+        row = cur.fetchone()
+    conn.rollback()
+    return row[0]
+
+
+def _split_statements(sql: str) -> list[str]:
+    # Drop comment lines before splitting, so a ';' inside one can't end a statement
+    code = "\n".join(
+        line for line in sql.splitlines() if not line.strip().startswith("--")
+    )
+    return [s.strip() for s in code.split(";") if s.strip()]
+
+
+def _index_names(sql: str) -> list[str]:
+    return re.findall(
+        r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)",
+        sql,
+        re.IGNORECASE,
+    )
+
+
+def _acquire_lock(conn):
+    """Take the session-level migration lock, polling until it is free.
+
+    Waiting inside pg_advisory_lock would keep a snapshot open, and a
+    CREATE INDEX CONCURRENTLY run by the lock holder waits for every older
+    snapshot to finish, so the two boots would deadlock.
+    """
+    with conn.cursor() as cur:
+        while True:
+            cur.execute("SELECT pg_try_advisory_lock(%s)", (_LOCK_KEY,))
+            acquired = cur.fetchone()[0]
+            conn.commit()
+            if acquired:
+                return
+            time.sleep(_LOCK_POLL_SECONDS)
+
+
+def _release_lock(conn):
+    conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_unlock(%s)", (_LOCK_KEY,))
+    conn.commit()
+
+
+def _apply_baseline(conn):
+    with conn.cursor() as cur:
+        cur.execute(_CREATE_VERSION_TABLE_SQL)
+        cur.execute("SELECT 1 FROM schema_version WHERE version = 0")
+        if cur.fetchone() is None:
+            with open(SCHEMA_PATH, "r") as f:
+                cur.execute(f.read())
+            cur.execute(_RECORD_VERSION_SQL, (0, "schema.sql"))
+            logger.info("Applied baseline schema %s", SCHEMA_PATH)
+    conn.commit()
+
+
+def _apply_transactional(conn, version: int, name: str, sql: str):
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM schema_version WHERE version = %s", (version,))
+        if cur.fetchone() is None:
+            cur.execute(sql)
+            cur.execute(_RECORD_VERSION_SQL, (version, name))
+    conn.commit()
+
+
+def _apply_no_transaction(conn, version: int, name: str, sql: str):
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            for statement in _split_statements(sql):
+                cur.execute(statement)
+            indexes = _index_names(sql)
+            if indexes:
+                cur.execute(_INVALID_INDEXES_SQL, (indexes,))
+                invalid = [r[0] for r in cur.fetchall()]
+                if invalid:
+                    raise MigrationError(
+                        f"{name}: INVALID index(es) {', '.join(invalid)} left by a "
+                        f"failed concurrent build; DROP INDEX CONCURRENTLY and retry"
+                    )
+    finally:
+        conn.autocommit = False
+    with conn.cursor() as cur:
+        cur.execute(_RECORD_VERSION_SQL, (version, name))
+    conn.commit()
+
+
+def _migrate(conn) -> int:
+    current = current_version(conn)
+    migrations = discover_migrations()
+    latest = migrations[-1][0] if migrations else 0
+    if current is not None and current >= latest:
+        return current
+
+    _acquire_lock(conn)
+    try:
+        # Another boot may have migrated while we waited for the lock
+        current = current_version(conn)
+        if current is None:
+            _apply_baseline(conn)
+            current = 0
+
+        for version, name, path in migrations:
+            if version <= current:
+                continue
+            with open(path, "r") as f:
+                sql = f.read()
+            if sql.lstrip().startswith(NO_TRANSACTION):
+                _apply_no_transaction(conn, version, name, sql)
+            else:
+                _apply_transactional(conn, version, name, sql)
+            logger.info("Applied migration %s", name)
+    finally:
+        _release_lock(conn)
+    return latest
+
+
+def migrate(conn=None) -> int:
+    """Apply pending migrations and return the resulting schema version.
+
+    Uses a pooled connection unless ``conn`` (a psycopg2 connection) is given.
+    """
+    if conn is not None:
+        return _migrate(conn)
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        return _migrate(conn)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+
+def main():
+    if "--status" in sys.argv[1:]:
+        pool = _get_pool()
+        conn = pool.getconn()
+        try:
+            current = current_version(conn)
+        finally:
+            pool.putconn(conn)
+        print(f"current: {'unmigrated' if current is None else current}")
+        print(f"latest:  {latest_version()}")
+        return
+    print(f"Schema at version {migrate()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+-- migrate:no-transaction
+-- Reverse-side indexes for the M2M tables.
+-- Built CONCURRENTLY so live tables keep taking writes.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_deal_partner_partner ON nx_deal_partner(partner_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_deal_intel_intel ON nx_deal_intel(intel_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_intel_entity_entity ON nx_intel_entity(entity_type, entity_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_subsidy_deal_deal ON nx_subsidy_deal(deal_id);
@@ -0,0 +1,31 @@
+-- migrate:no-transaction
+-- Composite indexes matching the keyset pagination sort keys
+-- (see database/keyset.py and the *_KEYSET definitions in services/nexus).
+-- Built CONCURRENTLY so live tables keep taking writes.
+
+-- Keyset comparisons skip NULL keys, so the timestamp keys must be set.
+-- Nothing writes NULL to them (all DEFAULT NOW()), so this only backfills old rows.
+-- SET NOT NULL scans each table once under an exclusive lock (brief).
+UPDATE nx_deal SET last_activity_at = COALESCE(updated_at, created_at, NOW()) WHERE last_activity_at IS NULL;
+UPDATE nx_client SET updated_at = COALESCE(created_at, NOW()) WHERE updated_at IS NULL;
+UPDATE nx_contact SET updated_at = COALESCE(created_at, NOW()) WHERE updated_at IS NULL;
+UPDATE nx_tbd_item SET created_at = NOW() WHERE created_at IS NULL;
+UPDATE nx_intel SET created_at = COALESCE(updated_at, NOW()) WHERE created_at IS NULL;
+ALTER TABLE nx_deal ALTER COLUMN last_activity_at SET NOT NULL;
+ALTER TABLE nx_client ALTER COLUMN updated_at SET NOT NULL;
+ALTER TABLE nx_contact ALTER COLUMN updated_at SET NOT NULL;
+ALTER TABLE nx_tbd_item ALTER COLUMN created_at SET NOT NULL;
+ALTER TABLE nx_intel ALTER COLUMN created_at SET NOT NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_deal_status_activity ON nx_deal(status, last_activity_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_client_updated ON nx_client(updated_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_client_status_updated ON nx_client(status, updated_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_contact_updated ON nx_contact(updated_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_tbd_resolved_created ON nx_tbd_item(resolved, created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_document_expiry ON nx_document((COALESCE(expiry_date, 'infinity'::date)), id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_intel_created ON nx_intel(created_at, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nx_intel_status_created_id ON nx_intel(status, created_at, id);
+
+-- Superseded by idx_nx_intel_status_created_id (same prefix plus the id tiebreak).
+-- Only databases migrated before 0001 stopped building it still have it.
+DROP INDEX CONCURRENTLY IF EXISTS idx_nx_intel_status_created;
@@ -0,0 +1,14 @@
+-- Shared tier of the AI response cache (services/ai_provider.py, AI_CACHE_DB=1).
+-- cache_key is a sha256 over provider, model, system prompt and input.
+-- Expired rows are ignored on read and purged by the writers.
+
+CREATE TABLE IF NOT EXISTS ai_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_ai_response_cache_expires ON ai_response_cache(expires_at);
@@ -0,0 +1,312 @@
+"""Per-query latency instrumentation at the cursor layer.
+
+Every cursor handed out by the sync and async pools records, for each
+statement: a normalized fingerprint, wall-clock duration, row count and the
+``services.*`` function that issued it. Statements slower than
+DB_SLOW_QUERY_MS are logged on the ``database.slow_query`` logger, and
+rolling per-(fingerprint, caller) latency samples are kept in memory for
+``/api/debug/queries``. Inside request_timings() the cursors also add up
+per-request DB time for the Server-Timing header.
+
+    DB_QUERY_STATS        set to 0 to disable recording entirely (default 1)
+    DB_SLOW_QUERY_MS      slow-query log threshold in ms (default 200)
+    DB_QUERY_STATS_WINDOW latency samples kept per fingerprint (default 512)
+    DB_QUERY_STATS_MAX_ENTRIES  (fingerprint, caller) pairs kept; the least
+                          called are evicted past this (default 2000)
+
+Memory stays bounded for bulk statements too: multi-row ``VALUES`` lists
+(execute_values in insert_many / upsert_many) collapse to their first row,
+only statements up to 4096 characters are memoized, and at most 2048
+characters of each normalized statement are kept.
+"""
+
+import contextvars
+import functools
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2.extensions
+
+logger = logging.getLogger("database.slow_query")
+
+ENABLED = os.getenv("DB_QUERY_STATS", "1") not in ("0", "false", "False", "")
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+WINDOW = int(os.getenv("DB_QUERY_STATS_WINDOW", "512"))
+MAX_ENTRIES = int(os.getenv("DB_QUERY_STATS_MAX_ENTRIES", "2000"))
+# Longer statements skip the _normalize cache; stored text is cut at _MAX_TEXT
+_MAX_CACHED_SQL = 4096
+_MAX_TEXT = 2048
+
+_WS_RE = re.compile(r"\s+")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)")
+# VALUES (...), (...), ... -- rows may hold one level of calls, e.g. NOW()
+_ROW = r"\((?:[^()]|\([^()]*\))*\)"
+_VALUES_LIST_RE = re.compile(rf"\b(VALUES\s*{_ROW})(?:\s*,\s*{_ROW})+", re.IGNORECASE)
+
+
+class _Entry:
+    __slots__ = (
+        "fingerprint",
+        "sql",
+        "caller",
+        "count",
+        "total_ms",
+        "max_ms",
+        "rows",
+        "samples",
+    )
+
+    def __init__(self, fingerprint: str, sql: str, caller: str):
+        self.fingerprint = fingerprint
+        self.sql = sql
+        self.caller = caller
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.samples: deque = deque(maxlen=WINDOW)
+
+
+_entries: dict[tuple[str, str], _Entry] = {}
+_lock = threading.Lock()
+
+
+def _normalize(sql: str) -> tuple[str, str]:
+    """Return (fingerprint, normalized_sql); literals, IN-lists and multi-row
+    VALUES lists collapsed, the text cut at _MAX_TEXT."""
+    if len(sql) > _MAX_CACHED_SQL:
+        return _normalize_text(sql)
+    return _normalize_cached(sql)
+
+
+def _normalize_text(sql: str) -> tuple[str, str]:
+    text = _STRING_RE.sub("?", sql)
+    text = _NUMBER_RE.sub("?", text)
+    text = _WS_RE.sub(" ", text).strip()
+    text = _IN_LIST_RE.sub("(...)", text)
+    text = _VALUES_LIST_RE.sub(r"\1, ...", text)
+    return hashlib.md5(text.encode()).hexdigest()[:12], text[:_MAX_TEXT]
+
+
+_normalize_cached = functools.lru_cache(maxsize=2048)(_normalize_text)
+
+
+def _caller() -> str:
+    """Qualified name of the nearest services.* frame (else nearest non-db frame)."""
+    frame = sys._getframe(2)
+    fallback = None
+    depth = 0
+    while frame is not None and depth < 40:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("services."):
+            return f"{module}.{frame.f_code.co_name}"
+        if fallback is None and not module.startswith(
+            ("database.", "psycopg", "contextlib", "asyncio")
+        ):
+            fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+        depth += 1
+    return fallback or "?"
+
+
+def record(sql, elapsed_s: float, rowcount: int, caller: str) -> None:
+    if isinstance(sql, bytes):
+        sql = sql.decode("utf-8", "replace")
+    elif not isinstance(sql, str):
+        sql = str(sql)  # psycopg.sql.Composed and friends
+    fingerprint, text = _normalize(sql)
+    if not text:
+        return  # pool liveness checks send an empty statement
+    ms = elapsed_s * 1000
+    rows = max(rowcount, 0)
+    key = (fingerprint, caller)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            if len(_entries) >= MAX_ENTRIES:
+                _evict()
+            entry = _entries[key] = _Entry(fingerprint, text, caller)
+        entry.count += 1
+        entry.total_ms += ms
+        entry.rows += rows
+        if ms > entry.max_ms:
+            entry.max_ms = ms
+        entry.samples.append(ms)
+    if ms >= SLOW_QUERY_MS:
+        logger.warning(
+            "slow query %.1fms rows=%d caller=%s fp=%s: %s",
+            ms,
+            rows,
+            caller,
+            fingerprint,
+            text[:500],
+        )
+
+
+def _evict() -> None:
+    """Drop the least-called tenth of _entries (caller holds _lock)."""
+    by_count = sorted(_entries, key=lambda k: _entries[k].count)
+    for key in by_count[: max(1, len(by_count) // 10)]:
+        del _entries[key]
+
+
+# Statement list collected by capture_statements(), if active
+_capture: contextvars.ContextVar = contextvars.ContextVar("query_capture", default=None)
+
+
+@contextmanager
+def capture_statements():
+    """Collect (caller, query, params) for every statement run in this block.
+
+    Used by scripts/plan_regression.py to find the SQL behind each service
+    function; independent of DB_QUERY_STATS.
+    """
+    captured: list[tuple] = []
+    token = _capture.set(captured)
+    try:
+        yield captured
+    finally:
+        _capture.reset(token)
+
+
+# Per-request time totals installed by request_timings(); a mutable dict so
+# threadpool copies of the request context all add to the same object
+_timings: contextvars.ContextVar = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+@contextmanager
+def request_timings():
+    """Accumulate time spent per category ("db", "ai", ...) in this block.
+
+    Yields a dict of {category: [seconds, count]}. The cursors here add
+    "db"; other layers report through add_timing().
+    """
+    totals: dict[str, list] = {}
+    token = _timings.set(totals)
+    try:
+        yield totals
+    finally:
+        _timings.reset(token)
+
+
+def add_timing(category: str, elapsed_s: float) -> None:
+    totals = _timings.get()
+    if totals is not None:
+        entry = totals.setdefault(category, [0.0, 0])
+        entry[0] += elapsed_s
+        entry[1] += 1
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+def snapshot(sort: str = "total_ms", limit: int = 50) -> list[dict]:
+    """Per-(fingerprint, caller) stats, most expensive first.
+
+    sort: total_ms | p95_ms | p99_ms | max_ms | count
+    """
+    with _lock:
+        entries = [
+            (
+                e.fingerprint,
+                e.sql,
+                e.caller,
+                e.count,
+                e.total_ms,
+                e.max_ms,
+                e.rows,
+                list(e.samples),
+            )
+            for e in _entries.values()
+        ]
+    result = []
+    for fingerprint, sql, caller, count, total_ms, max_ms, rows, samples in entries:
+        samples.sort()
+        result.append(
+            {
+                "fingerprint": fingerprint,
+                "caller": caller,
+                "count": count,
+                "total_ms": round(total_ms, 2),
+                "mean_ms": round(total_ms / count, 2),
+                "p50_ms": round(_percentile(samples, 50), 2),
+                "p95_ms": round(_percentile(samples, 95), 2),
+                "p99_ms": round(_percentile(samples, 99), 2),
+                "max_ms": round(max_ms, 2),
+                "rows_per_call": round(rows / count, 1),
+                "sql": sql,
+            }
+        )
+    if sort not in ("total_ms", "p95_ms", "p99_ms", "max_ms", "count"):
+        sort = "total_ms"
+    result.sort(key=lambda r: r[sort], reverse=True)
+    return result[:limit]
+
+
+def reset() -> None:
+    with _lock:
+        _entries.clear()
+
+
+class InstrumentedCursor(psycopg2.extensions.cursor):
+    """psycopg2 cursor that times execute()/executemany()."""
+
+    def execute(self, query, vars=None):
+        captured = _capture.get()
+        if captured is not None:
+            captured.append((_caller(), query, vars))
+        caller = _caller() if ENABLED else None
+        start = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            elapsed = time.perf_counter() - start
+            add_timing("db", elapsed)
+            if caller is not None:
+                record(query, elapsed, self.rowcount, caller)
+
+    def executemany(self, query, vars_list):
+        caller = _caller() if ENABLED else None
+        start = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            elapsed = time.perf_counter() - start
+            add_timing("db", elapsed)
+            if caller is not None:
+                record(query, elapsed, self.rowcount, caller)
+
+
+@functools.lru_cache(maxsize=None)
+def async_cursor_class():
+    """psycopg 3 AsyncCursor subclass with the same timing (psycopg imported lazily)."""
+    from psycopg import AsyncCursor
+
+    class InstrumentedAsyncCursor(AsyncCursor):
+        async def execute(self, query, params=None, **kwargs):
+            caller = _caller() if ENABLED else None
+            start = time.perf_counter()
+            try:
+                return await super().execute(query, params, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                add_timing("db", elapsed)
+                if caller is not None:
+                    record(query, elapsed, self.rowcount, caller)
+
+    return InstrumentedAsyncCursor
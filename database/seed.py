@@ -13,7 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from psycopg2.extras import Json
 
-from database.connection import init_db, get_connection
+from database.connection import init_db, get_connection, insert_many
 
 # ---------------------------------------------------------------------------
 # Raw contact data (from TSV import)
@@ -964,22 +964,29 @@ def seed():
             cur.execute("ALTER SEQUENCE project_task_task_id_seq RESTART WITH 1")
 
             # Insert CRM records with sequential client_id
-            for idx, comp in enumerate(companies, start=1):
-                client_id = f"CLI-{idx:03d}"
-                cur.execute(
-                    """INSERT INTO crm
-                       (client_id, company_name, decision_maker, champions,
-                        contact_info, data_year)
-                       VALUES (%s, %s, %s, %s, %s, %s)""",
+            insert_many(
+                cur,
+                "crm",
+                (
+                    "client_id",
+                    "company_name",
+                    "decision_maker",
+                    "champions",
+                    "contact_info",
+                    "data_year",
+                ),
+                [
                     (
-                        client_id,
+                        f"CLI-{idx:03d}",
                         comp["company_name"],
                         Json(comp["decision_maker"]),
                         Json(comp["champions"]) if comp["champions"] else None,
                         comp["contact_info"] or None,
                         2025,
-                    ),
-                )
+                    )
+                    for idx, comp in enumerate(companies, start=1)
+                ],
+            )
 
     print("Seed data loaded successfully!")
     print(f"  - {len(companies)} clients (crm) — real contacts with data_year=2025")
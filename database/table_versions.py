@@ -0,0 +1,111 @@
+"""In-process version counters per table, for HTTP conditional GETs.
+
+Primary-connection cursors report every write statement here (see
+``database.connection``). The touched tables are collected for the
+duration of the transaction and bumped only after it commits, so a
+reader can never pair a new version with data that isn't visible yet.
+
+``token(tables)`` combines the current counters into a short string that
+changes whenever any of those tables was written through this process.
+Writes made elsewhere (psql, scripts, another process) are not seen;
+counters start from a per-boot nonce, so a restart invalidates every
+token handed out before it.
+"""
+
+import contextvars
+import hashlib
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+# Tables a write could not be attributed to; part of every token
+ANY = "*"
+
+_BOOT = os.urandom(4).hex()
+
+_TARGET_RE = re.compile(
+    r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|MERGE\s+INTO|COPY)\s+"
+    r"(?:ONLY\s+)?\"?(\w+)\"?(?:\.\"?(\w+)\"?)?",
+    re.IGNORECASE,
+)
+_TRUNCATE_RE = re.compile(
+    r"^\s*TRUNCATE\s+(?:TABLE\s+)?(?:ONLY\s+)?(.+?)"
+    r"(?:\s+(?:RESTART|CONTINUE|CASCADE|RESTRICT)\b.*)?;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_versions: dict[str, int] = {}
+_bumped_at: dict[str, float] = {}
+_lock = threading.Lock()
+
+# Tables written by the enclosing transaction, installed by collect_writes()
+_pending: contextvars.ContextVar = contextvars.ContextVar(
+    "table_versions_pending", default=None
+)
+
+
+def write_targets(sql) -> set[str]:
+    """Tables a write statement modifies; {ANY} when it can't be parsed."""
+    if isinstance(sql, bytes):
+        sql = sql.decode("utf-8", "replace")
+    m = _TARGET_RE.match(sql)
+    if m:
+        return {(m.group(2) or m.group(1)).lower()}
+    m = _TRUNCATE_RE.match(sql)
+    if m:
+        names = m.group(1).split(",")
+        return {n.strip().replace('"', "").split(".")[-1].lower() for n in names}
+    return {ANY}
+
+
+def note_write(sql) -> None:
+    """Record a write; bumped at commit inside collect_writes(), else now."""
+    tables = write_targets(sql)
+    pending = _pending.get()
+    if pending is not None:
+        pending.update(tables)
+    else:
+        bump(tables)
+
+
+@contextmanager
+def collect_writes():
+    """Gather tables written in this block; the caller bump()s after commit."""
+    pending: set[str] = set()
+    previous = _pending.get()
+    _pending.set(pending)
+    try:
+        yield pending
+    finally:
+        # Not reset(token): a streaming generator may be resumed, and so
+        # closed, in a different thread's copy of the context
+        _pending.set(previous)
+
+
+def bump(tables) -> None:
+    if not tables:
+        return
+    now = time.monotonic()
+    with _lock:
+        for table in tables:
+            _versions[table] = _versions.get(table, 0) + 1
+            _bumped_at[table] = now
+
+
+def token(tables, settle_seconds: float = 0) -> str | None:
+    """Version token for ``tables``, or None while a write is still settling.
+
+    ``settle_seconds`` covers read replicas: for that long after a commit a
+    replica may still serve the old rows, so no token is issued for them.
+    """
+    keys = sorted(set(tables) | {ANY})
+    with _lock:
+        if settle_seconds > 0:
+            horizon = time.monotonic() - settle_seconds
+            if any(_bumped_at.get(t, 0) > horizon for t in keys):
+                return None
+        parts = [f"{t}:{_versions.get(t, 0)}" for t in keys]
+    digest = hashlib.md5(",".join(parts).encode()).hexdigest()[:12]
+    return f"{_BOOT}-{digest}"
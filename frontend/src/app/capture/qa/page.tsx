@@ -85,10 +85,20 @@ function ChatFlow() {
     setSending(true);
     setMessages((prev) => [...prev, { role: "user", text: msg }]);
 
+    // The reply bubble appears with the first streamed text and grows
+    let streamed = false;
     try {
-      const result = await nxApi.intel.chat(intelId, msg, parsed);
+      const result = await nxApi.intel.chat(intelId, msg, parsed, (text) => {
+        const first = !streamed;
+        streamed = true;
+        setMessages((prev) =>
+          first
+            ? [...prev, { role: "ai", text }]
+            : [...prev.slice(0, -1), { role: "ai", text: prev[prev.length - 1].text + text }],
+        );
+      });
       setParsed(result.parsed);
-      setMessages((prev) => [...prev, { role: "ai", text: result.ai_reply }]);
+      setMessages((prev) => [...(streamed ? prev.slice(0, -1) : prev), { role: "ai", text: result.ai_reply }]);
     } catch (err) {
       console.error("Chat failed:", err);
       setMessages((prev) => [...prev, { role: "system", text: "AI 回覆失敗，請重試" }]);
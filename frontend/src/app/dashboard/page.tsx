@@ -50,14 +50,25 @@ export default function DashboardPage() {
   const loadData = useCallback(async () => {
     try {
       const today = new Date().toISOString().split("T")[0];
-      const [all, push, rems, mtgs, tbds, expSubs] = await Promise.all([
-        nxApi.deals.list(),
-        nxApi.deals.needsPush(7),
-        nxApi.calendar.pendingReminders(),
-        nxApi.calendar.meetingsByDate(today),
-        nxApi.tbd.list(),
-        nxApi.subsidies.expiring(60),
+      // One round trip; the reads share a snapshot on the server
+      const results = await nxApi.batch([
+        { path: "/deals/?view=urgency" },
+        { path: "/deals/needs-push?threshold_days=7" },
+        { path: "/calendar/reminders" },
+        { path: `/calendar/meetings?date=${today}` },
+        { path: "/tbd/" },
+        { path: "/subsidies/expiring?within_days=60" },
       ]);
+      const failed = results.find((r) => r.status !== 200);
+      if (failed) throw new Error(`API error: ${failed.status}`);
+      const [all, push, rems, mtgs, tbds, expSubs] = results.map((r) => r.body) as [
+        NxDeal[],
+        NxDeal[],
+        NxReminder[],
+        NxMeeting[],
+        NxTbdItem[],
+        NxSubsidy[],
+      ];
       setAllDeals(all);
       setPushDeals(push);
       setReminders(rems);
@@ -19,7 +19,10 @@ export function IntelSummaryModal({ intelIds, onClose, onSaveAsIntel }: IntelSum
 
   useEffect(() => {
     nxApi.intel
-      .summarize(intelIds)
+      .summarize(intelIds, (text) => {
+        setLoading(false);
+        setSummary((prev) => prev + text);
+      })
       .then((res) => setSummary(res.summary))
       .catch((err) => setError(err.message || "AI 彙整失敗"))
       .finally(() => setLoading(false));
@@ -24,6 +24,37 @@ async function patchAPI<T>(path: string, body: unknown): Promise<T> {
   });
 }
 
+// POST that answers with server-sent events: passes each "delta" event's
+// text to onDelta and resolves with the payload of the final "done" event
+async function streamAPI<T>(path: string, body: unknown, onDelta: (text: string) => void): Promise<T> {
+  const res = await fetch(`${API_BASE}${path}`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+    body: JSON.stringify(body),
+  });
+  if (!res.ok || !res.body) {
+    throw new Error(`API error: ${res.status} ${res.statusText}`);
+  }
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffered = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffered += value;
+    let end;
+    while ((end = buffered.indexOf("\n\n")) >= 0) {
+      const block = buffered.slice(0, end);
+      buffered = buffered.slice(end + 2);
+      const event = block.match(/^event: (.*)$/m)?.[1];
+      const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] ?? "null");
+      if (event === "delta") onDelta(data.text);
+      else if (event === "done") return data as T;
+      else if (event === "error") throw new Error(data.detail);
+    }
+  }
+  throw new Error("API error: stream ended early");
+}
+
 async function deleteAPI(path: string): Promise<void> {
   const res = await fetch(`${API_BASE}${path}`, { method: "DELETE" });
   if (!res.ok) throw new Error(`API error: ${res.status}`);
@@ -262,7 +293,33 @@ export interface SearchResults {
   subsidies: { id: number; name: string; agency: string | null; program_type: string; stage: string; deadline: string | null; status: string }[];
 }
 
+export interface BatchSubRequest {
+  method?: "GET" | "POST" | "PUT" | "PATCH" | "DELETE";
+  path: string; // relative to /api/nx, e.g. "/deals/7"
+  body?: unknown;
+}
+
+export interface BatchResponse<T = unknown> {
+  status: number;
+  headers: Record<string, string>;
+  body: T;
+}
+
+export interface IntelChatResult {
+  ai_reply: string;
+  new_fields: Record<string, unknown>;
+  parsed: Record<string, unknown>;
+}
+
+export interface IntelSummary {
+  summary: string;
+  intel_count: number;
+  intel_ids: number[];
+}
+
 export const nxApi = {
+  batch: (requests: BatchSubRequest[]) =>
+    postAPI<{ responses: BatchResponse[] }>("/batch/", { requests }).then((r) => r.responses),
   subsidies: {
     list: (view?: string, clientId?: number) => {
       const params = new URLSearchParams();
@@ -351,16 +408,19 @@ export const nxApi = {
     delete: (id: number) => deleteAPI(`/intel/${id}`),
     parse: (id: number) =>
       postAPI<{ parsed: Record<string, unknown>; ai_reply: string }>(`/intel/${id}/parse`, {}),
-    chat: (id: number, message: string, currentParsed: Record<string, unknown>) =>
-      postAPI<{ ai_reply: string; new_fields: Record<string, unknown>; parsed: Record<string, unknown> }>(
-        `/intel/${id}/chat`,
-        { message, current_parsed: currentParsed },
-      ),
-    summarize: (intelIds: number[]) =>
-      postAPI<{ summary: string; intel_count: number; intel_ids: number[] }>(
-        "/intel/summarize",
-        { intel_ids: intelIds },
-      ),
+    // With onDelta, the reply streams in as it is generated
+    chat: (id: number, message: string, currentParsed: Record<string, unknown>, onDelta?: (text: string) => void) => {
+      const body = { message, current_parsed: currentParsed };
+      return onDelta
+        ? streamAPI<IntelChatResult>(`/intel/${id}/chat`, body, onDelta)
+        : postAPI<IntelChatResult>(`/intel/${id}/chat`, body);
+    },
+    summarize: (intelIds: number[], onDelta?: (text: string) => void) => {
+      const body = { intel_ids: intelIds };
+      return onDelta
+        ? streamAPI<IntelSummary>("/intel/summarize", body, onDelta)
+        : postAPI<IntelSummary>("/intel/summarize", body);
+    },
   },
   deals: {
     list: (view?: string) => fetchAPI<NxDeal[]>(`/deals/?view=${view || "urgency"}`),
@@ -0,0 +1,149 @@
+"""Benchmark the deal detail page: seven reads vs one aggregate statement.
+
+Times ``GET /api/nx/deals/{id}``'s data access both ways against the
+plan_regression bench database:
+
+  - before: get_deal + partners + intel + open TBDs + files + tags +
+    MEDDIC progress, seven statements in one unit_of_work
+  - after:  services.nexus.deals.get_deal_detail, one statement
+
+and checks both produce the same payload for every deal sampled.
+
+Usage:
+    PLAN_DATABASE_URL=postgresql://localhost/nexus_plan \\
+        python scripts/plan_regression.py --seed       # once
+    python scripts/bench_deal_detail.py [--deals 200] [--rounds 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import orjson
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+PLAN_DATABASE_URL = os.getenv("PLAN_DATABASE_URL", "")
+
+
+def _seven_reads(deal_id: int):
+    from database.connection import unit_of_work
+    from services.nexus.deals import (
+        get_deal,
+        get_deal_intel,
+        get_deal_partners,
+        get_meddic_progress,
+    )
+    from services.nexus.documents import get_files_by_deal
+    from services.nexus.tags import get_entity_tags
+    from services.nexus.tbd import get_open_tbds
+
+    with unit_of_work(readonly=True):
+        deal = get_deal(deal_id)
+        if not deal:
+            return None
+        deal["partners"] = get_deal_partners(deal_id)
+        deal["intel"] = get_deal_intel(deal_id)
+        deal["tbds"] = get_open_tbds("deal", deal_id)
+        deal["files"] = get_files_by_deal(deal_id)
+        deal["tags"] = get_entity_tags("deal", deal_id)
+        deal["meddic_progress"] = get_meddic_progress(deal_id, deal=deal)
+    return deal
+
+
+def _one_statement(deal_id: int):
+    from services.nexus.deals import get_deal_detail
+
+    return get_deal_detail(deal_id)
+
+
+def _payload(deal):
+    # Compare what the client receives, not the Python types behind it
+    from backend.responses import dumps
+
+    return orjson.loads(dumps(deal))
+
+
+def _sample_ids(count: int) -> list[int]:
+    """Deals spread over the table, favouring ones with nested rows."""
+    from database.connection import get_connection
+
+    with get_connection(readonly=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """SELECT d.id FROM nx_deal d
+                   WHERE EXISTS (SELECT 1 FROM nx_deal_partner dp WHERE dp.deal_id = d.id)
+                      OR EXISTS (SELECT 1 FROM nx_deal_intel di WHERE di.deal_id = d.id)
+                      OR EXISTS (SELECT 1 FROM nx_file f WHERE f.deal_id = d.id)
+                   ORDER BY (d.id * 7919) %% 1000003
+                   LIMIT %s""",
+                (count,),
+            )
+            return [r[0] for r in cur.fetchall()]
+
+
+def _time(fn, deal_ids: list[int], rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        for deal_id in deal_ids:
+            start = time.perf_counter()
+            fn(deal_id)
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _percentile(samples: list[float], pct: int) -> float:
+    return statistics.quantiles(samples, n=100)[pct - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deals", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if not PLAN_DATABASE_URL:
+        sys.exit("ERROR: PLAN_DATABASE_URL is not set")
+    if PLAN_DATABASE_URL == os.getenv("DATABASE_URL"):
+        sys.exit("ERROR: PLAN_DATABASE_URL must not be the application database")
+
+    # database.* reads these at import time
+    os.environ["DATABASE_URL"] = PLAN_DATABASE_URL
+    os.environ["DB_QUERY_STATS"] = "0"
+    os.environ.pop("DATABASE_REPLICA_URL", None)
+    from database.query_stats import capture_statements
+
+    deal_ids = _sample_ids(args.deals)
+    if not deal_ids:
+        sys.exit("ERROR: no deals found; seed with plan_regression.py --seed")
+
+    print(f"--- Checking payloads ({len(deal_ids)} deals) ---")
+    mismatched = [
+        d for d in deal_ids if _payload(_seven_reads(d)) != _payload(_one_statement(d))
+    ]
+    if mismatched:
+        sys.exit(f"  [FAIL] payload differs for deal ids {mismatched[:10]}")
+    print("  [OK] identical")
+
+    print(f"--- Timing ({args.rounds} rounds) ---")
+    for label, fn in (("seven reads", _seven_reads), ("one statement", _one_statement)):
+        fn(deal_ids[0])  # warm the pool and plan cache
+        with capture_statements() as captured:
+            fn(deal_ids[0])
+        samples = _time(fn, deal_ids, args.rounds)
+        print(
+            f"  {label:<14} statements={len(captured)}  "
+            f"p50={_percentile(samples, 50):.2f}ms  "
+            f"p95={_percentile(samples, 95):.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
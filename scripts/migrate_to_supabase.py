@@ -19,9 +19,16 @@ load_dotenv()
 import psycopg2
 import psycopg2.extras
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database.connection import insert_many
+from database.migrate import migrate
+
 DB_DIR = os.path.join(os.path.dirname(__file__), "..", "database")
 SQLITE_PATH = os.path.join(DB_DIR, "nexus.db")
 
+# Rows per multi-row INSERT in migrate_table()
+BATCH_SIZE = 500
+
 # Tables in foreign-key-safe insertion order
 TABLES = [
     # Legacy SPMS (no FK dependencies first)
@@ -197,30 +204,47 @@ def migrate_table(
         )
         converted_rows.append(converted)
 
-    # Insert into PostgreSQL
-    placeholders = ", ".join(["%s"] * len(common_columns))
-    insert_sql = (
-        f"INSERT INTO {table} ({col_list}) VALUES ({placeholders}) "
-        f"ON CONFLICT DO NOTHING"
-    )
-
+    # Insert into PostgreSQL in multi-row batches. A batch that hits an
+    # orphan FK is retried row by row so only the orphans are skipped.
     inserted = 0
     skipped = 0
     with pg_conn.cursor() as pg_cur:
-        for row in converted_rows:
+        for start in range(0, len(converted_rows), BATCH_SIZE):
+            batch = converted_rows[start : start + BATCH_SIZE]
             try:
-                pg_cur.execute("SAVEPOINT row_sp")
-                pg_cur.execute(insert_sql, row)
-                pg_cur.execute("RELEASE SAVEPOINT row_sp")
-                inserted += 1
+                pg_cur.execute("SAVEPOINT batch_sp")
+                inserted += insert_many(
+                    pg_cur,
+                    table,
+                    common_columns,
+                    batch,
+                    on_conflict="DO NOTHING",
+                    page_size=BATCH_SIZE,
+                )
+                pg_cur.execute("RELEASE SAVEPOINT batch_sp")
+                continue
             except psycopg2.errors.ForeignKeyViolation:
-                pg_cur.execute("ROLLBACK TO SAVEPOINT row_sp")
-                skipped += 1
+                pg_cur.execute("ROLLBACK TO SAVEPOINT batch_sp")
             except Exception as e:
-                pg_cur.execute("ROLLBACK TO SAVEPOINT row_sp")
-                print(f"  [ERROR] {table} row: {e}")
+                pg_cur.execute("ROLLBACK TO SAVEPOINT batch_sp")
+                print(f"  [ERROR] {table} batch: {e}")
                 raise
 
+            for row in batch:
+                try:
+                    pg_cur.execute("SAVEPOINT row_sp")
+                    inserted += insert_many(
+                        pg_cur, table, common_columns, [row], on_conflict="DO NOTHING"
+                    )
+                    pg_cur.execute("RELEASE SAVEPOINT row_sp")
+                except psycopg2.errors.ForeignKeyViolation:
+                    pg_cur.execute("ROLLBACK TO SAVEPOINT row_sp")
+                    skipped += 1
+                except Exception as e:
+                    pg_cur.execute("ROLLBACK TO SAVEPOINT row_sp")
+                    print(f"  [ERROR] {table} row: {e}")
+                    raise
+
     pg_conn.commit()
     skip_note = f" (skipped {skipped} orphan rows)" if skipped else ""
     print(f"  [OK] {table}: {inserted} rows{skip_note}")
@@ -304,14 +328,10 @@ def main():
 
     sqlite_tables = get_sqlite_tables(sqlite_conn)
 
-    # First, run schema on PostgreSQL
-    schema_path = os.path.join(DB_DIR, "schema.sql")
+    # First, bring the PostgreSQL schema up to date
     print("--- Initializing PostgreSQL schema ---")
-    with pg_conn.cursor() as cur:
-        with open(schema_path, "r") as f:
-            cur.execute(f.read())
-    pg_conn.commit()
-    print("  [OK] Schema applied\n")
+    version = migrate(pg_conn)
+    print(f"  [OK] Schema at version {version}\n")
 
     # Migrate each table
     print("--- Migrating data ---")
@@ -0,0 +1,658 @@
+"""Query-plan regression suite for services/nexus.
+
+Seeds a dedicated PostgreSQL database with production-like volume, runs the
+nexus service functions once to capture the SQL each one issues, then
+``EXPLAIN (ANALYZE, BUFFERS)``s every distinct statement and reports:
+
+  - sequential scans on large tables (reltuples >= LARGE_TABLE_ROWS)
+  - plan cost regressions against scripts/plan_baseline.json
+  - index suggestions for the filters behind those scans
+
+Usage:
+    PLAN_DATABASE_URL=postgresql://localhost/nexus_plan \\
+        python scripts/plan_regression.py --seed           # first run
+    python scripts/plan_regression.py                      # check
+    python scripts/plan_regression.py --update-baseline    # accept plans
+
+Exits 1 when a statement picks up a new large-table seq scan or its
+estimated cost exceeds the baseline by more than --tolerance. --seed
+TRUNCATEs every nx_* table, so PLAN_DATABASE_URL must never be the app's
+DATABASE_URL.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import psycopg2.errors
+from dotenv import load_dotenv
+
+load_dotenv()
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+PLAN_DATABASE_URL = os.getenv("PLAN_DATABASE_URL", "")
+BASELINE_PATH = Path(__file__).resolve().parent / "plan_baseline.json"
+
+LARGE_TABLE_ROWS = 10_000
+
+VOLUME = {
+    "clients": 50_000,
+    "partners": 2_000,
+    "contacts": 100_000,
+    "deals": 200_000,
+    "intel": 100_000,
+    "intel_fields": 1_000_000,
+    "meetings": 200_000,
+    "reminders": 50_000,
+    "documents": 50_000,
+    "files": 20_000,
+    "tbds": 50_000,
+    "subsidies": 5_000,
+    "tags": 200,
+}
+
+# Deterministic spread: (g * prime) % n instead of random(), so every seed
+# produces identical data and comparable plans.
+SEED_SQL = """
+TRUNCATE nx_client, nx_partner, nx_contact, nx_intel, nx_tag, nx_entity_tag,
+         nx_tbd_item, nx_document, nx_deal, nx_deal_partner, nx_deal_intel,
+         nx_meeting, nx_reminder, nx_file, nx_intel_entity, nx_intel_field,
+         nx_subsidy, nx_subsidy_deadline, nx_subsidy_deal
+RESTART IDENTITY CASCADE;
+
+INSERT INTO nx_client (name, industry, aliases, budget_range, status, created_at, updated_at)
+SELECT '客戶' || g || ' 股份有限公司',
+       (ARRAY['製造', '金融', '零售', '醫療', '半導體'])[1 + g %% 5],
+       CASE WHEN g %% 10 = 0 THEN 'ALIAS' || g END,
+       (ARRAY['<100K', '100-500K', '500K-1M', '>1M'])[1 + g %% 4],
+       CASE WHEN g %% 20 = 0 THEN 'inactive' ELSE 'active' END,
+       now() - ((g * 37) %% 730) * interval '1 day',
+       now() - ((g * 41) %% 365) * interval '1 day'
+FROM generate_series(1, %(clients)s) g;
+
+INSERT INTO nx_partner (name, trust_level, team_size, created_at, updated_at)
+SELECT '夥伴' || g, (ARRAY['unverified', 'testing', 'verified', 'core_team'])[1 + g %% 4],
+       '10-50', now() - (g %% 365) * interval '1 day', now() - (g %% 90) * interval '1 day'
+FROM generate_series(1, %(partners)s) g;
+
+INSERT INTO nx_contact (name, title, email, org_type, org_id, role, created_at, updated_at)
+SELECT '聯絡人' || g, '經理', 'c' || g || '@example.com',
+       CASE WHEN g %% 5 = 0 THEN 'partner' ELSE 'client' END,
+       CASE WHEN g %% 5 = 0 THEN 1 + (g * 7) %% %(partners)s ELSE 1 + (g * 7) %% %(clients)s END,
+       (ARRAY['champion', 'decision_maker', 'user', NULL])[1 + g %% 4],
+       now() - ((g * 13) %% 730) * interval '1 day', now() - ((g * 17) %% 365) * interval '1 day'
+FROM generate_series(1, %(contacts)s) g;
+
+INSERT INTO nx_deal (name, client_id, stage, budget_range, budget_amount, status,
+                     meddic_json, last_activity_at, created_at, updated_at)
+SELECT '商機' || g, 1 + (g * 7919) %% %(clients)s,
+       (ARRAY['L0', 'L1', 'L2', 'L3', 'L4', 'L5', 'L6', 'L7'])[1 + g %% 8],
+       '100-500K', (g %% 50) * 10000,
+       (ARRAY['active', 'active', 'active', 'active', 'won', 'lost'])[1 + g %% 6],
+       jsonb_build_object('metrics', 'm' || g),
+       now() - ((g * 31) %% 365) * interval '1 day',
+       now() - ((g * 29) %% 730) * interval '1 day',
+       now() - ((g * 23) %% 365) * interval '1 day'
+FROM generate_series(1, %(deals)s) g;
+
+INSERT INTO nx_intel (title, raw_input, parsed_json, status, created_at, updated_at)
+SELECT '情報' || g, '與客戶' || (1 + (g * 11) %% %(clients)s) || ' 開會討論 AOI 需求 ' || g,
+       jsonb_build_object('company_name', '客戶' || (1 + (g * 11) %% %(clients)s)),
+       (ARRAY['draft', 'confirmed', 'confirmed'])[1 + g %% 3],
+       now() - ((g * 19) %% 730) * interval '1 day',
+       now() - ((g * 19) %% 730) * interval '1 day'
+FROM generate_series(1, %(intel)s) g;
+
+INSERT INTO nx_intel_field (intel_id, field_key, field_value)
+SELECT 1 + g / 10,
+       (ARRAY['company_name', 'contact_name', 'budget', 'timeline', 'pain_point',
+              'competitor', 'role', 'industry', 'product', 'next_step'])[1 + g %% 10],
+       'v' || ((g * 7) %% 5000)
+FROM generate_series(0, %(intel_fields)s - 1) g;
+
+INSERT INTO nx_deal_partner (deal_id, partner_id, role)
+SELECT 1 + g, 1 + (g * 3) %% %(partners)s, 'SI'
+FROM generate_series(0, %(deals)s / 2 - 1) g;
+
+INSERT INTO nx_deal_intel (deal_id, intel_id)
+SELECT 1 + g, 1 + (g * 13) %% %(intel)s FROM generate_series(0, %(deals)s - 1) g;
+
+INSERT INTO nx_intel_entity (intel_id, entity_type, entity_id)
+SELECT 1 + g / 2, (ARRAY['client', 'contact'])[1 + g %% 2], 1 + (g * 17) %% %(clients)s
+FROM generate_series(0, %(intel)s * 2 - 1) g;
+
+INSERT INTO nx_meeting (deal_id, title, meeting_date, duration_minutes, status)
+SELECT 1 + (g * 101) %% %(deals)s, '會議' || g,
+       now() + (((g * 43) %% 730) - 365) * interval '1 day' + (g %% 10) * interval '1 hour',
+       60, (ARRAY['scheduled', 'completed'])[1 + g %% 2]
+FROM generate_series(1, %(meetings)s) g;
+
+INSERT INTO nx_reminder (deal_id, reminder_type, due_date, content, resolved)
+SELECT 1 + (g * 103) %% %(deals)s, 'push',
+       now() + (((g * 47) %% 120) - 60) * interval '1 day', '提醒' || g, g %% 3 = 0
+FROM generate_series(1, %(reminders)s) g;
+
+INSERT INTO nx_document (client_id, doc_type, status, sign_date, expiry_date)
+SELECT 1 + (g - 1) %% %(clients)s, (ARRAY['NDA', 'MOU'])[1 + g %% 2],
+       (ARRAY['pending', 'signed'])[1 + g %% 2],
+       current_date - (g %% 365), current_date + ((g * 53) %% 730) - 100
+FROM generate_series(1, %(documents)s) g;
+
+INSERT INTO nx_file (deal_id, intel_id, file_type, file_name, file_path, parse_status)
+SELECT 1 + (g * 7) %% %(deals)s, 1 + (g * 7) %% %(intel)s, 'attachment',
+       'f' || g || '.pdf', '/uploads/f' || g || '.pdf', 'parsed'
+FROM generate_series(1, %(files)s) g;
+
+INSERT INTO nx_tbd_item (question, linked_type, linked_id, source, resolved, created_at)
+SELECT '待確認' || g, (ARRAY['deal', 'intel', 'meeting'])[1 + g %% 3],
+       1 + (g * 7) %% %(deals)s, 'skip', g %% 4 = 0,
+       now() - ((g * 7) %% 60) * interval '1 day'
+FROM generate_series(1, %(tbds)s) g;
+
+INSERT INTO nx_subsidy (name, program_type, stage, client_id, deadline_date, status)
+SELECT '補助案' || g, 'sbir', (ARRAY['draft', 'applying', 'reviewing'])[1 + g %% 3],
+       1 + (g * 7) %% %(clients)s, current_date + ((g * 11) %% 365) - 30,
+       CASE WHEN g %% 10 = 0 THEN 'closed' ELSE 'active' END
+FROM generate_series(1, %(subsidies)s) g;
+
+INSERT INTO nx_subsidy_deadline (subsidy_id, label, deadline_date, status)
+SELECT 1 + (g - 1) %% %(subsidies)s, '梯次' || g, current_date + ((g * 13) %% 365) - 30, 'open'
+FROM generate_series(1, %(subsidies)s * 2) g;
+
+INSERT INTO nx_subsidy_deal (subsidy_id, deal_id)
+SELECT g, 1 + (g * 37) %% %(deals)s FROM generate_series(1, %(subsidies)s) g;
+
+INSERT INTO nx_tag (name, category)
+SELECT 'tag' || g, (ARRAY['industry', 'tech', 'status'])[1 + g %% 3]
+FROM generate_series(1, %(tags)s) g;
+
+INSERT INTO nx_entity_tag (entity_type, entity_id, tag_id)
+SELECT 'deal', 1 + g, 1 + g %% %(tags)s FROM generate_series(0, %(deals)s / 2 - 1) g;
+"""
+
+
+def _second_page(fn, keyset, *args, limit=50):
+    """Fetch page 1, then the keyset page after it (both get captured)."""
+    rows = fn(*args, limit)
+    return fn(*args, limit, keyset.next_cursor(rows, limit))
+
+
+def _catalog():
+    """(label, callable) for every nexus service function that touches SQL.
+
+    Writes run too; the whole capture pass is rolled back.
+    """
+    from services.nexus import (
+        calendar,
+        clients,
+        contacts,
+        daily_digest,
+        deals,
+        documents,
+        intel,
+        materialize,
+        partners,
+        search,
+        subsidies,
+        tags,
+        tbd,
+    )
+
+    return [
+        # calendar
+        ("create_meeting", lambda: calendar.create_meeting(1, "m", "2026-03-01T10:00")),
+        ("get_meeting", lambda: calendar.get_meeting(1)),
+        ("get_meetings_by_date", lambda: calendar.get_meetings_by_date("2026-03-01")),
+        ("get_meetings_by_month", lambda: calendar.get_meetings_by_month(2026, 3)),
+        (
+            "get_meetings_by_range",
+            lambda: calendar.get_meetings_by_range("2026-03-01", "2026-03-31"),
+        ),
+        ("get_meetings_by_deal", lambda: calendar.get_meetings_by_deal(1)),
+        ("update_meeting", lambda: calendar.update_meeting(1, notes="n")),
+        ("complete_meeting", lambda: calendar.complete_meeting(2)),
+        (
+            "create_reminder",
+            lambda: calendar.create_reminder("2026-03-01", "r", deal_id=1),
+        ),
+        ("get_reminders_by_date", lambda: calendar.get_reminders_by_date("2026-03-01")),
+        ("get_reminders_by_month", lambda: calendar.get_reminders_by_month(2026, 3)),
+        ("resolve_reminder", lambda: calendar.resolve_reminder(1)),
+        ("get_pending_reminders", calendar.get_pending_reminders),
+        ("delete_meeting", lambda: calendar.delete_meeting(3)),
+        # clients
+        ("create_client", lambda: clients.create_client("新客戶")),
+        ("get_client", lambda: clients.get_client(1)),
+        ("get_all_clients", clients.get_all_clients),
+        ("get_all_clients(active)", lambda: clients.get_all_clients("active")),
+        (
+            "get_all_clients(page)",
+            lambda: _second_page(clients.get_all_clients, clients.CLIENT_KEYSET, None),
+        ),
+        ("update_client", lambda: clients.update_client(1, notes="n")),
+        ("find_client_by_name", lambda: clients.find_client_by_name("客戶123")),
+        # contacts
+        ("create_contact", lambda: contacts.create_contact("新聯絡人", "client", 1)),
+        ("get_contact", lambda: contacts.get_contact(1)),
+        ("get_contacts_by_org", lambda: contacts.get_contacts_by_org("client", 1)),
+        ("get_all_contacts", contacts.get_all_contacts),
+        (
+            "get_all_contacts(page)",
+            lambda: _second_page(contacts.get_all_contacts, contacts.CONTACT_KEYSET),
+        ),
+        ("update_contact", lambda: contacts.update_contact(1, notes="n")),
+        ("find_contact", lambda: contacts.find_contact(name="聯絡人12")),
+        ("find_contact(email)", lambda: contacts.find_contact(email="c12@example.com")),
+        # deals
+        ("create_deal", lambda: deals.create_deal("新商機", 1)),
+        ("get_deal", lambda: deals.get_deal(1)),
+        ("get_deal_detail", lambda: deals.get_deal_detail(1)),
+        ("get_all_deals", deals.get_all_deals),
+        ("get_deals_by_urgency", deals.get_deals_by_urgency),
+        (
+            "get_all_deals(page)",
+            lambda: _second_page(deals.get_all_deals, deals.DEAL_KEYSET, "active"),
+        ),
+        (
+            "get_deals_by_urgency(page)",
+            lambda: _second_page(deals.get_deals_by_urgency, deals.DEAL_KEYSET),
+        ),
+        ("get_deals_needing_push", deals.get_deals_needing_push),
+        ("update_deal", lambda: deals.update_deal(1, timeline="q3")),
+        ("advance_stage", lambda: deals.advance_stage(1, "L2")),
+        ("close_deal", lambda: deals.close_deal(4, "won")),
+        ("get_deals_by_client", lambda: deals.get_deals_by_client(1)),
+        ("get_deals_by_partner", lambda: deals.get_deals_by_partner(1)),
+        ("touch_deal", lambda: deals.touch_deal(1)),
+        ("get_meddic_progress", lambda: deals.get_meddic_progress(1)),
+        ("add_partner_to_deal", lambda: deals.add_partner_to_deal(1, 2)),
+        ("get_deal_partners", lambda: deals.get_deal_partners(1)),
+        ("remove_partner_from_deal", lambda: deals.remove_partner_from_deal(1, 2)),
+        ("link_intel_to_deal", lambda: deals.link_intel_to_deal(1, 2)),
+        ("get_deal_intel", lambda: deals.get_deal_intel(1)),
+        ("unlink_intel_from_deal", lambda: deals.unlink_intel_from_deal(1, 2)),
+        # documents
+        ("get_all_documents", documents.get_all_documents),
+        (
+            "get_all_documents(page)",
+            lambda: _second_page(
+                documents.get_all_documents, documents.DOCUMENT_KEYSET
+            ),
+        ),
+        ("get_documents_by_client", lambda: documents.get_documents_by_client(1)),
+        ("update_document", lambda: documents.update_document(1, notes="n")),
+        ("get_expiring_documents", documents.get_expiring_documents),
+        (
+            "create_file",
+            lambda: documents.create_file(1, file_name="a", file_path="/a"),
+        ),
+        ("get_files_by_deal", lambda: documents.get_files_by_deal(1)),
+        ("get_files_by_intel", lambda: documents.get_files_by_intel(1)),
+        ("update_file", lambda: documents.update_file(1, file_name="b")),
+        ("update_file_parse", lambda: documents.update_file_parse(1, "{}")),
+        ("get_file", lambda: documents.get_file(1)),
+        ("delete_file", lambda: documents.delete_file(2)),
+        # intel
+        ("create_intel", lambda: intel.create_intel("raw")),
+        ("get_intel", lambda: intel.get_intel(1)),
+        ("get_intel_by_ids", lambda: intel.get_intel_by_ids([1, 2, 3])),
+        ("get_all_intel", intel.get_all_intel),
+        ("get_all_intel(draft)", lambda: intel.get_all_intel("draft")),
+        (
+            "get_all_intel(page)",
+            lambda: _second_page(intel.get_all_intel, intel.INTEL_KEYSET, None),
+        ),
+        ("confirm_intel", lambda: intel.confirm_intel(1)),
+        ("update_intel", lambda: intel.update_intel(1, title="t")),
+        ("get_intel_linked_deals", lambda: intel.get_intel_linked_deals(1)),
+        ("link_intel_entity", lambda: intel.link_intel_entity(1, "client", 9)),
+        ("get_intel_entities", lambda: intel.get_intel_entities(1)),
+        ("get_entity_intel", lambda: intel.get_entity_intel("client", 1)),
+        (
+            "materialize_intel_fields",
+            lambda: intel.materialize_intel_fields(1, {"a": "b", "c": ["d", "e"]}),
+        ),
+        ("delete_intel", lambda: intel.delete_intel(5)),
+        ("scan_raw_for_entities", lambda: materialize.scan_raw_for_entities("客戶12")),
+        ("materialize_intel", lambda: materialize.materialize_intel(3)),
+        # partners
+        ("create_partner", lambda: partners.create_partner("新夥伴")),
+        ("get_partner", lambda: partners.get_partner(1)),
+        ("get_all_partners", partners.get_all_partners),
+        ("update_partner", lambda: partners.update_partner(1, notes="n")),
+        ("update_trust_level", lambda: partners.update_trust_level(1, "verified")),
+        ("find_partner_by_name", lambda: partners.find_partner_by_name("夥伴12")),
+        # search
+        ("global_search", lambda: search.global_search("客戶12")),
+        (
+            "search_intel_by_field",
+            lambda: search.search_intel_by_field("budget", "v12"),
+        ),
+        # subsidies
+        ("create_subsidy", lambda: subsidies.create_subsidy("新補助")),
+        ("get_subsidy", lambda: subsidies.get_subsidy(1)),
+        ("get_all_subsidies", subsidies.get_all_subsidies),
+        (
+            "get_all_subsidies(deadline)",
+            lambda: subsidies.get_all_subsidies(view="deadline"),
+        ),
+        ("get_subsidies_by_client", lambda: subsidies.get_subsidies_by_client(1)),
+        ("update_subsidy", lambda: subsidies.update_subsidy(1, notes="n")),
+        ("subsidy_advance_stage", lambda: subsidies.advance_stage(1, "applying")),
+        ("close_subsidy", lambda: subsidies.close_subsidy(2)),
+        ("link_deal", lambda: subsidies.link_deal(1, 5)),
+        ("get_subsidy_deals", lambda: subsidies.get_subsidy_deals(1)),
+        ("unlink_deal", lambda: subsidies.unlink_deal(1, 5)),
+        ("add_deadline", lambda: subsidies.add_deadline(1, "x", "2026-05-01")),
+        ("get_deadlines", lambda: subsidies.get_deadlines(1)),
+        ("update_deadline", lambda: subsidies.update_deadline(1, notes="n")),
+        ("delete_deadline", lambda: subsidies.delete_deadline(2)),
+        ("get_subsidies_expiring_soon", subsidies.get_subsidies_expiring_soon),
+        # tags
+        ("create_tag", lambda: tags.create_tag("新標籤", "tech")),
+        ("get_all_tags", tags.get_all_tags),
+        ("tag_entity", lambda: tags.tag_entity("client", 1, 1)),
+        ("get_entity_tags", lambda: tags.get_entity_tags("deal", 1)),
+        ("get_entities_by_tag", lambda: tags.get_entities_by_tag(1)),
+        ("search_by_tag_name", lambda: tags.search_by_tag_name("tag1")),
+        ("untag_entity", lambda: tags.untag_entity("client", 1, 1)),
+        # tbd
+        ("create_tbd", lambda: tbd.create_tbd("q", "deal", 1)),
+        ("get_tbd", lambda: tbd.get_tbd(1)),
+        ("get_open_tbds", tbd.get_open_tbds),
+        ("get_open_tbds(linked)", lambda: tbd.get_open_tbds("deal", 1)),
+        ("get_all_tbds", tbd.get_all_tbds),
+        (
+            "get_all_tbds(page)",
+            lambda: _second_page(tbd.get_all_tbds, tbd.TBD_KEYSET, True),
+        ),
+        ("resolve_tbd", lambda: tbd.resolve_tbd(1)),
+        ("get_stale_tbds", tbd.get_stale_tbds),
+        ("delete_tbd", lambda: tbd.delete_tbd(2)),
+        # digest
+        ("build_daily_digest", daily_digest.build_daily_digest),
+        # deletes last, so earlier calls still find their rows. Every seeded
+        # client/partner is FK-referenced, so those deletes target id 0.
+        ("delete_contact", lambda: contacts.delete_contact(6)),
+        ("delete_partner", lambda: partners.delete_partner(0)),
+        ("delete_client", lambda: clients.delete_client(0)),
+    ]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def capture() -> list[tuple[str, str, object]]:
+    """Run the catalog inside one rolled-back transaction; return the
+    distinct (caller, query, params) statements it issued."""
+    from database.connection import unit_of_work
+    from database.query_stats import capture_statements
+
+    failures = []
+    with capture_statements() as captured:
+        try:
+            with unit_of_work() as conn:
+                for label, call in _catalog():
+                    with conn.cursor() as cur:
+                        cur.execute("SAVEPOINT plan_call")
+                    try:
+                        call()
+                    except Exception as e:  # keep going; report at the end
+                        failures.append((label, e))
+                        with conn.cursor() as cur:
+                            cur.execute("ROLLBACK TO SAVEPOINT plan_call")
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    for label, e in failures:
+        print(f"  [WARN] {label} failed during capture: {e}")
+
+    seen = set()
+    statements = []
+    for caller, query, params in captured:
+        text = query.decode() if isinstance(query, bytes) else str(query)
+        if not re.match(r"\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", text, re.I):
+            continue
+        key = _key(caller, text)
+        if key not in seen:
+            seen.add(key)
+            statements.append((caller, query, params))
+    return statements
+
+
+def _key(caller: str, text: str) -> str:
+    from database.query_stats import _normalize
+
+    return f"{caller}:{_normalize(text)[0]}"
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+_LIKE_COL = re.compile(r"\(?(?:\w+\.)?(\w+)\)?(?:::text)? ~~\*? '%")
+_DATE_CAST = re.compile(r"\((?:\w+\.)?(\w+)\)::date")
+_FUNC_COL = re.compile(
+    r"(to_char|lower|upper|EXTRACT\(\w+ FROM)\s*\(?\(?(?:now\(\) - )?(?:\w+\.)?(\w+)"
+)
+_CMP_COL = re.compile(r"\(?(?:\w+\.)?(\w+) (?:=|<|>|<=|>=|IS) ")
+
+
+def _suggest(table: str, filt: str) -> str:
+    if _LIKE_COL.search(filt):
+        cols = sorted(set(_LIKE_COL.findall(filt)))
+        return (
+            f"leading-wildcard LIKE on {', '.join(cols)}: btree cannot help; "
+            f"CREATE EXTENSION pg_trgm + CREATE INDEX ON {table} USING gin "
+            f"({cols[0]} gin_trgm_ops)"
+        )
+    if _DATE_CAST.search(filt):
+        col = _DATE_CAST.search(filt).group(1)
+        return (
+            f"{col}::DATE cast defeats the index on {col}; compare "
+            f"{col} >= start AND {col} < start + 1 day instead"
+        )
+    func = _FUNC_COL.search(filt)
+    if func and func.group(1) in ("lower", "upper"):
+        col = func.group(2)
+        return f"CREATE INDEX ON {table} ({func.group(1)}({col}))"
+    if func:
+        col = func.group(2)
+        return (
+            f"{func.group(1).split('(')[0]}({col}) in WHERE defeats the index on "
+            f"{col}; rewrite as a range on {col} itself"
+        )
+    cols = list(dict.fromkeys(_CMP_COL.findall(filt)))
+    if cols:
+        return f"CREATE INDEX ON {table} ({', '.join(cols[:3])})"
+    return "full-table read; paginate or add a selective predicate"
+
+
+def _severity(scan: dict) -> int:
+    """Sort key: filters no plain index can serve first (LIKE '%q%', casts)."""
+    filt = scan["filter"]
+    if _LIKE_COL.search(filt):
+        return 0
+    if _DATE_CAST.search(filt) or _FUNC_COL.search(filt):
+        return 1
+    return 2 if filt else 3
+
+
+def explain(statements) -> dict[str, dict]:
+    from database.connection import get_connection
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT relname FROM pg_class WHERE relkind = 'r' "
+                "AND relnamespace = 'public'::regnamespace AND reltuples >= %s",
+                (LARGE_TABLE_ROWS,),
+            )
+            large = {r[0] for r in cur.fetchall()}
+
+    results = {}
+    for caller, query, params in statements:
+        text = query.decode() if isinstance(query, bytes) else str(query)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                sql = cur.mogrify(query, params) if params is not None else query
+                if isinstance(sql, bytes):
+                    sql = sql.decode()
+                try:
+                    cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql)
+                    doc = cur.fetchone()[0][0]
+                except psycopg2.errors.ForeignKeyViolation:
+                    # Parameters point at a row the rolled-back capture created
+                    print(f"  [SKIP] {caller}: depends on rows from the capture pass")
+                    continue
+                except Exception as e:
+                    print(f"  [WARN] EXPLAIN failed for {caller}: {e}")
+                    conn.rollback()
+                    continue
+                finally:
+                    conn.rollback()  # EXPLAIN ANALYZE really runs writes
+        root = doc["Plan"]
+        seq_scans = []
+        for node in _walk(root):
+            if node["Node Type"] == "Seq Scan" and node["Relation Name"] in large:
+                filt = node.get("Filter", "")
+                seq_scans.append(
+                    {
+                        "table": node["Relation Name"],
+                        "filter": filt,
+                        "suggestion": _suggest(node["Relation Name"], filt),
+                    }
+                )
+        results[_key(caller, text)] = {
+            "caller": caller,
+            "sql": " ".join(text.split())[:300],
+            "total_cost": root["Total Cost"],
+            "time_ms": round(doc["Execution Time"], 2),
+            "buffers": root.get("Shared Hit Blocks", 0)
+            + root.get("Shared Read Blocks", 0),
+            "seq_scans": seq_scans,
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for key, r in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if r["total_cost"] > base["total_cost"] * (1 + tolerance):
+            regressions.append(
+                f"{r['caller']}: cost {base['total_cost']:.0f} -> {r['total_cost']:.0f}"
+            )
+        new_scans = {s["table"] for s in r["seq_scans"]} - set(base["seq_scans"])
+        if new_scans:
+            regressions.append(
+                f"{r['caller']}: new seq scan on {', '.join(sorted(new_scans))}"
+            )
+    return regressions
+
+
+def report(results: dict, regressions: list[str], baseline: dict) -> None:
+    print(f"\n--- {len(results)} statements (slowest first) ---")
+    for r in sorted(results.values(), key=lambda r: -r["time_ms"]):
+        flag = " SEQ" if r["seq_scans"] else ""
+        print(
+            f"  {r['time_ms']:>9.2f}ms  cost={r['total_cost']:>11.0f}  "
+            f"buf={r['buffers']:>7}{flag}  {r['caller']}"
+        )
+
+    scans = [(r, s) for r in results.values() for s in r["seq_scans"]]
+    print(f"\n--- Sequential scans on large tables ({len(scans)}) ---")
+    for r, s in sorted(scans, key=lambda x: (_severity(x[1]), -x[0]["time_ms"])):
+        print(f"  {r['caller']} -> {s['table']}")
+        if s["filter"]:
+            print(f"      filter: {s['filter'][:160]}")
+        print(f"      fix:    {s['suggestion']}")
+
+    new = [r["caller"] for k, r in results.items() if k not in baseline]
+    if baseline and new:
+        print(f"\n--- Not in baseline ({len(new)}) ---")
+        for caller in sorted(new):
+            print(f"  {caller}")
+
+    print(f"\n--- Regressions ({len(regressions)}) ---")
+    for line in regressions:
+        print(f"  [FAIL] {line}")
+    if not regressions:
+        print("  [OK] none")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="(re)seed bench volume")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    if not PLAN_DATABASE_URL:
+        sys.exit("ERROR: PLAN_DATABASE_URL is not set")
+    if PLAN_DATABASE_URL == os.getenv("DATABASE_URL"):
+        sys.exit("ERROR: PLAN_DATABASE_URL must not be the application database")
+
+    # database.* reads these at import time
+    os.environ["DATABASE_URL"] = PLAN_DATABASE_URL
+    os.environ["DB_QUERY_STATS"] = "0"
+    os.environ.pop("DATABASE_REPLICA_URL", None)
+    from database.connection import get_connection, init_db
+
+    init_db()
+    if args.seed:
+        print("--- Seeding ---")
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(SEED_SQL, VOLUME)
+        with get_connection() as conn:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute("VACUUM ANALYZE")
+            conn.autocommit = False
+        print("  [OK] " + ", ".join(f"{k}={v:,}" for k, v in VOLUME.items()))
+
+    print("--- Capturing service SQL ---")
+    statements = capture()
+    print(f"  [OK] {len(statements)} distinct statements")
+
+    results = explain(statements)
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+    report(results, regressions, baseline)
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(
+            json.dumps(
+                {
+                    k: {
+                        "caller": r["caller"],
+                        "sql": r["sql"],
+                        "total_cost": r["total_cost"],
+                        "seq_scans": sorted({s["table"] for s in r["seq_scans"]}),
+                    }
+                    for k, r in sorted(results.items())
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"\nBaseline written to {BASELINE_PATH}")
+        return
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
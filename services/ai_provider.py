@@ -1,41 +1,110 @@
 """Multi-provider AI dispatcher.
 
 Supports Google Gemini, Azure OpenAI, and Anthropic Claude.
-Provider is selected via the AI_PROVIDER env var (default: "gemini").
+Provider is selected via the AI_PROVIDER env var (default: "gemini"); a
+comma-separated list such as "gemini,anthropic" is a fallback chain.
+Transient errors (429, 5xx, connection failures) are retried with jittered
+backoff, honouring Retry-After, and a per-provider circuit breaker skips a
+provider that keeps failing (see "Retries, circuit breakers and fallback").
 SDKs are lazy-imported so only the active provider's SDK is required.
+SDK clients are built once per process and kept in a registry, so calls
+reuse their HTTP connection pool (keep-alive) instead of starting cold.
+
+The ``*_async`` variants use each SDK's async client: no thread is held
+while the model works, and cancelling the awaiting task (or hitting
+``timeout``, default AI_TIMEOUT_SECONDS) aborts the HTTP request.
+stream_ai_response_async() yields the text as the model produces it.
+
+Replies to prompts registered with set_cache_ttl() are cached by content:
+provider, model, system prompt and input (see "Response cache" below), so
+repeating such a request costs no tokens.
 """
 
+import asyncio
+import collections
+import email.utils
+import functools
+import hashlib
+import importlib
+import itertools
 import logging
 import os
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import NamedTuple
+
+from database.connection import (
+    get_async_connection,
+    get_connection,
+    in_unit_of_work,
+)
+from database.query_stats import add_timing
+from services import metrics
 
 logger = logging.getLogger(__name__)
 
+AI_TIMEOUT_SECONDS = float(os.getenv("AI_TIMEOUT_SECONDS", "120"))
+
 _VALID_PROVIDERS = ("gemini", "azure_openai", "anthropic")
+_SDK_MODULES = {
+    "gemini": "google.generativeai",
+    "azure_openai": "openai",
+    "anthropic": "anthropic",
+}
+
+
+def get_provider_names() -> list[str]:
+    """Return the providers listed in AI_PROVIDER, in fallback order."""
+    names = [p.strip() for p in os.getenv("AI_PROVIDER", "gemini").lower().split(",")]
+    return [p for p in names if p] or ["gemini"]
 
 
 def get_provider_name() -> str:
-    """Return the active AI provider name from AI_PROVIDER env var."""
-    return os.getenv("AI_PROVIDER", "gemini").lower().strip()
+    """Return the primary AI provider (the first one in AI_PROVIDER)."""
+    return get_provider_names()[0]
+
+
+def warm_up() -> None:
+    """Import the configured providers' SDKs ahead of the first AI call."""
+    for provider in get_provider_names():
+        module = _SDK_MODULES.get(provider)
+        if module:
+            importlib.import_module(module)
 
 
 def check_ai_available() -> tuple[bool, str]:
-    """Check whether the active provider's required env vars are set.
+    """Check whether a configured provider has its required env vars set.
 
     Returns:
-        (True, provider_name) if ready, or (False, error_message) if not.
+        (True, provider_names) listing the usable providers in fallback
+        order, comma-separated, or (False, error_message) if there are none.
     """
-    provider = get_provider_name()
+    ready, problems = [], []
+    for provider in get_provider_names():
+        problem = _provider_problem(provider)
+        if problem:
+            problems.append(problem)
+        else:
+            ready.append(provider)
+    if not ready:
+        return False, "\n".join(problems)
+    return True, ",".join(ready)
+
 
+def _provider_problem(provider: str) -> str | None:
+    """Why ``provider`` can't be used, or None if its config is complete."""
     if provider not in _VALID_PROVIDERS:
-        return False, (
+        return (
             f'AI_PROVIDER="{provider}" 不是有效的選項。'
             f"請設定為：{', '.join(_VALID_PROVIDERS)}"
         )
 
     if provider == "gemini":
         if not os.getenv("GOOGLE_API_KEY"):
-            return False, "請在 .env 設定 GOOGLE_API_KEY 以啟用 Google Gemini。"
-        return True, provider
+            return "請在 .env 設定 GOOGLE_API_KEY 以啟用 Google Gemini。"
+        return None
 
     if provider == "azure_openai":
         missing = [
@@ -48,13 +117,72 @@ def check_ai_available() -> tuple[bool, str]:
             if not os.getenv(v)
         ]
         if missing:
-            return False, f"Azure OpenAI 缺少環境變數：{', '.join(missing)}"
-        return True, provider
+            return f"Azure OpenAI 缺少環境變數：{', '.join(missing)}"
+        return None
 
     # anthropic
     if not os.getenv("ANTHROPIC_API_KEY"):
-        return False, "請在 .env 設定 ANTHROPIC_API_KEY 以啟用 Anthropic Claude。"
-    return True, provider
+        return "請在 .env 設定 ANTHROPIC_API_KEY 以啟用 Anthropic Claude。"
+    return None
+
+
+AI_LATENCY = metrics.Histogram(
+    "ai_request_duration_seconds",
+    "AI provider call latency.",
+    ("provider", "kind"),
+)
+AI_ERRORS = metrics.Counter(
+    "ai_request_errors_total",
+    "AI provider calls that raised, by exception type.",
+    ("provider", "kind", "error"),
+)
+AI_FIRST_TOKEN = metrics.Histogram(
+    "ai_first_token_seconds",
+    "Time from starting a streamed AI call to its first text chunk.",
+    ("provider",),
+)
+
+
+def _timed(kind: str):
+    """Record call latency / errors per provider (the wrapped function's
+    first argument), and report the duration as "ai" time for the request's
+    Server-Timing. Wraps sync and async calls; a cancelled async call counts
+    as a CancelledError."""
+
+    def decorate(fn):
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(provider, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await fn(provider, *args, **kwargs)
+                except (Exception, asyncio.CancelledError) as e:
+                    AI_ERRORS.inc(provider, kind, type(e).__name__)
+                    raise
+                finally:
+                    elapsed = time.perf_counter() - start
+                    AI_LATENCY.observe(elapsed, provider, kind)
+                    add_timing("ai", elapsed)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(provider, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(provider, *args, **kwargs)
+            except Exception as e:
+                AI_ERRORS.inc(provider, kind, type(e).__name__)
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                AI_LATENCY.observe(elapsed, provider, kind)
+                add_timing("ai", elapsed)
+
+        return wrapper
+
+    return decorate
 
 
 def generate_ai_vision_response(
@@ -62,6 +190,7 @@ def generate_ai_vision_response(
     user_text: str,
     image_bytes: bytes,
     mime_type: str = "image/jpeg",
+    validate: Callable[[str], bool] | None = None,
 ) -> str:
     """Dispatch a vision AI call (text + image) to the active provider.
 
@@ -70,12 +199,29 @@ def generate_ai_vision_response(
         user_text: The user's input text (can be empty).
         image_bytes: Raw image bytes.
         mime_type: MIME type of the image.
+        validate: See generate_ai_response().
 
     Returns:
         The raw text response from the AI model.
     """
-    provider = get_provider_name()
+    slot = _cache_slot("vision", system_prompt, user_text, image_bytes, mime_type)
+    response = _cache_get(slot)
+    if response is None:
+        response = _call_with_fallback(
+            _generate_vision, system_prompt, user_text, image_bytes, mime_type
+        )
+        _cache_put(slot, response, validate)
+    return response
+
 
+@_timed("vision")
+def _generate_vision(
+    provider: str,
+    system_prompt: str,
+    user_text: str,
+    image_bytes: bytes,
+    mime_type: str,
+) -> str:
     if provider == "gemini":
         return _call_gemini_vision(system_prompt, user_text, image_bytes, mime_type)
     if provider == "azure_openai":
@@ -88,22 +234,38 @@ def generate_ai_vision_response(
     raise ValueError(f"Unknown AI_PROVIDER: {provider}")
 
 
-def generate_ai_response(system_prompt: str, user_text: str) -> str:
+def generate_ai_response(
+    system_prompt: str,
+    user_text: str,
+    validate: Callable[[str], bool] | None = None,
+) -> str:
     """Dispatch an AI call to the active provider.
 
     Args:
         system_prompt: The system instruction / prompt.
         user_text: The user's input text.
+        validate: For a prompt cached with set_cache_ttl(), the reply is
+            only stored when this returns True (e.g. it parses as JSON),
+            so a malformed reply is asked for again next time.
 
     Returns:
         The raw text response from the AI model.
 
     Raises:
         ValueError: If provider config is invalid or missing.
-        RuntimeError: If the SDK call fails.
+        AIProviderUnavailable: If every provider's circuit breaker is open.
+        Exception: The last provider's error if all of them failed.
     """
-    provider = get_provider_name()
+    slot = _cache_slot("text", system_prompt, user_text)
+    response = _cache_get(slot)
+    if response is None:
+        response = _call_with_fallback(_generate_text, system_prompt, user_text)
+        _cache_put(slot, response, validate)
+    return response
+
 
+@_timed("text")
+def _generate_text(provider: str, system_prompt: str, user_text: str) -> str:
     if provider == "gemini":
         return _call_gemini(system_prompt, user_text)
     if provider == "azure_openai":
@@ -114,89 +276,824 @@ def generate_ai_response(system_prompt: str, user_text: str) -> str:
     raise ValueError(f"Unknown AI_PROVIDER: {provider}")
 
 
+async def generate_ai_vision_response_async(
+    system_prompt: str,
+    user_text: str,
+    image_bytes: bytes,
+    mime_type: str = "image/jpeg",
+    timeout: float | None = AI_TIMEOUT_SECONDS,
+    validate: Callable[[str], bool] | None = None,
+) -> str:
+    """Async generate_ai_vision_response().
+
+    Raises:
+        TimeoutError: If the last provider tried took longer than ``timeout``
+            seconds.
+    """
+    slot = _cache_slot("vision", system_prompt, user_text, image_bytes, mime_type)
+    response = await _cache_get_async(slot)
+    if response is None:
+        response = await _call_with_fallback_async(
+            _generate_vision_async,
+            system_prompt,
+            user_text,
+            image_bytes,
+            mime_type,
+            timeout,
+        )
+        await _cache_put_async(slot, response, validate)
+    return response
+
+
+@_timed("vision")
+async def _generate_vision_async(
+    provider: str,
+    system_prompt: str,
+    user_text: str,
+    image_bytes: bytes,
+    mime_type: str,
+    timeout: float | None,
+) -> str:
+    if provider == "gemini":
+        call = _call_gemini_vision_async
+    elif provider == "azure_openai":
+        call = _call_azure_openai_vision_async
+    elif provider == "anthropic":
+        call = _call_anthropic_vision_async
+    else:
+        raise ValueError(f"Unknown AI_PROVIDER: {provider}")
+    return await asyncio.wait_for(
+        call(system_prompt, user_text, image_bytes, mime_type), timeout
+    )
+
+
+async def generate_ai_response_async(
+    system_prompt: str,
+    user_text: str,
+    timeout: float | None = AI_TIMEOUT_SECONDS,
+    validate: Callable[[str], bool] | None = None,
+) -> str:
+    """Async generate_ai_response(). ``timeout`` applies to each attempt.
+
+    Raises:
+        ValueError: If provider config is invalid or missing.
+        AIProviderUnavailable: If every provider's circuit breaker is open.
+        TimeoutError: If the last provider tried took longer than ``timeout``
+            seconds.
+    """
+    slot = _cache_slot("text", system_prompt, user_text)
+    response = await _cache_get_async(slot)
+    if response is None:
+        response = await _call_with_fallback_async(
+            _generate_text_async, system_prompt, user_text, timeout
+        )
+        await _cache_put_async(slot, response, validate)
+    return response
+
+
+@_timed("text")
+async def _generate_text_async(
+    provider: str, system_prompt: str, user_text: str, timeout: float | None
+) -> str:
+    if provider == "gemini":
+        call = _call_gemini_async
+    elif provider == "azure_openai":
+        call = _call_azure_openai_async
+    elif provider == "anthropic":
+        call = _call_anthropic_async
+    else:
+        raise ValueError(f"Unknown AI_PROVIDER: {provider}")
+    return await asyncio.wait_for(call(system_prompt, user_text), timeout)
+
+
+async def stream_ai_response_async(
+    system_prompt: str,
+    user_text: str,
+    timeout: float | None = AI_TIMEOUT_SECONDS,
+) -> AsyncIterator[str]:
+    """Streamed generate_ai_response_async(): yields text chunks as the
+    model produces them. A cached response comes back as one chunk, and a
+    completed stream is cached like a non-streamed response.
+
+    Retries and fallback apply until the first chunk arrives; an error
+    after that ends the stream.
+
+    Raises:
+        ValueError: If provider config is invalid or missing.
+        AIProviderUnavailable: If every provider's circuit breaker is open.
+        TimeoutError: If the stream takes longer than ``timeout`` seconds.
+    """
+    slot = _cache_slot("text", system_prompt, user_text)
+    cached = await _cache_get_async(slot)
+    if cached is not None:
+        yield cached
+        return
+
+    async def first_chunk(provider: str):
+        stream = _stream_text_async(provider, system_prompt, user_text, timeout)
+        try:
+            return stream, await anext(stream, "")
+        except BaseException:
+            await stream.aclose()
+            raise
+
+    stream, chunk = await _call_with_fallback_async(first_chunk)
+    chunks = [chunk]
+    if chunk:
+        yield chunk
+    async for chunk in stream:
+        chunks.append(chunk)
+        yield chunk
+    await _cache_put_async(slot, "".join(chunks).strip())
+
+
+async def _stream_text_async(
+    provider: str, system_prompt: str, user_text: str, timeout: float | None
+) -> AsyncIterator[str]:
+    """Provider stream, recorded in AI_LATENCY / AI_ERRORS as kind "stream"
+    and in AI_FIRST_TOKEN."""
+    if provider == "gemini":
+        stream = _stream_gemini_async
+    elif provider == "azure_openai":
+        stream = _stream_azure_openai_async
+    elif provider == "anthropic":
+        stream = _stream_anthropic_async
+    else:
+        raise ValueError(f"Unknown AI_PROVIDER: {provider}")
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    chunks = stream(system_prompt, user_text)
+    start = time.perf_counter()
+    first = True
+    try:
+        while True:
+            # Deadline per read, never across a yield to the consumer
+            async with asyncio.timeout_at(deadline):
+                try:
+                    chunk = await anext(chunks)
+                except StopAsyncIteration:
+                    return
+            if first:
+                AI_FIRST_TOKEN.observe(time.perf_counter() - start, provider)
+                first = False
+            if chunk:
+                yield chunk
+    except (Exception, asyncio.CancelledError) as e:
+        AI_ERRORS.inc(provider, "stream", type(e).__name__)
+        raise
+    finally:
+        await chunks.aclose()
+        elapsed = time.perf_counter() - start
+        AI_LATENCY.observe(elapsed, provider, "stream")
+        add_timing("ai", elapsed)
+
+
 # ---------------------------------------------------------------------------
-# Private provider implementations
+# Retries, circuit breakers and fallback
 # ---------------------------------------------------------------------------
 
+# Retries per provider after a transient error (429, 5xx, connection)
+AI_RETRIES = int(os.getenv("AI_RETRIES", "2"))
+# Full-jitter exponential backoff: uniform(0, min(max, base * 2**attempt))
+AI_RETRY_BASE_SECONDS = float(os.getenv("AI_RETRY_BASE_SECONDS", "0.5"))
+# Longest wait before a retry; a longer Retry-After skips to the next provider
+AI_RETRY_MAX_SECONDS = float(os.getenv("AI_RETRY_MAX_SECONDS", "8"))
+# Consecutive failures that open a provider's circuit, and how long it stays open
+AI_BREAKER_FAILURES = int(os.getenv("AI_BREAKER_FAILURES", "5"))
+AI_BREAKER_COOLDOWN_SECONDS = float(os.getenv("AI_BREAKER_COOLDOWN_SECONDS", "30"))
+
+AI_RETRIES_TOTAL = metrics.Counter(
+    "ai_retries_total",
+    "AI calls retried on the same provider after a transient error.",
+    ("provider",),
+)
+AI_FALLBACKS = metrics.Counter(
+    "ai_fallbacks_total",
+    "AI calls that moved past a provider, by reason (circuit_open, failed).",
+    ("provider", "reason"),
+)
+
+# Statuses worth retrying; 529 is Anthropic's "overloaded"
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+# A rejected key fails every call until someone fixes it
+_AUTH_STATUS = {401, 403}
 
-def _call_gemini(system_prompt: str, user_text: str) -> str:
-    import google.generativeai as genai  # noqa: E402 — lazy import
 
-    model_name = os.getenv("GOOGLE_MODEL", "gemini-2.5-flash")
-    model = genai.GenerativeModel(
-        model_name=model_name,
-        system_instruction=system_prompt,
+class AIProviderUnavailable(RuntimeError):
+    """Every configured provider is skipped by its open circuit breaker."""
+
+
+class _CircuitBreaker:
+    """Closed until ``failures`` consecutive failures, then open (calls
+    skipped) for ``cooldown`` seconds, then half-open: one trial call
+    closes it again on success or reopens it on failure."""
+
+    def __init__(self, failures: int, cooldown: float):
+        self.failures = failures
+        self.cooldown = cooldown
+        self._consecutive = 0
+        self._open_until: float | None = None
+        self._trial_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._open_until is not None and time.monotonic() < self._open_until
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._open_until is None:
+                return True
+            now = time.monotonic()
+            if now < self._open_until:
+                return False
+            # One trial at a time; a trial that never reported (cancelled)
+            # stops blocking after another cooldown
+            if self._trial_at is not None and now - self._trial_at < self.cooldown:
+                return False
+            self._trial_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive = 0
+            self._open_until = None
+            self._trial_at = None
+
+    def release_trial(self) -> None:
+        """End a half-open trial without a verdict, so another may run."""
+        with self._lock:
+            self._trial_at = None
+
+    def record_failure(self, open_for: float = 0) -> None:
+        with self._lock:
+            self._consecutive += 1
+            trial = self._trial_at is not None
+            if trial or open_for or self._consecutive >= self.failures:
+                duration = max(self.cooldown, open_for)
+                self._open_until = time.monotonic() + duration
+            self._trial_at = None
+
+
+_breakers: dict[str, _CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def _breaker(provider: str) -> _CircuitBreaker:
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(
+                provider,
+                _CircuitBreaker(AI_BREAKER_FAILURES, AI_BREAKER_COOLDOWN_SECONDS),
+            )
+    return breaker
+
+
+def _breaker_metrics():
+    yield (
+        "ai_circuit_open",
+        "gauge",
+        "Whether an AI provider's circuit breaker is open (calls skipped).",
+        [({"provider": p}, int(b.is_open)) for p, b in sorted(_breakers.items())],
     )
-    response = model.generate_content(user_text)
-    return response.text.strip()
 
 
-def _call_azure_openai(system_prompt: str, user_text: str) -> str:
+metrics.register_collector(_breaker_metrics)
+
+
+def _provider_chain() -> list[str]:
+    """Configured providers that can be called, in fallback order."""
+    chain = [p for p in get_provider_names() if _provider_problem(p) is None]
+    if not chain:
+        raise ValueError(check_ai_available()[1])
+    return chain
+
+
+def _status_code(error: Exception) -> int | None:
+    # openai / anthropic: status_code, google.api_core: code
+    for attr in ("status_code", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds from the error response's Retry-After header, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def _is_timeout(error: Exception) -> bool:
+    return isinstance(error, TimeoutError) or any(
+        "Timeout" in cls.__name__ for cls in type(error).__mro__
+    )
+
+
+def _is_transient(error: Exception) -> bool:
+    status = _status_code(error)
+    if status is not None:
+        return status in _RETRYABLE_STATUS or status >= 500
+    return isinstance(error, (ConnectionError, TimeoutError)) or any(
+        "Connection" in cls.__name__ or "Timeout" in cls.__name__
+        for cls in type(error).__mro__
+    )
+
+
+def _after_failure(provider: str, error: Exception, attempt: int) -> float | None:
+    """Book a failed call; return the delay before retrying the same
+    provider, or None to move on to the next one.
+
+    Transient errors and auth failures (401/403) count against the
+    provider's breaker. Other errors (a 400, an empty or blocked reply) say
+    nothing about its health and leave the count alone; only a returned
+    result resets it. Timeouts are not retried: a provider that hangs is
+    left for the next one rather than waited out again.
+    """
+    breaker = _breaker(provider)
+    if not _is_transient(error):
+        if _status_code(error) in _AUTH_STATUS:
+            breaker.record_failure()
+        else:
+            breaker.release_trial()
+        return None
+    retry_after = _retry_after(error)
+    if retry_after is not None and retry_after > AI_RETRY_MAX_SECONDS:
+        # The provider says it is unavailable for longer than we'd wait
+        breaker.record_failure(open_for=retry_after)
+        return None
+    breaker.record_failure()
+    if _is_timeout(error) or attempt >= AI_RETRIES or not breaker.allow():
+        return None
+    AI_RETRIES_TOTAL.inc(provider)
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(
+        0, min(AI_RETRY_MAX_SECONDS, AI_RETRY_BASE_SECONDS * 2**attempt)
+    )
+
+
+def _call_with_fallback(call, *args):
+    """``call(provider, *args)`` on each provider of the chain in turn,
+    with retries, until one succeeds. Raises the last provider's error."""
+    last_error: Exception | None = None
+    for provider in _provider_chain():
+        if not _breaker(provider).allow():
+            AI_FALLBACKS.inc(provider, "circuit_open")
+            continue
+        attempt = 0
+        while True:
+            try:
+                result = call(provider, *args)
+            except Exception as e:
+                last_error = e
+                delay = _after_failure(provider, e, attempt)
+                if delay is None:
+                    break
+                logger.warning(
+                    "AI %s failed (%r), retrying in %.1fs", provider, e, delay
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
+            _breaker(provider).record_success()
+            return result
+        logger.warning("AI %s failed: %r", provider, last_error)
+        AI_FALLBACKS.inc(provider, "failed")
+    if last_error is None:
+        raise AIProviderUnavailable("All AI providers are unavailable (circuit open)")
+    raise last_error
+
+
+async def _call_with_fallback_async(call, *args):
+    """Async _call_with_fallback(); ``call`` is a coroutine function."""
+    last_error: Exception | None = None
+    for provider in _provider_chain():
+        if not _breaker(provider).allow():
+            AI_FALLBACKS.inc(provider, "circuit_open")
+            continue
+        attempt = 0
+        while True:
+            try:
+                result = await call(provider, *args)
+            except Exception as e:
+                last_error = e
+                delay = _after_failure(provider, e, attempt)
+                if delay is None:
+                    break
+                logger.warning(
+                    "AI %s failed (%r), retrying in %.1fs", provider, e, delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            _breaker(provider).record_success()
+            return result
+        logger.warning("AI %s failed: %r", provider, last_error)
+        AI_FALLBACKS.inc(provider, "failed")
+    if last_error is None:
+        raise AIProviderUnavailable("All AI providers are unavailable (circuit open)")
+    raise last_error
+
+
+# ---------------------------------------------------------------------------
+# Client registry
+# ---------------------------------------------------------------------------
+
+AI_CLIENT_BUILDS = metrics.Counter(
+    "ai_client_builds_total",
+    "AI SDK clients constructed (first use, or after their env config changed).",
+    ("client",),
+)
+
+# Env vars each client is built from; a change to any of them rebuilds it
+_CLIENT_ENV = {
+    "gemini": ("GOOGLE_API_KEY",),
+    "azure_openai": (
+        "AZURE_OPENAI_ENDPOINT",
+        "AZURE_OPENAI_KEY",
+        "AZURE_OPENAI_API_VERSION",
+    ),
+    "anthropic": ("ANTHROPIC_API_KEY", "ANTHROPIC_BASE_URL"),
+}
+_CLIENT_ENV["azure_openai_async"] = _CLIENT_ENV["azure_openai"]
+_CLIENT_ENV["anthropic_async"] = _CLIENT_ENV["anthropic"]
+
+# Gemini models are per system prompt; the prompts are module constants,
+# so this only bounds the cache against a caller that builds them per call
+_MAX_GEMINI_MODELS = 64
+
+
+class _ClientRegistry:
+    """One SDK client per provider, shared by every thread.
+
+    The OpenAI and Anthropic clients (and the genai default client) are
+    thread-safe and each own an HTTP connection pool, so sharing one keeps
+    connections alive across calls. A client is rebuilt only when the env
+    vars it was built from change; the old one is left to in-flight calls.
+    Async clients also pass their event loop as ``scope``: their connection
+    pool belongs to the loop that opened it.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple, object]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, build, scope=None):
+        config = (*(os.getenv(v) for v in _CLIENT_ENV[name]), scope)
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == config:
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry[0] != config:
+                entry = self._entries[name] = (config, build())
+                AI_CLIENT_BUILDS.inc(name)
+            return entry[1]
+
+
+_clients = _ClientRegistry()
+
+
+def _build_gemini() -> dict:
+    import google.generativeai as genai  # noqa: E402 — lazy import
+
+    # Passing the key re-creates genai's default client for the new config
+    genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
+    return {}  # (model_name, system_prompt) -> GenerativeModel
+
+
+def _gemini_model(model_name: str, system_prompt: str):
+    import google.generativeai as genai  # noqa: E402
+
+    models = _clients.get("gemini", _build_gemini)
+    key = (model_name, system_prompt)
+    model = models.get(key)
+    if model is None:
+        if len(models) >= _MAX_GEMINI_MODELS:
+            models.clear()
+        model = models[key] = genai.GenerativeModel(
+            model_name=model_name,
+            system_instruction=system_prompt,
+        )
+    return model
+
+
+def _build_azure_openai():
     from openai import AzureOpenAI  # noqa: E402 — lazy import
 
-    client = AzureOpenAI(
+    return AzureOpenAI(
         azure_endpoint=os.environ["AZURE_OPENAI_ENDPOINT"],
         api_key=os.environ["AZURE_OPENAI_KEY"],
         api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-06-01"),
+        max_retries=0,  # _call_with_fallback retries
     )
-    response = client.chat.completions.create(
-        model=os.environ["AZURE_OPENAI_DEPLOYMENT"],
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_text},
-        ],
-    )
-    return response.choices[0].message.content.strip()
 
 
-def _call_anthropic(system_prompt: str, user_text: str) -> str:
+def _build_anthropic():
     import anthropic  # noqa: E402 — lazy import
 
-    client = anthropic.Anthropic()  # reads ANTHROPIC_API_KEY from env
-    model_name = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
-    response = client.messages.create(
-        model=model_name,
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_text}],
+    # Reads ANTHROPIC_API_KEY from env; _call_with_fallback retries
+    return anthropic.Anthropic(max_retries=0)
+
+
+def _build_azure_openai_async():
+    from openai import AsyncAzureOpenAI  # noqa: E402 — lazy import
+
+    return AsyncAzureOpenAI(
+        azure_endpoint=os.environ["AZURE_OPENAI_ENDPOINT"],
+        api_key=os.environ["AZURE_OPENAI_KEY"],
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-06-01"),
+        max_retries=0,  # _call_with_fallback retries
     )
-    return response.content[0].text.strip()
+
+
+def _build_anthropic_async():
+    import anthropic  # noqa: E402 — lazy import
+
+    return anthropic.AsyncAnthropic(max_retries=0)
+
+
+def _azure_openai_client():
+    return _clients.get("azure_openai", _build_azure_openai)
+
+
+def _anthropic_client():
+    return _clients.get("anthropic", _build_anthropic)
+
+
+def _azure_openai_async_client():
+    loop = asyncio.get_running_loop()
+    return _clients.get("azure_openai_async", _build_azure_openai_async, loop)
+
+
+def _anthropic_async_client():
+    loop = asyncio.get_running_loop()
+    return _clients.get("anthropic_async", _build_anthropic_async, loop)
 
 
 # ---------------------------------------------------------------------------
-# Vision provider implementations
+# Response cache
 # ---------------------------------------------------------------------------
 
+# Entries kept in process memory (LRU)
+AI_CACHE_SIZE = int(os.getenv("AI_CACHE_SIZE", "1024"))
+# Lifetime for prompts not registered with set_cache_ttl(); the default 0
+# caches only registered prompts, since a reply may be wrong or time-bound
+AI_CACHE_TTL_SECONDS = float(os.getenv("AI_CACHE_TTL_SECONDS", "0"))
+# Second tier in the ai_response_cache table, shared by every process. Sync
+# calls skip it inside a unit_of_work(), whose transaction it would join
+AI_CACHE_DB = os.getenv("AI_CACHE_DB", "").lower() in ("1", "true", "yes")
 
-def _call_gemini_vision(
-    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
-) -> str:
-    import google.generativeai as genai  # noqa: E402
+AI_CACHE_LOOKUPS = metrics.Counter(
+    "ai_cache_lookups_total",
+    "AI response cache lookups by result (memory_hit, db_hit, miss).",
+    ("kind", "result"),
+)
 
-    model_name = os.getenv("GOOGLE_MODEL", "gemini-2.5-flash")
-    model = genai.GenerativeModel(
-        model_name=model_name,
-        system_instruction=system_prompt,
-    )
-    image_part = {"mime_type": mime_type, "data": image_bytes}
-    parts = [image_part]
+# Expired ai_response_cache rows are purged on every Nth write
+_PURGE_EVERY = 100
+
+_CACHE_GET_SQL = """SELECT response, EXTRACT(EPOCH FROM expires_at - NOW())
+                    FROM ai_response_cache
+                    WHERE cache_key = %s AND expires_at > NOW()"""
+
+_CACHE_PUT_SQL = """INSERT INTO ai_response_cache
+                        (cache_key, provider, model, response, expires_at)
+                    VALUES (%s, %s, %s, %s, NOW() + %s * interval '1 second')
+                    ON CONFLICT (cache_key) DO UPDATE
+                    SET response = EXCLUDED.response,
+                        created_at = NOW(),
+                        expires_at = EXCLUDED.expires_at"""
+
+_CACHE_PURGE_SQL = "DELETE FROM ai_response_cache WHERE expires_at <= NOW()"
+
+_prompt_ttls: dict[str, float] = {}
+_cache_writes = itertools.count(1)
+
+
+class _CacheSlot(NamedTuple):
+    key: str
+    kind: str
+    provider: str
+    model: str
+    ttl: float
+
+
+def _sha256(data: str | bytes) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def set_cache_ttl(system_prompt: str, seconds: float) -> None:
+    """Cache responses to ``system_prompt`` for ``seconds``; 0 disables
+    caching for that prompt. Only registered prompts are cached by default."""
+    _prompt_ttls[_sha256(system_prompt)] = seconds
+
+
+def _model_name(provider: str) -> str:
+    if provider == "gemini":
+        return _gemini_model_name()
+    if provider == "azure_openai":
+        return os.getenv("AZURE_OPENAI_DEPLOYMENT", "")
+    return _anthropic_model_name()
+
+
+class _LRUCache:
+    """Thread-safe LRU of key -> (expires_at, response)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, response: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_memory_cache = _LRUCache(AI_CACHE_SIZE)
+
+
+def _cache_slot(kind: str, system_prompt: str, *inputs) -> _CacheSlot | None:
+    """Cache key and TTL for a request, or None if its prompt isn't cached."""
+    prompt_hash = _sha256(system_prompt)
+    ttl = _prompt_ttls.get(prompt_hash, AI_CACHE_TTL_SECONDS)
+    if ttl <= 0:
+        return None
+    # Keyed by the whole chain: any provider in it may have answered
+    providers = get_provider_names()
+    provider = ",".join(providers)
+    model = ",".join(_model_name(p) for p in providers)
+    parts = [kind, provider, model, prompt_hash, *(_sha256(i) for i in inputs)]
+    return _CacheSlot(_sha256("\0".join(parts)), kind, provider, model, ttl)
+
+
+def _cache_hit(slot: _CacheSlot, row) -> str | None:
+    if row is None:
+        AI_CACHE_LOOKUPS.inc(slot.kind, "miss")
+        return None
+    response, remaining = row
+    _memory_cache.put(slot.key, response, float(remaining))
+    AI_CACHE_LOOKUPS.inc(slot.kind, "db_hit")
+    return response
+
+
+def _cache_get(slot: _CacheSlot | None) -> str | None:
+    if slot is None:
+        return None
+    response = _memory_cache.get(slot.key)
+    if response is not None:
+        AI_CACHE_LOOKUPS.inc(slot.kind, "memory_hit")
+        return response
+    row = None
+    if AI_CACHE_DB and not in_unit_of_work():
+        try:
+            with get_connection(readonly=True) as conn:
+                with conn.cursor() as cur:
+                    cur.execute(_CACHE_GET_SQL, (slot.key,))
+                    row = cur.fetchone()
+        except Exception as e:  # the cache must never fail the AI call
+            logger.warning("AI cache read failed: %s", e)
+    return _cache_hit(slot, row)
+
+
+async def _cache_get_async(slot: _CacheSlot | None) -> str | None:
+    if slot is None:
+        return None
+    response = _memory_cache.get(slot.key)
+    if response is not None:
+        AI_CACHE_LOOKUPS.inc(slot.kind, "memory_hit")
+        return response
+    row = None
+    if AI_CACHE_DB:
+        try:
+            async with get_async_connection(readonly=True) as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(_CACHE_GET_SQL, (slot.key,))
+                    row = await cur.fetchone()
+        except Exception as e:
+            logger.warning("AI cache read failed: %s", e)
+    return _cache_hit(slot, row)
+
+
+def _cache_put_params(slot: _CacheSlot, response: str) -> tuple:
+    return (slot.key, slot.provider, slot.model, response, slot.ttl)
+
+
+def _cacheable(response: str, validate: Callable[[str], bool] | None) -> bool:
+    if not response:
+        return False
+    if validate is None:
+        return True
+    try:
+        return bool(validate(response))
+    except Exception:
+        return False
+
+
+def _cache_put(
+    slot: _CacheSlot | None,
+    response: str,
+    validate: Callable[[str], bool] | None = None,
+) -> None:
+    if slot is None or not _cacheable(response, validate):
+        return
+    _memory_cache.put(slot.key, response, slot.ttl)
+    if not AI_CACHE_DB or in_unit_of_work():
+        return
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_CACHE_PUT_SQL, _cache_put_params(slot, response))
+                if next(_cache_writes) % _PURGE_EVERY == 0:
+                    cur.execute(_CACHE_PURGE_SQL)
+    except Exception as e:
+        logger.warning("AI cache write failed: %s", e)
+
+
+async def _cache_put_async(
+    slot: _CacheSlot | None,
+    response: str,
+    validate: Callable[[str], bool] | None = None,
+) -> None:
+    if slot is None or not _cacheable(response, validate):
+        return
+    _memory_cache.put(slot.key, response, slot.ttl)
+    if not AI_CACHE_DB:
+        return
+    try:
+        async with get_async_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(_CACHE_PUT_SQL, _cache_put_params(slot, response))
+                if next(_cache_writes) % _PURGE_EVERY == 0:
+                    await cur.execute(_CACHE_PURGE_SQL)
+    except Exception as e:
+        logger.warning("AI cache write failed: %s", e)
+
+
+# ---------------------------------------------------------------------------
+# Request payloads, shared by the sync and async calls
+# ---------------------------------------------------------------------------
+
+
+def _gemini_model_name() -> str:
+    return os.getenv("GOOGLE_MODEL", "gemini-2.5-flash")
+
+
+def _gemini_vision_parts(user_text: str, image_bytes: bytes, mime_type: str) -> list:
+    parts = [{"mime_type": mime_type, "data": image_bytes}]
     if user_text:
         parts.append(user_text)
-    response = model.generate_content(parts)
-    return response.text.strip()
+    return parts
 
 
-def _call_azure_openai_vision(
-    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
-) -> str:
+def _azure_openai_request(system_prompt: str, user_content) -> dict:
+    return {
+        "model": os.environ["AZURE_OPENAI_DEPLOYMENT"],
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ],
+    }
+
+
+def _azure_openai_vision_content(
+    user_text: str, image_bytes: bytes, mime_type: str
+) -> list:
     import base64
-    from openai import AzureOpenAI  # noqa: E402
 
-    client = AzureOpenAI(
-        azure_endpoint=os.environ["AZURE_OPENAI_ENDPOINT"],
-        api_key=os.environ["AZURE_OPENAI_KEY"],
-        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-06-01"),
-    )
     b64 = base64.b64encode(image_bytes).decode("utf-8")
     data_url = f"data:{mime_type};base64,{b64}"
     user_content = [
@@ -204,24 +1101,27 @@ def _call_azure_openai_vision(
     ]
     if user_text:
         user_content.insert(0, {"type": "text", "text": user_text})
-    response = client.chat.completions.create(
-        model=os.environ["AZURE_OPENAI_DEPLOYMENT"],
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content},
-        ],
-    )
-    return response.choices[0].message.content.strip()
+    return user_content
 
 
-def _call_anthropic_vision(
-    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
-) -> str:
+def _anthropic_model_name() -> str:
+    return os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
+
+
+def _anthropic_request(system_prompt: str, content) -> dict:
+    return {
+        "model": _anthropic_model_name(),
+        "max_tokens": 4096,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": content}],
+    }
+
+
+def _anthropic_vision_content(
+    user_text: str, image_bytes: bytes, mime_type: str
+) -> list:
     import base64
-    import anthropic  # noqa: E402
 
-    client = anthropic.Anthropic()
-    model_name = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
     b64 = base64.b64encode(image_bytes).decode("utf-8")
     content = [
         {
@@ -231,10 +1131,141 @@ def _call_anthropic_vision(
     ]
     if user_text:
         content.append({"type": "text", "text": user_text})
-    response = client.messages.create(
-        model=model_name,
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[{"role": "user", "content": content}],
+    return content
+
+
+# ---------------------------------------------------------------------------
+# Private provider implementations
+# ---------------------------------------------------------------------------
+
+
+def _call_gemini(system_prompt: str, user_text: str) -> str:
+    model = _gemini_model(_gemini_model_name(), system_prompt)
+    response = model.generate_content(user_text)
+    return response.text.strip()
+
+
+def _call_azure_openai(system_prompt: str, user_text: str) -> str:
+    response = _azure_openai_client().chat.completions.create(
+        **_azure_openai_request(system_prompt, user_text)
+    )
+    return response.choices[0].message.content.strip()
+
+
+def _call_anthropic(system_prompt: str, user_text: str) -> str:
+    response = _anthropic_client().messages.create(
+        **_anthropic_request(system_prompt, user_text)
+    )
+    return response.content[0].text.strip()
+
+
+async def _call_gemini_async(system_prompt: str, user_text: str) -> str:
+    model = _gemini_model(_gemini_model_name(), system_prompt)
+    response = await model.generate_content_async(user_text)
+    return response.text.strip()
+
+
+async def _call_azure_openai_async(system_prompt: str, user_text: str) -> str:
+    response = await _azure_openai_async_client().chat.completions.create(
+        **_azure_openai_request(system_prompt, user_text)
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def _call_anthropic_async(system_prompt: str, user_text: str) -> str:
+    response = await _anthropic_async_client().messages.create(
+        **_anthropic_request(system_prompt, user_text)
+    )
+    return response.content[0].text.strip()
+
+
+async def _stream_gemini_async(system_prompt: str, user_text: str):
+    model = _gemini_model(_gemini_model_name(), system_prompt)
+    response = await model.generate_content_async(user_text, stream=True)
+    async for chunk in response:
+        if chunk.parts:
+            yield chunk.text
+
+
+async def _stream_azure_openai_async(system_prompt: str, user_text: str):
+    stream = await _azure_openai_async_client().chat.completions.create(
+        **_azure_openai_request(system_prompt, user_text), stream=True
+    )
+    async with stream:
+        async for chunk in stream:
+            # Azure sends content-filter results as chunks without choices
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+async def _stream_anthropic_async(system_prompt: str, user_text: str):
+    async with _anthropic_async_client().messages.stream(
+        **_anthropic_request(system_prompt, user_text)
+    ) as stream:
+        async for text in stream.text_stream:
+            yield text
+
+
+# ---------------------------------------------------------------------------
+# Vision provider implementations
+# ---------------------------------------------------------------------------
+
+
+def _call_gemini_vision(
+    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
+) -> str:
+    model = _gemini_model(_gemini_model_name(), system_prompt)
+    response = model.generate_content(
+        _gemini_vision_parts(user_text, image_bytes, mime_type)
+    )
+    return response.text.strip()
+
+
+def _call_azure_openai_vision(
+    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
+) -> str:
+    content = _azure_openai_vision_content(user_text, image_bytes, mime_type)
+    response = _azure_openai_client().chat.completions.create(
+        **_azure_openai_request(system_prompt, content)
+    )
+    return response.choices[0].message.content.strip()
+
+
+def _call_anthropic_vision(
+    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
+) -> str:
+    content = _anthropic_vision_content(user_text, image_bytes, mime_type)
+    response = _anthropic_client().messages.create(
+        **_anthropic_request(system_prompt, content)
+    )
+    return response.content[0].text.strip()
+
+
+async def _call_gemini_vision_async(
+    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
+) -> str:
+    model = _gemini_model(_gemini_model_name(), system_prompt)
+    response = await model.generate_content_async(
+        _gemini_vision_parts(user_text, image_bytes, mime_type)
+    )
+    return response.text.strip()
+
+
+async def _call_azure_openai_vision_async(
+    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
+) -> str:
+    content = _azure_openai_vision_content(user_text, image_bytes, mime_type)
+    response = await _azure_openai_async_client().chat.completions.create(
+        **_azure_openai_request(system_prompt, content)
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def _call_anthropic_vision_async(
+    system_prompt: str, user_text: str, image_bytes: bytes, mime_type: str
+) -> str:
+    content = _anthropic_vision_content(user_text, image_bytes, mime_type)
+    response = await _anthropic_async_client().messages.create(
+        **_anthropic_request(system_prompt, content)
     )
     return response.content[0].text.strip()
@@ -8,8 +8,8 @@ Public API:
     delete(product_id) → None
 """
 
-import streamlit as st
 from database.connection import get_connection, row_to_dict, rows_to_dicts
+from services.caching import cache_data
 
 
 def create(
@@ -47,9 +47,9 @@ def create(
             )
 
 
-@st.cache_data
+@cache_data
 def get_all():
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute("SELECT * FROM annual_plan ORDER BY product_id")
             return rows_to_dicts(cur)
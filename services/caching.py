@@ -0,0 +1,29 @@
+"""Lazy ``st.cache_data`` for the legacy services.
+
+Importing streamlit costs more than the rest of the API's imports
+together, and the FastAPI backend only needs it for these caches. The
+decorator below resolves ``st.cache_data`` on the first call instead of at
+import time; caching behaves exactly as before once it does.
+"""
+
+import functools
+
+
+def cache_data(fn):
+    """``@st.cache_data``, with streamlit imported on first call."""
+    cached = None
+
+    def resolve():
+        nonlocal cached
+        if cached is None:
+            import streamlit as st
+
+            cached = st.cache_data(fn)
+        return cached
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return resolve()(*args, **kwargs)
+
+    wrapper.clear = lambda: resolve().clear()
+    return wrapper
@@ -1,6 +1,7 @@
 """Centralized config loader for external YAML files (rules, prompts).
 
-Uses functools.lru_cache so each file is read only once per process.
+Uses functools.lru_cache so each file is read only once per process, and
+imports PyYAML only then, keeping it off the API's import path.
 
 Public API:
     get_meddic_gate_rules() -> dict
@@ -10,14 +11,14 @@ Public API:
 import logging
 from functools import lru_cache
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
 
 @lru_cache(maxsize=1)
 def get_meddic_gate_rules() -> dict:
     """Load MEDDIC gating rules from rules.yml."""
+    import yaml
+
     try:
         with open("rules.yml", "r", encoding="utf-8") as f:
             rules = yaml.safe_load(f)
@@ -30,6 +31,8 @@ def get_meddic_gate_rules() -> dict:
 @lru_cache(maxsize=1)
 def get_ai_prompt() -> str:
     """Load AI smart log system prompt from prompts.yml."""
+    import yaml
+
     try:
         with open("prompts.yml", "r", encoding="utf-8") as f:
             prompts = yaml.safe_load(f)
@@ -18,13 +18,13 @@ Internal:
 """
 
 from datetime import date
-import streamlit as st
 from database.connection import (
     get_connection,
     read_sql_file,
     row_to_dict,
     rows_to_dicts,
 )
+from services.caching import cache_data
 
 
 def create(
@@ -101,10 +101,10 @@ def find_or_create_client(company_name: str) -> str | None:
             return new_client_id
 
 
-@st.cache_data
+@cache_data
 def get_all():
     """Get all clients with DM and champion names from normalized tables (LEFT JOIN)."""
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             sql = read_sql_file("crm_get_all.sql")
             cur.execute(sql)
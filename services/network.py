@@ -56,7 +56,7 @@ def get_relations(contact_id: int) -> list[dict]:
 
 
 def get_all_relations() -> list[dict]:
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute("""SELECT sr.*,
                           cf.name AS from_name, ct.name AS to_name
@@ -106,7 +106,7 @@ def create_intel(
 
 
 def get_all_intel() -> list[dict]:
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             # Get all intel with source contact name
             cur.execute("""SELECT i.*,
@@ -1,6 +1,57 @@
 """Nexus calendar service — meetings and reminders."""
 
-from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.connection import (
+    async_rows_to_dicts,
+    get_async_connection,
+    get_connection,
+    row_to_dict,
+    rows_to_dicts,
+)
+
+# SQL shared by the sync functions and their *_async twins below.
+_MEETINGS_BY_DATE_SQL = """SELECT m.*, d.name AS deal_name, c.name AS client_name
+                   FROM nx_meeting m
+                   JOIN nx_deal d ON m.deal_id = d.id
+                   JOIN nx_client c ON d.client_id = c.id
+                   WHERE m.meeting_date::DATE = %s
+                   ORDER BY m.meeting_date ASC"""
+
+_MEETINGS_BY_MONTH_SQL = """SELECT m.id, m.deal_id, m.title, m.meeting_date, m.status,
+                          d.name AS deal_name
+                   FROM nx_meeting m
+                   JOIN nx_deal d ON m.deal_id = d.id
+                   WHERE TO_CHAR(m.meeting_date, 'YYYY-MM') = %s
+                   ORDER BY m.meeting_date ASC"""
+
+_MEETINGS_BY_RANGE_SQL = """SELECT m.*, d.name AS deal_name, c.name AS client_name
+                   FROM nx_meeting m
+                   JOIN nx_deal d ON m.deal_id = d.id
+                   JOIN nx_client c ON d.client_id = c.id
+                   WHERE m.meeting_date::DATE BETWEEN %s AND %s
+                   ORDER BY m.meeting_date ASC"""
+
+_MEETINGS_BY_DEAL_SQL = (
+    """SELECT * FROM nx_meeting WHERE deal_id = %s ORDER BY meeting_date DESC"""
+)
+
+_REMINDERS_BY_DATE_SQL = """SELECT r.*, d.name AS deal_name
+                   FROM nx_reminder r
+                   LEFT JOIN nx_deal d ON r.deal_id = d.id
+                   WHERE r.due_date::DATE = %s AND r.resolved = FALSE
+                   ORDER BY r.due_date ASC"""
+
+_REMINDERS_BY_MONTH_SQL = """SELECT r.id, r.deal_id, r.reminder_type, r.due_date, r.content, r.resolved,
+                          d.name AS deal_name
+                   FROM nx_reminder r
+                   LEFT JOIN nx_deal d ON r.deal_id = d.id
+                   WHERE TO_CHAR(r.due_date, 'YYYY-MM') = %s
+                   ORDER BY r.due_date ASC"""
+
+_PENDING_REMINDERS_SQL = """SELECT r.*, d.name AS deal_name
+                   FROM nx_reminder r
+                   LEFT JOIN nx_deal d ON r.deal_id = d.id
+                   WHERE r.resolved = FALSE AND r.due_date::DATE <= CURRENT_DATE
+                   ORDER BY r.due_date ASC"""
 
 # --- Meetings ---
 
@@ -49,60 +100,33 @@ def get_meeting(meeting_id: int) -> dict | None:
 
 def get_meetings_by_date(date_str: str) -> list[dict]:
     """Get meetings for a given date (YYYY-MM-DD)."""
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT m.*, d.name AS deal_name, c.name AS client_name
-                   FROM nx_meeting m
-                   JOIN nx_deal d ON m.deal_id = d.id
-                   JOIN nx_client c ON d.client_id = c.id
-                   WHERE m.meeting_date::DATE = %s
-                   ORDER BY m.meeting_date ASC""",
-                (date_str,),
-            )
+            cur.execute(_MEETINGS_BY_DATE_SQL, (date_str,))
             return rows_to_dicts(cur)
 
 
 def get_meetings_by_month(year: int, month: int) -> list[dict]:
     """Get all meetings in a month (for calendar dot indicators)."""
     month_str = f"{year}-{month:02d}"
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT m.id, m.deal_id, m.title, m.meeting_date, m.status,
-                          d.name AS deal_name
-                   FROM nx_meeting m
-                   JOIN nx_deal d ON m.deal_id = d.id
-                   WHERE TO_CHAR(m.meeting_date, 'YYYY-MM') = %s
-                   ORDER BY m.meeting_date ASC""",
-                (month_str,),
-            )
+            cur.execute(_MEETINGS_BY_MONTH_SQL, (month_str,))
             return rows_to_dicts(cur)
 
 
 def get_meetings_by_range(start_date: str, end_date: str) -> list[dict]:
     """Get meetings within a date range (inclusive, YYYY-MM-DD)."""
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT m.*, d.name AS deal_name, c.name AS client_name
-                   FROM nx_meeting m
-                   JOIN nx_deal d ON m.deal_id = d.id
-                   JOIN nx_client c ON d.client_id = c.id
-                   WHERE m.meeting_date::DATE BETWEEN %s AND %s
-                   ORDER BY m.meeting_date ASC""",
-                (start_date, end_date),
-            )
+            cur.execute(_MEETINGS_BY_RANGE_SQL, (start_date, end_date))
             return rows_to_dicts(cur)
 
 
 def get_meetings_by_deal(deal_id: int) -> list[dict]:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT * FROM nx_meeting WHERE deal_id = %s ORDER BY meeting_date DESC""",
-                (deal_id,),
-            )
+            cur.execute(_MEETINGS_BY_DEAL_SQL, (deal_id,))
             return rows_to_dicts(cur)
 
 
@@ -164,32 +188,17 @@ def create_reminder(
 
 
 def get_reminders_by_date(date_str: str) -> list[dict]:
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT r.*, d.name AS deal_name
-                   FROM nx_reminder r
-                   LEFT JOIN nx_deal d ON r.deal_id = d.id
-                   WHERE r.due_date::DATE = %s AND r.resolved = FALSE
-                   ORDER BY r.due_date ASC""",
-                (date_str,),
-            )
+            cur.execute(_REMINDERS_BY_DATE_SQL, (date_str,))
             return rows_to_dicts(cur)
 
 
 def get_reminders_by_month(year: int, month: int) -> list[dict]:
     month_str = f"{year}-{month:02d}"
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT r.id, r.deal_id, r.reminder_type, r.due_date, r.content, r.resolved,
-                          d.name AS deal_name
-                   FROM nx_reminder r
-                   LEFT JOIN nx_deal d ON r.deal_id = d.id
-                   WHERE TO_CHAR(r.due_date, 'YYYY-MM') = %s
-                   ORDER BY r.due_date ASC""",
-                (month_str,),
-            )
+            cur.execute(_REMINDERS_BY_MONTH_SQL, (month_str,))
             return rows_to_dicts(cur)
 
 
@@ -206,11 +215,63 @@ def resolve_reminder(reminder_id: int) -> dict | None:
 
 def get_pending_reminders() -> list[dict]:
     """Get all unresolved reminders up to today."""
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute("""SELECT r.*, d.name AS deal_name
-                   FROM nx_reminder r
-                   LEFT JOIN nx_deal d ON r.deal_id = d.id
-                   WHERE r.resolved = FALSE AND r.due_date::DATE <= CURRENT_DATE
-                   ORDER BY r.due_date ASC""")
+            cur.execute(_PENDING_REMINDERS_SQL)
             return rows_to_dicts(cur)
+
+
+# ---------------------------------------------------------------------------
+# Async variants — same SQL, run on the event loop via get_async_connection()
+# ---------------------------------------------------------------------------
+
+
+async def get_meetings_by_date_async(date_str: str) -> list[dict]:
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_MEETINGS_BY_DATE_SQL, (date_str,))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_meetings_by_month_async(year: int, month: int) -> list[dict]:
+    month_str = f"{year}-{month:02d}"
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_MEETINGS_BY_MONTH_SQL, (month_str,))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_meetings_by_range_async(start_date: str, end_date: str) -> list[dict]:
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_MEETINGS_BY_RANGE_SQL, (start_date, end_date))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_meetings_by_deal_async(deal_id: int) -> list[dict]:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_MEETINGS_BY_DEAL_SQL, (deal_id,))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_reminders_by_date_async(date_str: str) -> list[dict]:
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_REMINDERS_BY_DATE_SQL, (date_str,))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_reminders_by_month_async(year: int, month: int) -> list[dict]:
+    month_str = f"{year}-{month:02d}"
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_REMINDERS_BY_MONTH_SQL, (month_str,))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_pending_reminders_async() -> list[dict]:
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_PENDING_REMINDERS_SQL)
+            return await async_rows_to_dicts(cur)
@@ -1,6 +1,38 @@
 """Nexus client service — CRUD for client organizations."""
 
-from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.connection import (
+    Row,
+    get_connection,
+    row_to_dict,
+    rows_to_dicts,
+    rows_to_records,
+)
+from database.fieldsets import Fieldset, split_fields
+from database.keyset import Keyset
+
+CLIENT_FIELDS = Fieldset(
+    "clients",
+    "c",
+    (
+        "id",
+        "name",
+        "industry",
+        "aliases",
+        "budget_range",
+        "status",
+        "notes",
+        "created_at",
+        "updated_at",
+    ),
+    {"deal_budget_total": """(SELECT SUM(d.budget_amount)
+                           FROM nx_deal d
+                           WHERE d.client_id = c.id AND d.status = 'active')"""},
+)
+
+# Most recently updated first
+CLIENT_KEYSET = Keyset(
+    "clients", [("c.updated_at", "timestamptz"), ("c.id", "integer")], descending=True
+)
 
 
 def create_client(
@@ -34,20 +66,19 @@ def _auto_create_documents(client_id: int) -> None:
                 )
 
 
-def get_client(client_id: int) -> dict | None:
+def get_client(client_id: int, fields: list[str] | None = None) -> dict | None:
+    """Client with budget totals; ``fields`` narrows the columns read
+    (``deal_budgets_by_year`` is fetched only if listed)."""
+    columns, nested = split_fields(fields, {"deal_budgets_by_year"})
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                """SELECT c.*,
-                          (SELECT SUM(d.budget_amount)
-                           FROM nx_deal d
-                           WHERE d.client_id = c.id AND d.status = 'active') AS deal_budget_total
-                   FROM nx_client c WHERE c.id = %s""",
+                f"SELECT {CLIENT_FIELDS.select(columns)} FROM nx_client c WHERE c.id = %s",
                 (client_id,),
             )
             client = row_to_dict(cur)
-            if not client:
-                return None
+            if not client or not nested:
+                return client
             # Add per-year breakdown
             cur.execute(
                 """SELECT d.budget_year AS year, SUM(d.budget_amount) AS total
@@ -61,25 +92,26 @@ def get_client(client_id: int) -> dict | None:
             return client
 
 
-def get_all_clients(status: str | None = None) -> list[dict]:
-    with get_connection() as conn:
+def get_all_clients(
+    status: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    """Clients by last update, newest first. With ``limit``, one page;
+    pass ``CLIENT_KEYSET.next_cursor(rows, limit)`` back as ``cursor``."""
+    where, params = CLIENT_KEYSET.where(cursor)
+    if status:
+        where, params = f"c.status = %s AND {where}", [status, *params]
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            if status:
-                cur.execute(
-                    """SELECT c.*,
-                              (SELECT SUM(d.budget_amount)
-                               FROM nx_deal d
-                               WHERE d.client_id = c.id AND d.status = 'active') AS deal_budget_total
-                       FROM nx_client c WHERE c.status = %s ORDER BY c.updated_at DESC""",
-                    (status,),
-                )
-            else:
-                cur.execute("""SELECT c.*,
-                              (SELECT SUM(d.budget_amount)
-                               FROM nx_deal d
-                               WHERE d.client_id = c.id AND d.status = 'active') AS deal_budget_total
-                       FROM nx_client c ORDER BY c.updated_at DESC""")
-            return rows_to_dicts(cur)
+            cur.execute(
+                f"""SELECT {CLIENT_FIELDS.select(fields, ("id", *CLIENT_KEYSET.fields))}
+                   FROM nx_client c WHERE {where}
+                   ORDER BY {CLIENT_KEYSET.order_by()} LIMIT %s""",
+                [*params, limit],
+            )
+            return rows_to_records(cur)
 
 
 def update_client(client_id: int, **fields) -> dict | None:
@@ -1,6 +1,38 @@
 """Nexus contact service — CRUD for people linked to clients or partners."""
 
-from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.connection import (
+    Row,
+    get_connection,
+    row_to_dict,
+    rows_to_dicts,
+    rows_to_records,
+)
+from database.fieldsets import Fieldset
+from database.keyset import Keyset
+
+CONTACT_FIELDS = Fieldset(
+    "contacts",
+    "",
+    (
+        "id",
+        "name",
+        "title",
+        "phone",
+        "email",
+        "line_id",
+        "org_type",
+        "org_id",
+        "role",
+        "notes",
+        "created_at",
+        "updated_at",
+    ),
+)
+
+# Most recently updated first
+CONTACT_KEYSET = Keyset(
+    "contacts", [("updated_at", "timestamptz"), ("id", "integer")], descending=True
+)
 
 
 def create_contact(
@@ -25,10 +57,13 @@ def create_contact(
             return row_to_dict(cur)
 
 
-def get_contact(contact_id: int) -> dict | None:
+def get_contact(contact_id: int, fields: list[str] | None = None) -> dict | None:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM nx_contact WHERE id = %s", (contact_id,))
+            cur.execute(
+                f"SELECT {CONTACT_FIELDS.select(fields)} FROM nx_contact WHERE id = %s",
+                (contact_id,),
+            )
             return row_to_dict(cur)
 
 
@@ -42,11 +77,21 @@ def get_contacts_by_org(org_type: str, org_id: int) -> list[dict]:
             return rows_to_dicts(cur)
 
 
-def get_all_contacts() -> list[dict]:
-    with get_connection() as conn:
+def get_all_contacts(
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    after, params = CONTACT_KEYSET.where(cursor)
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM nx_contact ORDER BY updated_at DESC")
-            return rows_to_dicts(cur)
+            cur.execute(
+                f"""SELECT {CONTACT_FIELDS.select(fields, ("id", *CONTACT_KEYSET.fields))}
+                   FROM nx_contact WHERE {after}
+                   ORDER BY {CONTACT_KEYSET.order_by()} LIMIT %s""",
+                [*params, limit],
+            )
+            return rows_to_records(cur)
 
 
 def update_contact(contact_id: int, **fields) -> dict | None:
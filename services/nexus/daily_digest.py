@@ -2,7 +2,7 @@
 
 from datetime import date
 
-from database.connection import get_connection, rows_to_dicts
+from database.connection import get_connection, rows_to_dicts, unit_of_work
 from services.nexus.calendar import get_meetings_by_date, get_pending_reminders
 from services.nexus.deals import get_deals_needing_push
 from services.nexus.documents import get_expiring_documents
@@ -11,29 +11,33 @@ from services.nexus.tbd import get_open_tbds
 
 
 def build_daily_digest() -> dict:
-    """Gather all daily to-do items. Returns structured data."""
+    """Gather all daily to-do items. Returns structured data.
+
+    Runs as one read-only snapshot (replica-eligible) on a single connection.
+    """
     today = date.today().isoformat()
 
-    # 1. Today's meetings
-    meetings = get_meetings_by_date(today)
+    with unit_of_work(readonly=True):
+        # 1. Today's meetings
+        meetings = get_meetings_by_date(today)
 
-    # 2. Overdue/due reminders
-    reminders = get_pending_reminders()
+        # 2. Overdue/due reminders
+        reminders = get_pending_reminders()
 
-    # 3. Open TBDs
-    tbds = get_open_tbds()
+        # 3. Open TBDs
+        tbds = get_open_tbds()
 
-    # 4. Idle deals needing push (>14 days)
-    idle_deals = get_deals_needing_push(threshold_days=14)
+        # 4. Idle deals needing push (>14 days)
+        idle_deals = get_deals_needing_push(threshold_days=14)
 
-    # 5. Draft intel (unconfirmed)
-    draft_intel = get_all_intel(status="draft", limit=20)
+        # 5. Draft intel (unconfirmed)
+        draft_intel = get_all_intel(status="draft", limit=20)
 
-    # 6. Expiring documents (within 30 days)
-    expiring_docs = get_expiring_documents(within_days=30)
+        # 6. Expiring documents (within 30 days)
+        expiring_docs = get_expiring_documents(within_days=30)
 
-    # 7. Upcoming meetings (next 3 days)
-    upcoming = _get_upcoming_meetings(today, days=3)
+        # 7. Upcoming meetings (next 3 days)
+        upcoming = _get_upcoming_meetings(today, days=3)
 
     return {
         "date": today,
@@ -152,7 +156,7 @@ def format_digest_telegram(data: dict) -> str:
 
 def _get_upcoming_meetings(today: str, days: int = 3) -> list[dict]:
     """Get meetings in the next N days (excluding today)."""
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """SELECT m.*, d.name AS deal_name, c.name AS client_name
@@ -2,7 +2,19 @@
 
 import json
 
-from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.connection import (
+    Row,
+    async_row_to_dict,
+    async_rows_to_dicts,
+    async_rows_to_records,
+    get_async_connection,
+    get_connection,
+    row_to_dict,
+    rows_to_dicts,
+    rows_to_records,
+)
+from database.fieldsets import Fieldset, split_fields
+from database.keyset import Keyset
 
 VALID_STAGES = {"L0", "L1", "L2", "L3", "L4", "closed"}
 MEDDIC_KEYS = {
@@ -14,6 +26,190 @@ MEDDIC_KEYS = {
     "champion",
 }
 
+# meddic_json is the bulky column the list views rarely need
+DEAL_COLUMNS = (
+    "id",
+    "name",
+    "client_id",
+    "stage",
+    "budget_range",
+    "budget_amount",
+    "budget_year",
+    "timeline",
+    "meddic_json",
+    "close_reason",
+    "close_notes",
+    "status",
+    "last_activity_at",
+    "created_at",
+    "updated_at",
+)
+_CLIENT_COLUMNS = {"client_name": "c.name", "client_industry": "c.industry"}
+DEAL_FIELDS = Fieldset("deals", "d", DEAL_COLUMNS, _CLIENT_COLUMNS)
+DEAL_URGENCY_FIELDS = Fieldset(
+    "deals",
+    "d",
+    DEAL_COLUMNS,
+    {
+        **_CLIENT_COLUMNS,
+        "idle_days": "EXTRACT(DAY FROM NOW() - d.last_activity_at)::INTEGER",
+    },
+)
+
+# SQL shared by the sync functions and their *_async twins below.
+_CREATE_DEAL_SQL = """INSERT INTO nx_deal (name, client_id, budget_range, timeline, meddic_json, budget_amount, budget_year)
+                   VALUES (%s, %s, %s, %s, %s, %s, %s)
+                   RETURNING *"""
+
+_GET_DEAL_SQL = """SELECT {columns}
+                   FROM nx_deal d
+                   JOIN nx_client c ON d.client_id = c.id
+                   WHERE d.id = %s"""
+
+# Least recently active first; also the urgency order (idle_days DESC)
+DEAL_KEYSET = Keyset(
+    "deals", [("d.last_activity_at", "timestamptz"), ("d.id", "integer")]
+)
+
+_GET_ALL_DEALS_SQL = """SELECT {columns}
+                   FROM nx_deal d
+                   JOIN nx_client c ON d.client_id = c.id
+                   WHERE d.status = %s AND {after}
+                   ORDER BY {order_by} LIMIT %s"""
+
+_DEALS_BY_URGENCY_SQL = """SELECT {columns}
+                   FROM nx_deal d
+                   JOIN nx_client c ON d.client_id = c.id
+                   WHERE d.status = 'active' AND {after}
+                   ORDER BY {order_by} LIMIT %s"""
+
+_DEALS_BY_CLIENT_SQL = """SELECT d.*, c.name AS client_name, c.industry AS client_industry
+                   FROM nx_deal d
+                   JOIN nx_client c ON d.client_id = c.id
+                   WHERE d.client_id = %s
+                   ORDER BY d.last_activity_at DESC"""
+
+_DEALS_BY_PARTNER_SQL = """SELECT d.*, c.name AS client_name, c.industry AS client_industry
+                   FROM nx_deal d
+                   JOIN nx_client c ON d.client_id = c.id
+                   JOIN nx_deal_partner dp ON dp.deal_id = d.id
+                   WHERE dp.partner_id = %s
+                   ORDER BY d.last_activity_at DESC"""
+
+_PARTNERS_FOR_DEALS_SQL = """SELECT dp.deal_id, p.name AS partner_name, dp.role
+                    FROM nx_deal_partner dp
+                    JOIN nx_partner p ON dp.partner_id = p.id
+                    WHERE dp.deal_id = ANY(%s)"""
+
+_DEAL_PARTNERS_SQL = """SELECT dp.*, p.name AS partner_name, p.trust_level
+                   FROM nx_deal_partner dp
+                   JOIN nx_partner p ON dp.partner_id = p.id
+                   WHERE dp.deal_id = %s"""
+
+_LINK_INTEL_SQL = """INSERT INTO nx_deal_intel (deal_id, intel_id)
+                   VALUES (%s, %s)
+                   RETURNING *"""
+
+_TOUCH_DEAL_SQL = "UPDATE nx_deal SET last_activity_at = NOW() WHERE id = %s"
+
+_DEAL_INTEL_SQL = """SELECT di.*, i.title, i.raw_input, i.parsed_json, i.status, i.created_at AS intel_created_at
+                   FROM nx_deal_intel di
+                   JOIN nx_intel i ON di.intel_id = i.id
+                   WHERE di.deal_id = %s
+                   ORDER BY i.created_at DESC"""
+
+# Nested parts of the deal detail, each one correlated json_agg sub-select
+# so the whole page is a single statement (one round trip, one snapshot).
+# Same rows and order as get_deal_partners / get_deal_intel /
+# get_open_tbds("deal", id) / get_files_by_deal / get_entity_tags("deal", id).
+_DEAL_DETAIL_PARTS = {
+    "partners": """(SELECT COALESCE(json_agg(x ORDER BY x.id), '[]')
+                     FROM (SELECT dp.*, p.name AS partner_name, p.trust_level
+                           FROM nx_deal_partner dp
+                           JOIN nx_partner p ON dp.partner_id = p.id
+                           WHERE dp.deal_id = d.id) x)""",
+    "intel": """(SELECT COALESCE(json_agg(x ORDER BY x.intel_created_at DESC), '[]')
+                  FROM (SELECT di.*, i.title, i.raw_input, i.parsed_json, i.status,
+                               i.created_at AS intel_created_at
+                        FROM nx_deal_intel di
+                        JOIN nx_intel i ON di.intel_id = i.id
+                        WHERE di.deal_id = d.id) x)""",
+    "tbds": """(SELECT COALESCE(json_agg(x ORDER BY x.created_at, x.id), '[]')
+                 FROM (SELECT * FROM nx_tbd_item
+                       WHERE linked_type = 'deal' AND linked_id = d.id
+                         AND resolved = FALSE) x)""",
+    "files": """(SELECT COALESCE(json_agg(x ORDER BY x.created_at DESC), '[]')
+                  FROM (SELECT * FROM nx_file WHERE deal_id = d.id) x)""",
+    "tags": """(SELECT COALESCE(json_agg(x ORDER BY x.category, x.name), '[]')
+                 FROM (SELECT t.* FROM nx_tag t
+                       JOIN nx_entity_tag et ON t.id = et.tag_id
+                       WHERE et.entity_type = 'deal' AND et.entity_id = d.id) x)""",
+}
+DEAL_DETAIL_NESTED = {*_DEAL_DETAIL_PARTS, "meddic_progress"}
+
+
+def _get_deal_query(deal_id: int, fields: list[str] | None) -> tuple[str, tuple]:
+    return _GET_DEAL_SQL.format(columns=DEAL_FIELDS.select(fields)), (deal_id,)
+
+
+def _deal_detail_query(
+    deal_id: int, fields: list[str] | None
+) -> tuple[str, tuple, set, bool]:
+    """Statement for get_deal_detail(), plus the nested parts it selects
+    and whether meddic_json was added only to derive meddic_progress."""
+    columns, nested = split_fields(fields, DEAL_DETAIL_NESTED)
+    borrowed_meddic = (
+        "meddic_progress" in nested
+        and columns is not None
+        and "meddic_json" not in columns
+    )
+    if borrowed_meddic:
+        columns.append("meddic_json")
+    select = [DEAL_FIELDS.select(columns)]
+    select += [
+        f"{sql} AS {part}" for part, sql in _DEAL_DETAIL_PARTS.items() if part in nested
+    ]
+    sql = _GET_DEAL_SQL.format(columns=",\n       ".join(select))
+    return sql, (deal_id,), nested, borrowed_meddic
+
+
+def _finish_deal_detail(deal: dict | None, nested: set, borrowed_meddic: bool):
+    if deal is None:
+        return None
+    if "meddic_progress" in nested:
+        deal["meddic_progress"] = _meddic_progress(deal.get("meddic_json"))
+    if borrowed_meddic:
+        del deal["meddic_json"]
+    return deal
+
+
+def _page_query(
+    sql: str,
+    fieldset: Fieldset,
+    params: list,
+    limit: int | None,
+    cursor: str | None,
+    fields: list[str] | None,
+) -> tuple[str, list]:
+    """Fill ``{columns}`` / ``{after}`` / ``{order_by}`` in a deal list
+    query; a None ``limit`` binds LIMIT NULL, i.e. every row."""
+    after, after_params = DEAL_KEYSET.where(cursor)
+    sql = sql.format(
+        columns=fieldset.select(fields, ("id", *DEAL_KEYSET.fields)),
+        after=after,
+        order_by=DEAL_KEYSET.order_by(),
+    )
+    return sql, [*params, *after_params, limit]
+
+
+def _attach_partners(deals: list[dict], partner_rows: list[dict]) -> list[dict]:
+    partner_map: dict[int, list] = {}
+    for row in partner_rows:
+        partner_map.setdefault(row["deal_id"], []).append(row)
+    for d in deals:
+        d["partners"] = partner_map.get(d["id"], [])
+    return deals
+
 
 def create_deal(
     name: str,
@@ -27,9 +223,7 @@ def create_deal(
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                """INSERT INTO nx_deal (name, client_id, budget_range, timeline, meddic_json, budget_amount, budget_year)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s)
-                   RETURNING *""",
+                _CREATE_DEAL_SQL,
                 (
                     name,
                     client_id,
@@ -43,46 +237,58 @@ def create_deal(
             return row_to_dict(cur)
 
 
-def get_deal(deal_id: int) -> dict | None:
+def get_deal(deal_id: int, fields: list[str] | None = None) -> dict | None:
+    """Deal with client name/industry; ``fields`` narrows the columns read."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT d.*, c.name AS client_name, c.industry AS client_industry
-                   FROM nx_deal d
-                   JOIN nx_client c ON d.client_id = c.id
-                   WHERE d.id = %s""",
-                (deal_id,),
-            )
+            cur.execute(*_get_deal_query(deal_id, fields))
             return row_to_dict(cur)
 
 
-def get_all_deals(status: str = "active") -> list[dict]:
-    with get_connection() as conn:
+def get_all_deals(
+    status: str = "active",
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    """Deals by last activity, oldest first. With ``limit``, one page;
+    pass ``DEAL_KEYSET.next_cursor(rows, limit)`` back as ``cursor``."""
+    query = _page_query(
+        _GET_ALL_DEALS_SQL, DEAL_FIELDS, [status], limit, cursor, fields
+    )
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT d.*, c.name AS client_name, c.industry AS client_industry
-                   FROM nx_deal d
-                   JOIN nx_client c ON d.client_id = c.id
-                   WHERE d.status = %s
-                   ORDER BY d.last_activity_at ASC""",
-                (status,),
-            )
-            return rows_to_dicts(cur)
+            cur.execute(*query)
+            return rows_to_records(cur)
+
 
+def get_deal_detail(deal_id: int, fields: list[str] | None = None) -> dict | None:
+    """Deal page payload in one statement: the deal with partners, intel,
+    open TBDs, files, tags and MEDDIC progress.
+
+    ``fields`` narrows columns and nested parts alike (see database.fieldsets);
+    unrequested parts are left out of the SQL.
+    """
+    sql, params, nested, borrowed_meddic = _deal_detail_query(deal_id, fields)
+    with get_connection(readonly=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return _finish_deal_detail(row_to_dict(cur), nested, borrowed_meddic)
 
-def get_deals_by_urgency() -> list[dict]:
+
+def get_deals_by_urgency(
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
     """Get active deals sorted by idle days (most idle first)."""
-    with get_connection() as conn:
+    query = _page_query(
+        _DEALS_BY_URGENCY_SQL, DEAL_URGENCY_FIELDS, [], limit, cursor, fields
+    )
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT d.*, c.name AS client_name, c.industry AS client_industry,
-                          EXTRACT(DAY FROM NOW() - d.last_activity_at)::INTEGER AS idle_days
-                   FROM nx_deal d
-                   JOIN nx_client c ON d.client_id = c.id
-                   WHERE d.status = 'active'
-                   ORDER BY idle_days DESC"""
-            )
-            return rows_to_dicts(cur)
+            cur.execute(*query)
+            return rows_to_records(cur)
 
 
 def get_deals_needing_push(threshold_days: int = 14) -> list[dict]:
@@ -161,47 +367,19 @@ def get_deals_by_client(client_id: int) -> list[dict]:
     """Get all deals for a specific client, with partners attached."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT d.*, c.name AS client_name, c.industry AS client_industry
-                   FROM nx_deal d
-                   JOIN nx_client c ON d.client_id = c.id
-                   WHERE d.client_id = %s
-                   ORDER BY d.last_activity_at DESC""",
-                (client_id,),
-            )
+            cur.execute(_DEALS_BY_CLIENT_SQL, (client_id,))
             deals = rows_to_dicts(cur)
             if not deals:
                 return deals
-            deal_ids = tuple(d["id"] for d in deals)
-            cur.execute(
-                """SELECT dp.deal_id, p.name AS partner_name, dp.role
-                    FROM nx_deal_partner dp
-                    JOIN nx_partner p ON dp.partner_id = p.id
-                    WHERE dp.deal_id IN %s""",
-                (deal_ids,),
-            )
-            partner_rows = rows_to_dicts(cur)
-            partner_map: dict[int, list] = {}
-            for row in partner_rows:
-                partner_map.setdefault(row["deal_id"], []).append(row)
-            for d in deals:
-                d["partners"] = partner_map.get(d["id"], [])
-            return deals
+            cur.execute(_PARTNERS_FOR_DEALS_SQL, ([d["id"] for d in deals],))
+            return _attach_partners(deals, rows_to_dicts(cur))
 
 
 def get_deals_by_partner(partner_id: int) -> list[dict]:
     """Get all deals linked to a specific partner."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT d.*, c.name AS client_name, c.industry AS client_industry
-                   FROM nx_deal d
-                   JOIN nx_client c ON d.client_id = c.id
-                   JOIN nx_deal_partner dp ON dp.deal_id = d.id
-                   WHERE dp.partner_id = %s
-                   ORDER BY d.last_activity_at DESC""",
-                (partner_id,),
-            )
+            cur.execute(_DEALS_BY_PARTNER_SQL, (partner_id,))
             return rows_to_dicts(cur)
 
 
@@ -209,22 +387,13 @@ def touch_deal(deal_id: int) -> None:
     """Update last_activity_at to now."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                "UPDATE nx_deal SET last_activity_at = NOW() WHERE id = %s",
-                (deal_id,),
-            )
+            cur.execute(_TOUCH_DEAL_SQL, (deal_id,))
 
 
-def get_meddic_progress(deal_id: int) -> dict:
-    """Return MEDDIC completion status."""
-    deal = get_deal(deal_id)
-    if not deal or not deal.get("meddic_json"):
+def _meddic_progress(meddic_json) -> dict:
+    if not meddic_json:
         return {"completed": 0, "total": 6, "missing": list(MEDDIC_KEYS)}
-    meddic = (
-        deal["meddic_json"]
-        if isinstance(deal["meddic_json"], dict)
-        else json.loads(deal["meddic_json"])
-    )
+    meddic = meddic_json if isinstance(meddic_json, dict) else json.loads(meddic_json)
     completed = [k for k in MEDDIC_KEYS if meddic.get(k)]
     missing = [k for k in MEDDIC_KEYS if not meddic.get(k)]
     return {
@@ -235,6 +404,16 @@ def get_meddic_progress(deal_id: int) -> dict:
     }
 
 
+def get_meddic_progress(deal_id: int, deal: dict | None = None) -> dict:
+    """Return MEDDIC completion status.
+
+    Pass an already-fetched ``deal`` to skip re-reading it.
+    """
+    if deal is None:
+        deal = get_deal(deal_id)
+    return _meddic_progress(deal.get("meddic_json") if deal else None)
+
+
 # --- Deal-Partner M2M ---
 
 
@@ -253,13 +432,7 @@ def add_partner_to_deal(deal_id: int, partner_id: int, role: str | None = None)
 def get_deal_partners(deal_id: int) -> list[dict]:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT dp.*, p.name AS partner_name, p.trust_level
-                   FROM nx_deal_partner dp
-                   JOIN nx_partner p ON dp.partner_id = p.id
-                   WHERE dp.deal_id = %s""",
-                (deal_id,),
-            )
+            cur.execute(_DEAL_PARTNERS_SQL, (deal_id,))
             return rows_to_dicts(cur)
 
 
@@ -279,32 +452,17 @@ def remove_partner_from_deal(deal_id: int, partner_id: int) -> bool:
 def link_intel_to_deal(deal_id: int, intel_id: int) -> dict:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """INSERT INTO nx_deal_intel (deal_id, intel_id)
-                   VALUES (%s, %s)
-                   RETURNING *""",
-                (deal_id, intel_id),
-            )
+            cur.execute(_LINK_INTEL_SQL, (deal_id, intel_id))
             result = row_to_dict(cur)
             # Touch deal in same connection to avoid lock
-            cur.execute(
-                "UPDATE nx_deal SET last_activity_at = NOW() WHERE id = %s",
-                (deal_id,),
-            )
+            cur.execute(_TOUCH_DEAL_SQL, (deal_id,))
             return result
 
 
 def get_deal_intel(deal_id: int) -> list[dict]:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """SELECT di.*, i.title, i.raw_input, i.parsed_json, i.status, i.created_at AS intel_created_at
-                   FROM nx_deal_intel di
-                   JOIN nx_intel i ON di.intel_id = i.id
-                   WHERE di.deal_id = %s
-                   ORDER BY i.created_at DESC""",
-                (deal_id,),
-            )
+            cur.execute(_DEAL_INTEL_SQL, (deal_id,))
             return rows_to_dicts(cur)
 
 
@@ -316,3 +474,122 @@ def unlink_intel_from_deal(deal_id: int, intel_id: int) -> bool:
                 (deal_id, intel_id),
             )
             return cur.rowcount > 0
+
+
+# ---------------------------------------------------------------------------
+# Async variants — same SQL, run on the event loop via get_async_connection()
+# ---------------------------------------------------------------------------
+
+
+async def create_deal_async(
+    name: str,
+    client_id: int,
+    budget_range: str | None = None,
+    timeline: str | None = None,
+    budget_amount: float | None = None,
+    budget_year: int | None = None,
+) -> dict:
+    meddic_init = json.dumps({k: None for k in MEDDIC_KEYS})
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                _CREATE_DEAL_SQL,
+                (
+                    name,
+                    client_id,
+                    budget_range,
+                    timeline,
+                    meddic_init,
+                    budget_amount,
+                    budget_year,
+                ),
+            )
+            return await async_row_to_dict(cur)
+
+
+async def get_deal_async(deal_id: int, fields: list[str] | None = None) -> dict | None:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*_get_deal_query(deal_id, fields))
+            return await async_row_to_dict(cur)
+
+
+async def get_deal_detail_async(
+    deal_id: int, fields: list[str] | None = None
+) -> dict | None:
+    sql, params, nested, borrowed_meddic = _deal_detail_query(deal_id, fields)
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(sql, params)
+            deal = await async_row_to_dict(cur)
+            return _finish_deal_detail(deal, nested, borrowed_meddic)
+
+
+async def get_all_deals_async(
+    status: str = "active",
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    query = _page_query(
+        _GET_ALL_DEALS_SQL, DEAL_FIELDS, [status], limit, cursor, fields
+    )
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*query)
+            return await async_rows_to_records(cur)
+
+
+async def get_deals_by_urgency_async(
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    query = _page_query(
+        _DEALS_BY_URGENCY_SQL, DEAL_URGENCY_FIELDS, [], limit, cursor, fields
+    )
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*query)
+            return await async_rows_to_records(cur)
+
+
+async def get_deals_by_client_async(client_id: int) -> list[dict]:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_DEALS_BY_CLIENT_SQL, (client_id,))
+            deals = await async_rows_to_dicts(cur)
+            if not deals:
+                return deals
+            await cur.execute(_PARTNERS_FOR_DEALS_SQL, ([d["id"] for d in deals],))
+            return _attach_partners(deals, await async_rows_to_dicts(cur))
+
+
+async def get_deals_by_partner_async(partner_id: int) -> list[dict]:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_DEALS_BY_PARTNER_SQL, (partner_id,))
+            return await async_rows_to_dicts(cur)
+
+
+async def get_deal_partners_async(deal_id: int) -> list[dict]:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_DEAL_PARTNERS_SQL, (deal_id,))
+            return await async_rows_to_dicts(cur)
+
+
+async def link_intel_to_deal_async(deal_id: int, intel_id: int) -> dict:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_LINK_INTEL_SQL, (deal_id, intel_id))
+            result = await async_row_to_dict(cur)
+            await cur.execute(_TOUCH_DEAL_SQL, (deal_id,))
+            return result
+
+
+async def get_deal_intel_async(deal_id: int) -> list[dict]:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_DEAL_INTEL_SQL, (deal_id,))
+            return await async_rows_to_dicts(cur)
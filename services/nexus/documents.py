@@ -1,18 +1,52 @@
 """Nexus document service — NDA/MOU tracking + file uploads."""
 
 from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.fieldsets import Fieldset
+from database.keyset import Keyset
+
+DOCUMENT_FIELDS = Fieldset(
+    "documents",
+    "d",
+    (
+        "id",
+        "client_id",
+        "doc_type",
+        "status",
+        "sign_date",
+        "expiry_date",
+        "file_path",
+        "notes",
+        "created_at",
+        "updated_at",
+    ),
+    {"client_name": "c.name"},
+)
+
+# Soonest expiry first, undated documents last
+DOCUMENT_KEYSET = Keyset(
+    "documents", [("d.expiry_date", "date", "infinity"), ("d.id", "integer")]
+)
 
 # --- NDA/MOU Document Tracking ---
 
 
-def get_all_documents() -> list[dict]:
+def get_all_documents(
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[dict]:
     """Get all NDA/MOU documents with client names."""
-    with get_connection() as conn:
+    after, params = DOCUMENT_KEYSET.where(cursor)
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            cur.execute("""SELECT d.*, c.name AS client_name
+            cur.execute(
+                f"""SELECT {DOCUMENT_FIELDS.select(fields, ("id", *DOCUMENT_KEYSET.fields))}
                    FROM nx_document d
                    JOIN nx_client c ON d.client_id = c.id
-                   ORDER BY d.expiry_date ASC NULLS LAST""")
+                   WHERE {after}
+                   ORDER BY {DOCUMENT_KEYSET.order_by()} LIMIT %s""",
+                [*params, limit],
+            )
             return rows_to_dicts(cur)
 
 
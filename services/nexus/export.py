@@ -0,0 +1,42 @@
+"""Nexus export — full-table reads streamed from server-side cursors."""
+
+import datetime
+from collections.abc import Iterator
+
+from database.connection import Row, stream_records
+
+# entity -> SQL with two placeholders: inclusive lower / exclusive upper
+# bound on the entity's date column (NULL = unbounded). Ordered by primary
+# key so the server-side cursor walks the PK index.
+EXPORT_QUERIES: dict[str, str] = {
+    "deals": """SELECT d.*, c.name AS client_name
+                FROM nx_deal d
+                LEFT JOIN nx_client c ON d.client_id = c.id
+                WHERE d.created_at >= COALESCE(%s::timestamptz, '-infinity')
+                  AND d.created_at < COALESCE(%s::timestamptz, 'infinity')
+                ORDER BY d.id""",
+    "intel": """SELECT * FROM nx_intel
+                WHERE created_at >= COALESCE(%s::timestamptz, '-infinity')
+                  AND created_at < COALESCE(%s::timestamptz, 'infinity')
+                ORDER BY id""",
+    "contacts": """SELECT * FROM nx_contact
+                   WHERE created_at >= COALESCE(%s::timestamptz, '-infinity')
+                     AND created_at < COALESCE(%s::timestamptz, 'infinity')
+                   ORDER BY id""",
+    "work_logs": """SELECT * FROM work_log
+                    WHERE log_date >= COALESCE(%s::date, '-infinity')
+                      AND log_date < COALESCE(%s::date, 'infinity')
+                    ORDER BY log_id""",
+}
+
+
+def iter_export(
+    entity: str,
+    since: datetime.date | None = None,
+    until: datetime.date | None = None,
+) -> Iterator[Row]:
+    """Stream every row of ``entity`` created in [since, until).
+
+    Raises KeyError for an unknown entity.
+    """
+    return stream_records(EXPORT_QUERIES[entity], (since, until))
@@ -1,6 +1,112 @@
 """Nexus intel service — CRUD for intelligence entries."""
 
-from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.connection import (
+    Row,
+    async_row_to_dict,
+    async_rows_to_records,
+    get_async_connection,
+    get_connection,
+    insert_many,
+    row_to_dict,
+    rows_to_dicts,
+    rows_to_records,
+)
+from database.fieldsets import Fieldset
+from database.keyset import Keyset
+
+# Newest first
+INTEL_KEYSET = Keyset(
+    "intel", [("i.created_at", "timestamptz"), ("i.id", "integer")], descending=True
+)
+
+# raw_input, parsed_json and chat_history are the heavy ones; narrow
+# ?fields= requests leave them out unless named
+INTEL_COLUMNS = (
+    "id",
+    "title",
+    "raw_input",
+    "input_type",
+    "parsed_json",
+    "chat_history",
+    "status",
+    "source_contact_id",
+    "created_at",
+    "updated_at",
+)
+INTEL_FIELDS = Fieldset("intel", "", INTEL_COLUMNS)
+INTEL_LIST_FIELDS = Fieldset(
+    "intel",
+    "i",
+    INTEL_COLUMNS,
+    {"file_count": "(SELECT COUNT(*) FROM nx_file f WHERE f.intel_id = i.id)"},
+)
+
+# SQL shared by the sync functions and their *_async twins below.
+_CREATE_INTEL_SQL = """INSERT INTO nx_intel (title, raw_input, input_type, parsed_json, source_contact_id)
+                   VALUES (%s, %s, %s, %s, %s)
+                   RETURNING *"""
+
+_GET_INTEL_SQL = "SELECT {columns} FROM nx_intel WHERE id = %s"
+
+_ALL_INTEL_SQL = """SELECT {columns}
+                       FROM nx_intel i
+                       WHERE {where}
+                       ORDER BY {order_by} LIMIT %s"""
+
+_UPDATE_INTEL_FIELDS = {
+    "title",
+    "raw_input",
+    "input_type",
+    "parsed_json",
+    "chat_history",
+    "status",
+    "source_contact_id",
+}
+
+
+def _get_intel_query(intel_id: int, fields: list[str] | None) -> tuple[str, tuple]:
+    return _GET_INTEL_SQL.format(columns=INTEL_FIELDS.select(fields)), (intel_id,)
+
+
+def _all_intel_query(
+    status: str | None, limit: int, cursor: str | None, fields: list[str] | None
+) -> tuple[str, list]:
+    where, params = INTEL_KEYSET.where(cursor)
+    if status:
+        where, params = f"i.status = %s AND {where}", [status, *params]
+    sql = _ALL_INTEL_SQL.format(
+        columns=INTEL_LIST_FIELDS.select(fields, ("id", *INTEL_KEYSET.fields)),
+        where=where,
+        order_by=INTEL_KEYSET.order_by(),
+    )
+    return sql, [*params, limit]
+
+
+def _confirm_intel_query(intel_id: int, parsed_json: str | None) -> tuple[str, tuple]:
+    if parsed_json:
+        return (
+            """UPDATE nx_intel SET status = 'confirmed', parsed_json = %s,
+                       updated_at = NOW() WHERE id = %s RETURNING *""",
+            (parsed_json, intel_id),
+        )
+    return (
+        """UPDATE nx_intel SET status = 'confirmed',
+                       updated_at = NOW() WHERE id = %s RETURNING *""",
+        (intel_id,),
+    )
+
+
+def _update_intel_query(intel_id: int, fields: dict) -> tuple[str, list] | None:
+    """Build the UPDATE for allowed fields, or None if nothing to update."""
+    filtered = {k: v for k, v in fields.items() if k in _UPDATE_INTEL_FIELDS}
+    if not filtered:
+        return None
+    set_clause = ", ".join(f"{k} = %s" for k in filtered)
+    values = list(filtered.values()) + [intel_id]
+    return (
+        f"UPDATE nx_intel SET {set_clause}, updated_at = NOW() WHERE id = %s RETURNING *",
+        values,
+    )
 
 
 def _table_has_column(cur, table_name: str, column_name: str) -> bool:
@@ -23,18 +129,16 @@ def create_intel(
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                """INSERT INTO nx_intel (title, raw_input, input_type, parsed_json, source_contact_id)
-                   VALUES (%s, %s, %s, %s, %s)
-                   RETURNING *""",
+                _CREATE_INTEL_SQL,
                 (title, raw_input, input_type, parsed_json, source_contact_id),
             )
             return row_to_dict(cur)
 
 
-def get_intel(intel_id: int) -> dict | None:
+def get_intel(intel_id: int, fields: list[str] | None = None) -> dict | None:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM nx_intel WHERE id = %s", (intel_id,))
+            cur.execute(*_get_intel_query(intel_id, fields))
             return row_to_dict(cur)
 
 
@@ -50,70 +154,32 @@ def get_intel_by_ids(intel_ids: list[int]) -> list[dict]:
             return rows_to_dicts(cur)
 
 
-def get_all_intel(status: str | None = None, limit: int = 50) -> list[dict]:
-    with get_connection() as conn:
+def get_all_intel(
+    status: str | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            if status:
-                cur.execute(
-                    """SELECT i.*,
-                              (SELECT COUNT(*) FROM nx_file f WHERE f.intel_id = i.id) AS file_count
-                       FROM nx_intel i
-                       WHERE i.status = %s
-                       ORDER BY i.created_at DESC LIMIT %s""",
-                    (status, limit),
-                )
-            else:
-                cur.execute(
-                    """SELECT i.*,
-                              (SELECT COUNT(*) FROM nx_file f WHERE f.intel_id = i.id) AS file_count
-                       FROM nx_intel i
-                       ORDER BY i.created_at DESC LIMIT %s""",
-                    (limit,),
-                )
-            return rows_to_dicts(cur)
+            cur.execute(*_all_intel_query(status, limit, cursor, fields))
+            return rows_to_records(cur)
 
 
 def confirm_intel(intel_id: int, parsed_json: str | None = None) -> dict | None:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            if parsed_json:
-                cur.execute(
-                    """UPDATE nx_intel SET status = 'confirmed', parsed_json = %s,
-                       updated_at = NOW() WHERE id = %s RETURNING *""",
-                    (parsed_json, intel_id),
-                )
-            else:
-                cur.execute(
-                    """UPDATE nx_intel SET status = 'confirmed',
-                       updated_at = NOW() WHERE id = %s RETURNING *""",
-                    (intel_id,),
-                )
+            cur.execute(*_confirm_intel_query(intel_id, parsed_json))
             return row_to_dict(cur)
 
 
 def update_intel(intel_id: int, **fields) -> dict | None:
-    if not fields:
-        return get_intel(intel_id)
-    allowed = {
-        "title",
-        "raw_input",
-        "input_type",
-        "parsed_json",
-        "chat_history",
-        "status",
-        "source_contact_id",
-    }
-    filtered = {k: v for k, v in fields.items() if k in allowed}
-    if not filtered:
+    query = _update_intel_query(intel_id, fields)
+    if query is None:
         return get_intel(intel_id)
-    set_clause = ", ".join(f"{k} = %s" for k in filtered)
-    values = list(filtered.values()) + [intel_id]
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                f"UPDATE nx_intel SET {set_clause}, updated_at = NOW() WHERE id = %s RETURNING *",
-                values,
-            )
+            cur.execute(*query)
             return row_to_dict(cur)
 
 
@@ -224,28 +290,83 @@ def materialize_intel_fields(intel_id: int, parsed: dict) -> int:
     Idempotent: deletes existing rows for this intel_id then re-inserts.
     Array values are split into separate rows.
     """
-    count = 0
+    rows = []
+    for key, value in parsed.items():
+        if value is None:
+            continue
+        if isinstance(value, list):
+            rows.extend((intel_id, key, str(item)) for item in value)
+        else:
+            rows.append((intel_id, key, str(value)))
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute("DELETE FROM nx_intel_field WHERE intel_id = %s", (intel_id,))
-            for key, value in parsed.items():
-                if value is None:
-                    continue
-                if isinstance(value, list):
-                    for item in value:
-                        cur.execute(
-                            """INSERT INTO nx_intel_field (intel_id, field_key, field_value)
-                               VALUES (%s, %s, %s)
-                               ON CONFLICT (intel_id, field_key, field_value) DO NOTHING""",
-                            (intel_id, key, str(item)),
-                        )
-                        count += 1
-                else:
-                    cur.execute(
-                        """INSERT INTO nx_intel_field (intel_id, field_key, field_value)
-                           VALUES (%s, %s, %s)
-                           ON CONFLICT (intel_id, field_key, field_value) DO NOTHING""",
-                        (intel_id, key, str(value)),
-                    )
-                    count += 1
-    return count
+            insert_many(
+                cur,
+                "nx_intel_field",
+                ("intel_id", "field_key", "field_value"),
+                rows,
+                on_conflict="(intel_id, field_key, field_value) DO NOTHING",
+            )
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Async variants — same SQL, run on the event loop via get_async_connection()
+# ---------------------------------------------------------------------------
+
+
+async def create_intel_async(
+    raw_input: str,
+    title: str | None = None,
+    input_type: str = "text",
+    parsed_json: str | None = None,
+    source_contact_id: int | None = None,
+) -> dict:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                _CREATE_INTEL_SQL,
+                (title, raw_input, input_type, parsed_json, source_contact_id),
+            )
+            return await async_row_to_dict(cur)
+
+
+async def get_intel_async(
+    intel_id: int, fields: list[str] | None = None
+) -> dict | None:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*_get_intel_query(intel_id, fields))
+            return await async_row_to_dict(cur)
+
+
+async def get_all_intel_async(
+    status: str | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[Row]:
+    async with get_async_connection(readonly=True) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*_all_intel_query(status, limit, cursor, fields))
+            return await async_rows_to_records(cur)
+
+
+async def confirm_intel_async(
+    intel_id: int, parsed_json: str | None = None
+) -> dict | None:
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*_confirm_intel_query(intel_id, parsed_json))
+            return await async_row_to_dict(cur)
+
+
+async def update_intel_async(intel_id: int, **fields) -> dict | None:
+    query = _update_intel_query(intel_id, fields)
+    if query is None:
+        return await get_intel_async(intel_id)
+    async with get_async_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(*query)
+            return await async_row_to_dict(cur)
@@ -1,14 +1,10 @@
 """Intel materialization engine — auto-create/match entities from parsed intel."""
 
+import functools
 import json
 import logging
 import re
 
-from opencc import OpenCC
-
-_cc_t2s = OpenCC("t2s")  # Traditional → Simplified
-_cc_s2t = OpenCC("s2t")  # Simplified → Traditional
-
 from database.connection import get_connection, rows_to_dicts
 from services.nexus.clients import create_client, find_client_by_name, update_client
 from services.nexus.contacts import create_contact, find_contact, update_contact
@@ -23,6 +19,31 @@ from services.nexus.subsidies import create_subsidy
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _opencc(config: str):
+    """OpenCC converter, built on first use: loading its dictionaries is the
+    slowest part of importing this module. warm_up() builds both early."""
+    from opencc import OpenCC
+
+    return OpenCC(config)
+
+
+def _t2s(text: str) -> str:
+    """Traditional → Simplified."""
+    return _opencc("t2s").convert(text)
+
+
+def _s2t(text: str) -> str:
+    """Simplified → Traditional."""
+    return _opencc("s2t").convert(text)
+
+
+def warm_up() -> None:
+    _opencc("t2s")
+    _opencc("s2t")
+
+
 # ---------------------------------------------------------------------------
 # Name normalization
 # ---------------------------------------------------------------------------
@@ -207,9 +228,9 @@ def _materialize_client(intel_id: int, parsed: dict, result: dict) -> int | None
     # Try original, then simplified, then traditional variants
     candidates = find_client_by_name(normalized)
     if not candidates:
-        candidates = find_client_by_name(_cc_t2s.convert(normalized))
+        candidates = find_client_by_name(_t2s(normalized))
     if not candidates:
-        candidates = find_client_by_name(_cc_s2t.convert(normalized))
+        candidates = find_client_by_name(_s2t(normalized))
 
     if candidates:
         client = candidates[0]
@@ -241,9 +262,9 @@ def _materialize_partner(intel_id: int, parsed: dict, result: dict) -> int | Non
     normalized = _normalize_company_name(partner_name)
     candidates = find_partner_by_name(normalized)
     if not candidates:
-        candidates = find_partner_by_name(_cc_t2s.convert(normalized))
+        candidates = find_partner_by_name(_t2s(normalized))
     if not candidates:
-        candidates = find_partner_by_name(_cc_s2t.convert(normalized))
+        candidates = find_partner_by_name(_s2t(normalized))
 
     if candidates:
         partner = candidates[0]
@@ -289,13 +310,9 @@ def _materialize_contacts(
 
     candidates = find_contact(name=contact_name, email=contact_email)
     if not candidates and contact_name:
-        candidates = find_contact(
-            name=_cc_t2s.convert(contact_name), email=contact_email
-        )
+        candidates = find_contact(name=_t2s(contact_name), email=contact_email)
     if not candidates and contact_name:
-        candidates = find_contact(
-            name=_cc_s2t.convert(contact_name), email=contact_email
-        )
+        candidates = find_contact(name=_s2t(contact_name), email=contact_email)
 
     if candidates:
         contact = candidates[0]
@@ -37,7 +37,7 @@ def get_partner(partner_id: int) -> dict | None:
 
 
 def get_all_partners(trust_level: str | None = None) -> list[dict]:
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             if trust_level:
                 cur.execute(
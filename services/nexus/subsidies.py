@@ -101,7 +101,7 @@ def get_all_subsidies(status: str = "active", view: str = "stage") -> list[dict]
             "CASE WHEN s.deadline_date IS NULL THEN 1 ELSE 0 END, s.deadline_date ASC"
         )
 
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute(
                 f"""SELECT s.*,
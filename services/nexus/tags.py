@@ -16,7 +16,7 @@ def create_tag(name: str, category: str) -> dict:
 
 
 def get_all_tags(category: str | None = None) -> list[dict]:
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             if category:
                 cur.execute(
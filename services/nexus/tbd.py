@@ -1,6 +1,30 @@
 """Nexus TBD service — skipped Q&A items + meeting action items."""
 
 from database.connection import get_connection, row_to_dict, rows_to_dicts
+from database.fieldsets import Fieldset
+from database.keyset import Keyset
+
+TBD_FIELDS = Fieldset(
+    "tbds",
+    "",
+    (
+        "id",
+        "question",
+        "context",
+        "linked_type",
+        "linked_id",
+        "source",
+        "resolved",
+        "resolved_at",
+        "created_at",
+    ),
+)
+
+# Open items first, then oldest first
+TBD_KEYSET = Keyset(
+    "tbds",
+    [("resolved", "boolean"), ("created_at", "timestamptz"), ("id", "integer")],
+)
 
 
 def create_tbd(
@@ -21,10 +45,13 @@ def create_tbd(
             return row_to_dict(cur)
 
 
-def get_tbd(tbd_id: int) -> dict | None:
+def get_tbd(tbd_id: int, fields: list[str] | None = None) -> dict | None:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT * FROM nx_tbd_item WHERE id = %s", (tbd_id,))
+            cur.execute(
+                f"SELECT {TBD_FIELDS.select(fields)} FROM nx_tbd_item WHERE id = %s",
+                (tbd_id,),
+            )
             return row_to_dict(cur)
 
 
@@ -47,17 +74,22 @@ def get_open_tbds(
             return rows_to_dicts(cur)
 
 
-def get_all_tbds(include_resolved: bool = False) -> list[dict]:
-    with get_connection() as conn:
+def get_all_tbds(
+    include_resolved: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> list[dict]:
+    after, params = TBD_KEYSET.where(cursor)
+    where = after if include_resolved else f"resolved = FALSE AND {after}"
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
-            if include_resolved:
-                cur.execute(
-                    "SELECT * FROM nx_tbd_item ORDER BY resolved, created_at ASC"
-                )
-            else:
-                cur.execute(
-                    "SELECT * FROM nx_tbd_item WHERE resolved = FALSE ORDER BY created_at ASC"
-                )
+            cur.execute(
+                f"""SELECT {TBD_FIELDS.select(fields, ("id", *TBD_KEYSET.fields))}
+                   FROM nx_tbd_item WHERE {where}
+                   ORDER BY {TBD_KEYSET.order_by()} LIMIT %s""",
+                [*params, limit],
+            )
             return rows_to_dicts(cur)
 
 
@@ -2,7 +2,6 @@
 S31: Refactored connection management to prevent nested connections.
 """
 
-import streamlit as st
 from constants import PRESALE_STATUS_CODES, POSTSALE_STATUS_CODES, VALID_TRANSITIONS
 from database.connection import (
     get_connection,
@@ -12,6 +11,7 @@ from database.connection import (
 )
 from services import meddic as meddic_svc
 from services.config import get_meddic_gate_rules
+from services.caching import cache_data
 
 
 def _check_meddic_gate(project_id: int, new_status: str):
@@ -105,9 +105,9 @@ def find_or_create_project(
             return new_project_id
 
 
-@st.cache_data
+@cache_data
 def get_all():
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute("SELECT * FROM project_list ORDER BY project_id")
             return rows_to_dicts(cur)
@@ -9,9 +9,8 @@ Public API:
     get_summary_by_client(client_id) → dict  # {deal_count, total_amount, weighted_amount}
 """
 
-import streamlit as st
-
 from database.connection import get_connection, row_to_dict, rows_to_dicts
+from services.caching import cache_data
 
 
 def create(
@@ -44,9 +43,9 @@ def create(
             return cur.fetchone()[0]
 
 
-@st.cache_data
+@cache_data
 def get_all():
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute("SELECT * FROM sales_plan ORDER BY plan_id")
             return rows_to_dicts(cur)
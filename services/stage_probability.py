@@ -9,15 +9,14 @@ Public API:
     update(status_code, probability) → None
 """
 
-import streamlit as st
-
 from database.connection import get_connection, rows_to_dicts
+from services.caching import cache_data
 
 
-@st.cache_data
+@cache_data
 def get_all():
     """Return all stage probabilities ordered by sort_order."""
-    with get_connection() as conn:
+    with get_connection(readonly=True) as conn:
         with conn.cursor() as cur:
             cur.execute("SELECT * FROM stage_probability ORDER BY sort_order")
             return rows_to_dicts(cur)
@@ -101,3 +101,13 @@ def update_task_status(
                     task_id,
                 ),
             )
+
+
+def count_by_status() -> dict[str, int]:
+    """
+    Counts tasks per status, e.g. {"pending": 3, "processing": 1}.
+    """
+    with get_connection(readonly=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT status, COUNT(*) FROM ai_task_queue GROUP BY status")
+            return dict(cur.fetchall())
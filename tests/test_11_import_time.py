@@ -0,0 +1,61 @@
+"""test_11_import_time — Cold-start budget for `import backend.main`.
+
+Runs the import in fresh interpreters (no browser or servers needed) and
+fails when it takes longer than IMPORT_BUDGET_S, or when a module the API
+loads lazily or in its startup warm-up creeps back onto the import path.
+"""
+
+import os
+import subprocess
+import sys
+
+from conftest import PROJECT_ROOT
+
+IMPORT_BUDGET_S = float(os.getenv("IMPORT_BUDGET_S", "0.35"))
+
+# Deferred to first use or to main._warm_up()
+DEFERRED_MODULES = (
+    "streamlit",
+    "opencc",
+    "yaml",
+    "httpx",
+    "google.generativeai",
+    "openai",
+    "anthropic",
+)
+
+_PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import backend.main
+print(time.perf_counter() - start)
+print(",".join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))
+"""
+
+
+def _import_backend() -> tuple[float, list[str]]:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seconds, loaded = result.stdout.splitlines()[-2:]
+    return float(seconds), [m for m in loaded.split(",") if m]
+
+
+class TestImportTime:
+    """`import backend.main` stays cheap."""
+
+    def test_import_within_budget(self):
+        # Best of three: the first run also pays for cold .pyc / disk caches
+        best = min(_import_backend()[0] for _ in range(3))
+        assert (
+            best <= IMPORT_BUDGET_S
+        ), f"import backend.main took {best:.3f}s (budget {IMPORT_BUDGET_S}s)"
+
+    def test_heavy_modules_stay_lazy(self):
+        _, loaded = _import_backend()
+        assert not loaded, f"imported eagerly by backend.main: {', '.join(loaded)}"
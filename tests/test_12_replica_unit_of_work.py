@@ -0,0 +1,58 @@
+"""test_12_replica_unit_of_work — Read-only units routed to the replica.
+
+Runs in fresh interpreters (no browser or servers needed) with
+DATABASE_REPLICA_URL pointing at the test database under another
+application_name, so reads are routed through the replica pool and its lag
+probe. The unit's SET TRANSACTION must still come first in its transaction.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import PROJECT_ROOT
+
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+
+_PROBE = """
+from database import connection
+
+for _ in range(2):
+    # Make the lag check due, as it is every few seconds in production
+    connection._replica_lag["checked_at"] = float("-inf")
+    with connection.unit_of_work(readonly=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT current_setting('application_name')")
+            print(cur.fetchone()[0])
+            cur.execute("SHOW transaction_isolation")
+            print(cur.fetchone()[0])
+"""
+
+
+def _with_app_name(url: str, name: str) -> str:
+    return url + ("&" if "?" in url else "?") + f"application_name={name}"
+
+
+@pytest.mark.skipif(not DATABASE_URL, reason="DATABASE_URL is not set")
+class TestReplicaUnitOfWork:
+    """unit_of_work(readonly=True) on the replica pool."""
+
+    def test_snapshot_unit_after_lag_check(self):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            cwd=PROJECT_ROOT,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(PROJECT_ROOT),
+                "DATABASE_REPLICA_URL": _with_app_name(DATABASE_URL, "nexus_replica"),
+                "DB_QUERY_STATS": "0",
+            },
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        # One (application_name, isolation) pair per unit
+        expected = ["nexus_replica", "repeatable read"] * 2
+        assert result.stdout.splitlines()[-4:] == expected
@@ -0,0 +1,205 @@
+"""test_13_connection_pool — BlockingConnectionPool without a database.
+
+Connections come from a fake factory (no browser, servers or Postgres
+needed). Covers FIFO handoff, the checkout timeout, slot release for dead
+connections, env sizing and the stats() counters.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+
+from conftest import PROJECT_ROOT
+from database.connection import BlockingConnectionPool, PoolTimeout
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, vars=None):
+        if self._conn.dead:
+            raise psycopg2.OperationalError("server closed the connection")
+        self._conn.pings += 1
+
+
+class _FakeInfo:
+    transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class _FakeConnection:
+    def __init__(self, serial: int):
+        self.serial = serial
+        self.closed = 0
+        self.dead = False
+        self.pings = 0
+        self.info = _FakeInfo()
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+class _FakePool(BlockingConnectionPool):
+    def __init__(self, minconn=0, maxconn=1, **kwargs):
+        self.opened: list[_FakeConnection] = []
+        super().__init__(minconn, maxconn, dsn="", **kwargs)
+
+    def _connect(self):
+        conn = _FakeConnection(len(self.opened))
+        self.opened.append(conn)
+        return conn
+
+
+def _wait_for(predicate, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestBlockingConnectionPool:
+    """Checkout, handoff and sizing rules."""
+
+    def test_waiters_are_served_fifo(self):
+        pool = _FakePool(maxconn=1)
+        held = pool.getconn()
+        served = []
+
+        def worker(n):
+            conn = pool.getconn()
+            served.append(n)
+            pool.putconn(conn)
+
+        threads = []
+        for n in range(4):
+            t = threading.Thread(target=worker, args=(n,))
+            t.start()
+            threads.append(t)
+            # Queue each worker before starting the next
+            _wait_for(lambda: pool.stats()["waiting"] == n + 1)
+        pool.putconn(held)
+        for t in threads:
+            t.join(2)
+        assert served == [0, 1, 2, 3]
+        # One connection was handed from thread to thread
+        assert len(pool.opened) == 1
+
+    def test_timeout_raises_pool_timeout(self):
+        pool = _FakePool(maxconn=1, timeout=0.05)
+        held = pool.getconn()
+        start = time.monotonic()
+        with pytest.raises(PoolTimeout):
+            pool.getconn()
+        assert time.monotonic() - start >= 0.05
+        assert pool.stats()["waiting"] == 0
+        pool.putconn(held)
+        assert pool.getconn() is held
+
+    def test_dead_idle_connection_is_replaced(self):
+        pool = _FakePool(minconn=1, maxconn=1, check_idle=0)
+        pool.opened[0].dead = True
+        conn = pool.getconn()
+        assert conn is pool.opened[1]
+        assert pool.opened[0].closed
+        assert pool.stats()["size"] == 1
+
+    def test_closed_idle_connection_frees_its_slot(self):
+        pool = _FakePool(maxconn=1)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.closed = 1
+        assert pool.getconn() is pool.opened[1]
+        assert pool.stats()["size"] == 1
+
+    def test_broken_return_lets_waiter_open_new_connection(self):
+        pool = _FakePool(maxconn=1)
+        held = pool.getconn()
+        got = []
+        t = threading.Thread(target=lambda: got.append(pool.getconn()))
+        t.start()
+        _wait_for(lambda: pool.stats()["waiting"] == 1)
+        held.info = _FakeInfo()
+        held.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+        pool.putconn(held)
+        t.join(2)
+        assert held.closed
+        assert got == [pool.opened[1]]
+        assert pool.stats()["size"] == 1
+
+    def test_stats_counters(self):
+        pool = _FakePool(minconn=1, maxconn=2, timeout=0.02)
+        a = pool.getconn()
+        b = pool.getconn()
+        with pytest.raises(PoolTimeout):
+            pool.getconn()
+        stats = pool.stats()
+        assert stats["size"] == 2
+        assert stats["max"] == 2
+        assert stats["idle"] == 0
+        assert stats["in_use"] == 2
+        assert stats["waiting"] == 0
+        assert stats["checkouts"] == 3
+        assert stats["waits"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_seconds"] >= 0.02
+        pool.putconn(a)
+        pool.putconn(b)
+        stats = pool.stats()
+        assert (stats["idle"], stats["in_use"]) == (2, 0)
+
+    def test_invalid_sizes_rejected(self):
+        with pytest.raises(ValueError):
+            _FakePool(minconn=3, maxconn=2)
+        with pytest.raises(ValueError):
+            _FakePool(maxconn=0)
+
+
+_SIZING_PROBE = """
+from database import connection
+
+opened = []
+connection.BlockingConnectionPool._connect = lambda self: opened.append(1) or object()
+pool = connection._get_pool()
+print(pool.minconn, pool.maxconn, pool.timeout, pool.check_idle, len(opened))
+"""
+
+
+class TestPoolSizingFromEnv:
+    """DB_POOL_* settings reach the shared pool."""
+
+    def test_env_sizing(self):
+        result = subprocess.run(
+            [sys.executable, "-c", _SIZING_PROBE],
+            cwd=PROJECT_ROOT,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(PROJECT_ROOT),
+                "DATABASE_URL": "postgresql://unused",
+                "DB_POOL_MIN": "3",
+                "DB_POOL_MAX": "7",
+                "DB_POOL_TIMEOUT": "1.5",
+                "DB_POOL_CHECK_IDLE": "12",
+            },
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["3", "7", "1.5", "12.0", "3"]
@@ -0,0 +1,47 @@
+"""test_14_migrate — Parsing of no-transaction migration files.
+
+Pure unit tests (no browser, servers or database needed).
+"""
+
+from database.migrate import _index_names, _split_statements
+
+
+class TestSplitStatements:
+    """Autocommit migrations run one statement at a time."""
+
+    def test_semicolon_in_comment(self):
+        sql = (
+            "-- migrate:no-transaction\n"
+            "-- Backfill first; the index build below needs it\n"
+            "UPDATE t SET a = 1 WHERE a IS NULL;\n"
+            "-- Built CONCURRENTLY; live writes keep going\n"
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_t_a ON t(a);\n"
+        )
+        assert _split_statements(sql) == [
+            "UPDATE t SET a = 1 WHERE a IS NULL",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_t_a ON t(a)",
+        ]
+
+    def test_multiline_statement_and_trailing_comment(self):
+        sql = (
+            "ALTER TABLE t\n"
+            "  -- keyset needs it\n"
+            "  ALTER COLUMN a SET NOT NULL;\n"
+            "-- done;\n"
+        )
+        assert _split_statements(sql) == [
+            "ALTER TABLE t\n  ALTER COLUMN a SET NOT NULL"
+        ]
+
+    def test_comment_only_file(self):
+        assert _split_statements("-- nothing; here\n\n") == []
+
+
+class TestIndexNames:
+    def test_concurrent_index_names(self):
+        sql = (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON t(a);\n"
+            "create unique index concurrently idx_b on t(b);\n"
+            "CREATE INDEX idx_c ON t(c);\n"
+        )
+        assert _index_names(sql) == ["idx_a", "idx_b"]
@@ -0,0 +1,163 @@
+"""test_15_table_versions — Write tracking behind the list ETags.
+
+Unit tests for database.table_versions and a TestClient round trip
+through ConditionalGetMiddleware (no browser, servers or database needed).
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.main import ConditionalGetMiddleware
+from database import table_versions
+from database.table_versions import ANY, write_targets
+
+
+@pytest.fixture(autouse=True)
+def fresh_versions(monkeypatch):
+    """Isolate the process-wide counters."""
+    monkeypatch.setattr(table_versions, "_versions", {})
+    monkeypatch.setattr(table_versions, "_bumped_at", {})
+
+
+class TestWriteTargets:
+    """Statements are attributed to the table they modify."""
+
+    @pytest.mark.parametrize(
+        "sql, tables",
+        [
+            ("INSERT INTO nx_deal (name) VALUES (%s)", {"nx_deal"}),
+            ("  update nx_client SET name = %s WHERE id = %s", {"nx_client"}),
+            ("DELETE FROM nx_deal_partner WHERE deal_id = %s", {"nx_deal_partner"}),
+            ("UPDATE ONLY nx_intel SET status = 'parsed'", {"nx_intel"}),
+            ("MERGE INTO nx_tag t USING src ON true", {"nx_tag"}),
+            ("COPY nx_contact FROM STDIN", {"nx_contact"}),
+            ("INSERT INTO public.nx_deal VALUES (1)", {"nx_deal"}),
+            ('INSERT INTO "public"."NX_Deal" VALUES (1)', {"nx_deal"}),
+            ('UPDATE "nx_client" SET name = 1', {"nx_client"}),
+            (b"DELETE FROM nx_file WHERE id = 1", {"nx_file"}),
+        ],
+    )
+    def test_dml(self, sql, tables):
+        assert write_targets(sql) == tables
+
+    @pytest.mark.parametrize(
+        "sql, tables",
+        [
+            ("TRUNCATE nx_deal", {"nx_deal"}),
+            ("TRUNCATE TABLE nx_deal, nx_client;", {"nx_deal", "nx_client"}),
+            (
+                'TRUNCATE ONLY public.nx_deal, "nx_intel" RESTART IDENTITY CASCADE',
+                {"nx_deal", "nx_intel"},
+            ),
+        ],
+    )
+    def test_truncate(self, sql, tables):
+        assert write_targets(sql) == tables
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "WITH moved AS (DELETE FROM a RETURNING *) INSERT INTO b SELECT * FROM moved",
+            "ALTER TABLE nx_deal ADD COLUMN x int",
+            "CREATE TABLE t (id int)",
+            "",
+        ],
+    )
+    def test_unparseable_is_any(self, sql):
+        assert write_targets(sql) == {ANY}
+
+
+class TestToken:
+    """Tokens change only when a covered table is bumped."""
+
+    def test_changes_only_after_bump(self):
+        before = table_versions.token(["nx_deal"])
+        assert table_versions.token(["nx_deal"]) == before
+        table_versions.bump({"nx_client"})
+        assert table_versions.token(["nx_deal"]) == before
+        table_versions.bump({"nx_deal"})
+        assert table_versions.token(["nx_deal"]) != before
+
+    def test_any_invalidates_every_token(self):
+        before = table_versions.token(["nx_deal"])
+        table_versions.bump({ANY})
+        assert table_versions.token(["nx_deal"]) != before
+
+    def test_table_order_is_irrelevant(self):
+        assert table_versions.token(["a", "b"]) == table_versions.token(["b", "a"])
+
+    def test_collected_writes_wait_for_bump(self):
+        before = table_versions.token(["nx_deal"])
+        with table_versions.collect_writes() as written:
+            table_versions.note_write("UPDATE nx_deal SET name = 'x'")
+            assert table_versions.token(["nx_deal"]) == before
+        assert written == {"nx_deal"}
+        table_versions.bump(written)
+        assert table_versions.token(["nx_deal"]) != before
+
+    def test_settle_window(self):
+        assert table_versions.token(["nx_deal"], settle_seconds=0.05) is not None
+        table_versions.bump({"nx_deal"})
+        assert table_versions.token(["nx_deal"], settle_seconds=0.05) is None
+        assert table_versions.token(["nx_client"], settle_seconds=0.05) is not None
+        time.sleep(0.06)
+        assert table_versions.token(["nx_deal"], settle_seconds=0.05) is not None
+
+
+def _client() -> tuple[TestClient, list[int]]:
+    calls = []
+    api = FastAPI()
+
+    @api.get("/api/nx/clients")
+    def list_clients():
+        calls.append(1)
+        return [{"id": len(calls)}]
+
+    @api.get("/api/nx/tags")
+    def list_tags():
+        return []
+
+    api.add_middleware(ConditionalGetMiddleware)
+    return TestClient(api), calls
+
+
+class TestConditionalGet:
+    """ETag round trip on a covered route."""
+
+    def test_not_modified_until_write(self):
+        client, calls = _client()
+        first = client.get("/api/nx/clients")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "no-cache"
+
+        cached = client.get("/api/nx/clients", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert len(calls) == 1
+
+        table_versions.note_write("INSERT INTO nx_client (name) VALUES ('x')")
+        fresh = client.get("/api/nx/clients", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert len(calls) == 2
+
+    def test_query_string_is_part_of_etag(self):
+        client, _ = _client()
+        etag = client.get("/api/nx/clients").headers["etag"]
+        other = client.get("/api/nx/clients?status=active")
+        assert other.headers["etag"] != etag
+
+    def test_unrelated_write_keeps_etag(self):
+        client, _ = _client()
+        etag = client.get("/api/nx/clients").headers["etag"]
+        table_versions.note_write("UPDATE nx_tag SET name = 'x'")
+        resp = client.get("/api/nx/clients", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_uncovered_route_has_no_etag(self):
+        client, _ = _client()
+        assert "etag" not in client.get("/api/nx/tags").headers
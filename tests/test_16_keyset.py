@@ -0,0 +1,126 @@
+"""test_16_keyset — Cursor encoding and the keyset WHERE clause.
+
+Pure unit tests (no browser, servers or database needed).
+"""
+
+import base64
+import datetime
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.main import invalid_query_param
+from database.keyset import InvalidCursor, Keyset
+
+INTEL = Keyset(
+    "intel", [("i.created_at", "timestamptz"), ("i.id", "integer")], descending=True
+)
+DEALS = Keyset("deals", [("d.last_activity_at", "timestamptz"), ("d.id", "integer")])
+DOCUMENTS = Keyset(
+    "documents", [("d.expiry_date", "date", "infinity"), ("d.id", "integer")]
+)
+
+CREATED = datetime.datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class TestCursorRoundTrip:
+    def test_datetime_key(self):
+        cursor = INTEL.encode({"created_at": CREATED, "id": 42, "title": "x"})
+        assert "=" not in cursor
+        created, row_id = INTEL.decode(cursor)
+        assert datetime.datetime.fromisoformat(created) == CREATED
+        assert row_id == 42
+
+    def test_date_and_null_key(self):
+        expiry = datetime.date(2026, 1, 31)
+        assert DOCUMENTS.decode(DOCUMENTS.encode({"expiry_date": expiry, "id": 7})) == [
+            "2026-01-31",
+            7,
+        ]
+        assert DOCUMENTS.decode(DOCUMENTS.encode({"expiry_date": None, "id": 8})) == [
+            None,
+            8,
+        ]
+
+    def test_next_cursor_only_for_full_pages(self):
+        rows = [{"created_at": CREATED, "id": n} for n in (3, 2)]
+        assert INTEL.next_cursor(rows, limit=3) is None
+        assert INTEL.next_cursor(rows, limit=None) is None
+        assert INTEL.decode(INTEL.next_cursor(rows, limit=2))[1] == 2
+
+
+class TestCursorRejection:
+    def test_cursor_from_another_list(self):
+        cursor = DEALS.encode({"last_activity_at": CREATED, "id": 1})
+        with pytest.raises(InvalidCursor, match="intel"):
+            INTEL.where(cursor)
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not base64!",
+            "%%%",
+            "abc",
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+            _raw_cursor("intel"),
+            _raw_cursor({"intel": [1, 2]}),
+            _raw_cursor(["intel"]),
+            _raw_cursor(["intel", 5]),
+            _raw_cursor(["intel", [1]]),
+            _raw_cursor(["intel", [1, 2, 3]]),
+        ],
+    )
+    def test_garbage_or_tampered(self, cursor):
+        with pytest.raises(InvalidCursor):
+            INTEL.decode(cursor)
+
+    def test_mapped_to_400(self):
+        api = FastAPI()
+        api.add_exception_handler(InvalidCursor, invalid_query_param)
+
+        @api.get("/items")
+        def items(cursor: str):
+            INTEL.where(cursor)
+            return []
+
+        resp = TestClient(api).get("/items", params={"cursor": "garbage"})
+        assert resp.status_code == 400
+        assert resp.json() == {"detail": "Malformed cursor"}
+
+
+class TestWhere:
+    def test_first_page(self):
+        assert INTEL.where(None) == ("TRUE", [])
+        assert INTEL.where("") == ("TRUE", [])
+
+    def test_descending_compares_less_than(self):
+        cursor = INTEL.encode({"created_at": CREATED, "id": 42})
+        sql, params = INTEL.where(cursor)
+        assert sql == "(i.created_at, i.id) < (%s::timestamptz, %s::integer)"
+        assert params == [CREATED.isoformat(), 42]
+        assert INTEL.order_by() == "i.created_at DESC, i.id DESC"
+
+    def test_ascending_compares_greater_than(self):
+        sql, _ = DEALS.where(DEALS.encode({"last_activity_at": CREATED, "id": 1}))
+        assert sql == "(d.last_activity_at, d.id) > (%s::timestamptz, %s::integer)"
+        assert DEALS.order_by() == "d.last_activity_at ASC, d.id ASC"
+
+    def test_null_sentinel_uses_coalesce(self):
+        sql, params = DOCUMENTS.where(DOCUMENTS.encode({"expiry_date": None, "id": 8}))
+        assert sql == (
+            "(COALESCE(d.expiry_date, 'infinity'::date), d.id) > "
+            "(COALESCE(%s::date, 'infinity'::date), %s::integer)"
+        )
+        assert params == [None, 8]
+        assert DOCUMENTS.order_by() == (
+            "COALESCE(d.expiry_date, 'infinity'::date) ASC, d.id ASC"
+        )
+
+    def test_fields_strip_table_alias(self):
+        assert DOCUMENTS.fields == ("expiry_date", "id")
@@ -0,0 +1,157 @@
+"""test_17_compression — CompressionMiddleware at the ASGI level.
+
+Drives the middleware with hand-built ASGI messages and decompresses what
+it sends (no browser, servers or database needed).
+"""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from backend import compression
+from backend.compression import CompressionMiddleware
+
+JSON = b"application/json"
+BODY = b'{"id": 1, "name": "client"},' * 100
+
+
+def _app(content_type: bytes, chunks: list[bytes], extra_headers=()):
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type), *extra_headers],
+            }
+        )
+        for i, chunk in enumerate(chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": i < len(chunks) - 1,
+                }
+            )
+
+    return app
+
+
+def _run(app, accept_encoding: str | None, on_send=None, **kwargs) -> list[dict]:
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+        if on_send is not None:
+            on_send(message)
+
+    asyncio.run(CompressionMiddleware(app, **kwargs)(scope, receive, send))
+    return sent
+
+
+def _headers(sent: list[dict]) -> dict[bytes, bytes]:
+    return dict(sent[0]["headers"])
+
+
+def _body(sent: list[dict]) -> bytes:
+    return b"".join(m.get("body", b"") for m in sent[1:])
+
+
+class TestNegotiation:
+    def test_prefers_brotli(self):
+        brotli = pytest.importorskip("brotli")
+        sent = _run(_app(JSON, [BODY]), "gzip, deflate, br")
+        headers = _headers(sent)
+        assert headers[b"content-encoding"] == b"br"
+        assert headers[b"vary"] == b"Accept-Encoding"
+        assert int(headers[b"content-length"]) == len(_body(sent))
+        assert brotli.decompress(_body(sent)) == BODY
+
+    def test_gzip_when_brotli_refused(self):
+        sent = _run(_app(JSON, [BODY]), "br;q=0, gzip")
+        assert _headers(sent)[b"content-encoding"] == b"gzip"
+        assert gzip.decompress(_body(sent)) == BODY
+
+    def test_gzip_when_brotli_missing(self, monkeypatch):
+        monkeypatch.setattr(compression, "_brotli", lambda: None)
+        sent = _run(_app(JSON, [BODY]), "br, gzip")
+        assert _headers(sent)[b"content-encoding"] == b"gzip"
+        assert gzip.decompress(_body(sent)) == BODY
+
+    @pytest.mark.parametrize("accept", [None, "identity", "gzip;q=0", "deflate"])
+    def test_identity(self, accept):
+        sent = _run(_app(JSON, [BODY]), accept)
+        assert b"content-encoding" not in _headers(sent)
+        assert _body(sent) == BODY
+
+
+class TestPassThrough:
+    def test_below_minimum_size(self):
+        small = b'{"id": 1}'
+        sent = _run(_app(JSON, [small]), "gzip")
+        assert b"content-encoding" not in _headers(sent)
+        assert _body(sent) == small
+
+    def test_streamed_below_minimum_size(self):
+        sent = _run(_app(JSON, [b"[", b"1", b"]"]), "gzip")
+        assert b"content-encoding" not in _headers(sent)
+        assert _body(sent) == b"[1]"
+
+    def test_event_stream(self):
+        events = [b"event: delta\ndata: {}\n\n" * 100] * 3
+        sent = _run(_app(b"text/event-stream; charset=utf-8", events), "gzip")
+        assert b"content-encoding" not in _headers(sent)
+        assert [m["body"] for m in sent[1:]] == events
+
+    def test_already_encoded(self):
+        encoded = gzip.compress(BODY)
+        sent = _run(_app(JSON, [encoded], [(b"content-encoding", b"gzip")]), "br, gzip")
+        assert _headers(sent)[b"content-encoding"] == b"gzip"
+        assert _body(sent) == encoded
+
+    def test_binary_media_type(self):
+        sent = _run(_app(b"image/png", [BODY]), "gzip")
+        assert b"content-encoding" not in _headers(sent)
+        assert _body(sent) == BODY
+
+
+class TestStreaming:
+    def test_gzip_chunks_decode_incrementally(self):
+        lines = [b'{"row": %d, "pad": "%s"}\n' % (n, b"x" * 600) for n in range(6)]
+        decoder = zlib.decompressobj(31)
+        decoded = []
+
+        def on_send(message):
+            if message["type"] == "http.response.body":
+                decoded.append(decoder.decompress(message["body"]))
+
+        sent = _run(_app(b"application/x-ndjson", lines), "gzip", on_send=on_send)
+        headers = _headers(sent)
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        # Buffered up to minimum_size (two lines), then one chunk per line
+        assert decoded == [lines[0] + lines[1], *lines[2:]]
+        assert decoder.eof
+
+    def test_brotli_chunks_decode_incrementally(self):
+        brotli = pytest.importorskip("brotli")
+        lines = [b"id,name,%s\n" % (b"y" * 700) for _ in range(4)]
+        decoder = brotli.Decompressor()
+        decoded = []
+
+        def on_send(message):
+            if message["type"] == "http.response.body":
+                decoded.append(decoder.process(message["body"]))
+
+        sent = _run(_app(b"text/csv", lines), "br", on_send=on_send)
+        assert _headers(sent)[b"content-encoding"] == b"br"
+        assert decoded == [lines[0] + lines[1], *lines[2:]]
+        assert decoder.is_finished()
@@ -0,0 +1,154 @@
+"""test_18_batch — /api/nx/batch grouping, shared read unit and error isolation.
+
+Mounts the batch router next to a stub router in a fresh app; the shared
+unit_of_work is replaced by a marker connection (no browser, servers or
+database needed).
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from backend.routers.nexus import batch
+from database import connection
+
+SHARED = "shared-unit-connection"
+
+
+def _stub_router(log: list) -> APIRouter:
+    items = {1: {"id": 1, "name": "first"}}
+    stub = APIRouter()
+
+    @stub.get("/")
+    def list_items():
+        log.append("list")
+        return {"items": sorted(items), "conn": connection._uow_conn.get()}
+
+    @stub.get("/slow")
+    async def slow():
+        log.append("slow")
+        await asyncio.sleep(0)
+        return {"conn": connection._uow_conn.get()}
+
+    @stub.get("/boom")
+    def boom():
+        raise RuntimeError("handler bug")
+
+    @stub.get("/{item_id}")
+    def get_item(item_id: int):
+        log.append(f"get {item_id}")
+        if item_id not in items:
+            raise HTTPException(404, "Item not found")
+        return {**items[item_id], "conn": connection._uow_conn.get()}
+
+    @stub.post("/", status_code=201)
+    def create_item(body: dict):
+        log.append("create")
+        item_id = max(items) + 1
+        items[item_id] = {"id": item_id, **body}
+        return {**items[item_id], "conn": connection._uow_conn.get()}
+
+    return stub
+
+
+@pytest.fixture
+def env(monkeypatch):
+    log: list[str] = []
+    units: list[bool] = []
+
+    @asynccontextmanager
+    async def fake_unit(readonly: bool = False):
+        units.append(readonly)
+        token = connection._uow_conn.set(SHARED)
+        try:
+            yield SHARED
+        finally:
+            connection._uow_conn.reset(token)
+
+    monkeypatch.setattr(batch, "unit_of_work_async", fake_unit)
+    app = FastAPI()
+    app.include_router(_stub_router(log), prefix="/api/nx/items")
+    app.include_router(batch.router, prefix="/api/nx/batch")
+    return TestClient(app), log, units
+
+
+def _batch(client: TestClient, *requests) -> list[dict]:
+    resp = client.post("/api/nx/batch/", json={"requests": list(requests)})
+    assert resp.status_code == 200, resp.text
+    return resp.json()["responses"]
+
+
+class TestGrouping:
+    def test_results_in_request_order(self, env):
+        client, _, _ = env
+        results = _batch(client, {"path": "/items/1"}, {"path": "items"})
+        assert [r["status"] for r in results] == [200, 200]
+        assert results[0]["body"]["name"] == "first"
+        assert results[1]["body"]["items"] == [1]
+
+    def test_read_after_write_sees_it(self, env):
+        client, log, _ = env
+        results = _batch(
+            client,
+            {"path": "/items/"},
+            {"method": "POST", "path": "/items/", "body": {"name": "second"}},
+            {"path": "/items/2"},
+        )
+        assert [r["status"] for r in results] == [200, 201, 200]
+        assert results[2]["body"]["name"] == "second"
+        assert log == ["list", "create", "get 2"]
+
+    def test_limits(self, env):
+        client, _, _ = env
+        assert client.post("/api/nx/batch/", json={"requests": []}).status_code == 400
+        many = [{"path": "/items/1"}] * (batch.MAX_SUBREQUESTS + 1)
+        assert client.post("/api/nx/batch/", json={"requests": many}).status_code == 400
+
+
+class TestSharedUnit:
+    def test_sync_reads_share_one_unit(self, env):
+        client, _, units = env
+        results = _batch(client, {"path": "/items/1"}, {"path": "/items/"})
+        assert units == [True]
+        assert [r["body"]["conn"] for r in results] == [SHARED, SHARED]
+
+    def test_single_sync_read_opens_no_unit(self, env):
+        client, _, units = env
+        results = _batch(client, {"path": "/items/1"}, {"path": "/items/slow"})
+        assert units == []
+        assert [r["body"]["conn"] for r in results] == [None, None]
+
+    def test_write_runs_outside_the_unit(self, env):
+        client, _, units = env
+        results = _batch(
+            client,
+            {"method": "POST", "path": "/items/", "body": {"name": "x"}},
+            {"path": "/items/1"},
+            {"path": "/items/2"},
+        )
+        assert units == [True]
+        assert [r["body"]["conn"] for r in results] == [None, SHARED, SHARED]
+
+
+class TestErrorIsolation:
+    def test_failures_stay_in_their_entry(self, env):
+        client, _, _ = env
+        results = _batch(
+            client,
+            {"path": "/items/1"},
+            {"path": "/items/99"},
+            {"path": "/items/boom"},
+            {"path": "/items/not-a-number"},
+            {"path": "/nowhere/at/all"},
+            {"path": "/batch/"},
+            {"method": "TRACE", "path": "/items/1"},
+            {"path": "/items/"},
+        )
+        expected = [200, 404, 500, 422, 404, 400, 405, 200]
+        assert [r["status"] for r in results] == expected
+        assert results[1]["body"] == {"detail": "Item not found"}
+        assert results[2]["body"] == {"detail": "Internal Server Error"}
+        assert results[5]["body"] == {"detail": "/batch/ cannot be batched"}
@@ -0,0 +1,191 @@
+"""test_19_ai_cache — AI response cache in services.ai_provider.
+
+Provider calls are stubbed (no browser, servers, database or API keys
+needed). Covers the LRU, cache keys, opt-in TTLs, the validate hook,
+hit/miss counting and the DB tier's unit_of_work guard.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from database import connection
+from services import ai_provider
+from services.ai_provider import AI_CACHE_LOOKUPS, _LRUCache, _cache_slot, set_cache_ttl
+
+PROMPT = "Extract the fields as JSON."
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(ai_provider, "_memory_cache", _LRUCache(16))
+    monkeypatch.setattr(ai_provider, "_prompt_ttls", {})
+    monkeypatch.setattr(ai_provider, "AI_CACHE_TTL_SECONDS", 0.0)
+    monkeypatch.setattr(ai_provider, "AI_CACHE_DB", False)
+    monkeypatch.setenv("AI_PROVIDER", "gemini")
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    """Stub provider answering from a queue; records the user texts asked."""
+    asked = []
+    replies = []
+
+    def call(generate, system_prompt, user_text, *args):
+        asked.append(user_text)
+        return replies.pop(0) if replies else f"reply to {user_text}"
+
+    async def call_async(generate, system_prompt, user_text, *args):
+        return call(generate, system_prompt, user_text)
+
+    monkeypatch.setattr(ai_provider, "_call_with_fallback", call)
+    monkeypatch.setattr(ai_provider, "_call_with_fallback_async", call_async)
+    return asked, replies
+
+
+def _lookups(result: str) -> float:
+    return AI_CACHE_LOOKUPS._values.get(("text", result), 0)
+
+
+class TestLRUCache:
+    def test_get_and_expiry(self):
+        cache = _LRUCache(4)
+        cache.put("fresh", "a", 60)
+        cache.put("stale", "b", 0)
+        assert cache.get("fresh") == "a"
+        assert cache.get("stale") is None
+        assert "stale" not in cache._entries
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = _LRUCache(2)
+        cache.put("a", "1", 60)
+        cache.put("b", "2", 60)
+        cache.get("a")
+        cache.put("c", "3", 60)
+        assert list(cache._entries) == ["a", "c"]
+        assert cache.get("b") is None
+
+    def test_put_refreshes_position_and_value(self):
+        cache = _LRUCache(2)
+        cache.put("a", "1", 60)
+        cache.put("b", "2", 60)
+        cache.put("a", "1b", 60)
+        cache.put("c", "3", 60)
+        assert cache.get("a") == "1b"
+        assert cache.get("b") is None
+
+
+class TestCacheSlot:
+    def test_opt_in(self):
+        assert _cache_slot("text", PROMPT, "input") is None
+        set_cache_ttl(PROMPT, 600)
+        slot = _cache_slot("text", PROMPT, "input")
+        assert slot.ttl == 600
+        assert (slot.kind, slot.provider, slot.model) == (
+            "text",
+            "gemini",
+            "gemini-2.5-flash",
+        )
+        set_cache_ttl(PROMPT, 0)
+        assert _cache_slot("text", PROMPT, "input") is None
+
+    def test_global_ttl(self, monkeypatch):
+        monkeypatch.setattr(ai_provider, "AI_CACHE_TTL_SECONDS", 30.0)
+        assert _cache_slot("text", "any prompt", "input").ttl == 30.0
+
+    def test_keying(self, monkeypatch):
+        set_cache_ttl(PROMPT, 600)
+        set_cache_ttl("Other prompt", 600)
+        key = _cache_slot("text", PROMPT, "input").key
+        assert _cache_slot("text", PROMPT, "input").key == key
+        others = {
+            _cache_slot("text", PROMPT, "other input").key,
+            _cache_slot("text", "Other prompt", "input").key,
+            _cache_slot("vision", PROMPT, "input").key,
+            _cache_slot("vision", PROMPT, "input", b"\x89PNG", "image/png").key,
+        }
+        monkeypatch.setenv("GOOGLE_MODEL", "gemini-other")
+        others.add(_cache_slot("text", PROMPT, "input").key)
+        monkeypatch.setenv("AI_PROVIDER", "gemini,anthropic")
+        others.add(_cache_slot("text", PROMPT, "input").key)
+        assert key not in others
+        assert len(others) == 6
+
+
+class TestCachedCalls:
+    def test_hit_and_miss_counting(self, provider):
+        asked, _ = provider
+        set_cache_ttl(PROMPT, 600)
+        misses, hits = _lookups("miss"), _lookups("memory_hit")
+        assert ai_provider.generate_ai_response(PROMPT, "a") == "reply to a"
+        assert ai_provider.generate_ai_response(PROMPT, "a") == "reply to a"
+        assert ai_provider.generate_ai_response(PROMPT, "b") == "reply to b"
+        assert asked == ["a", "b"]
+        assert _lookups("miss") - misses == 2
+        assert _lookups("memory_hit") - hits == 1
+
+    def test_unregistered_prompt_is_not_cached(self, provider):
+        asked, _ = provider
+        misses = _lookups("miss")
+        ai_provider.generate_ai_response("Chat prompt", "a")
+        ai_provider.generate_ai_response("Chat prompt", "a")
+        assert asked == ["a", "a"]
+        assert _lookups("miss") == misses
+
+    def test_invalid_reply_is_not_cached(self, provider):
+        asked, replies = provider
+        set_cache_ttl(PROMPT, 600)
+        replies += ['{"company_name": "Ac', '{"company_name": "Acme"}']
+
+        def validate(text):
+            json.loads(text)
+            return True
+
+        first = ai_provider.generate_ai_response(PROMPT, "a", validate=validate)
+        second = ai_provider.generate_ai_response(PROMPT, "a", validate=validate)
+        third = ai_provider.generate_ai_response(PROMPT, "a", validate=validate)
+        assert first == '{"company_name": "Ac'
+        assert second == third == '{"company_name": "Acme"}'
+        assert asked == ["a", "a"]
+
+    def test_async_validate(self, provider):
+        asked, replies = provider
+        set_cache_ttl(PROMPT, 600)
+        replies += ["not json", "{}"]
+
+        async def run():
+            return [
+                await ai_provider.generate_ai_response_async(
+                    PROMPT, "a", validate=lambda t: t.startswith("{")
+                )
+                for _ in range(3)
+            ]
+
+        assert asyncio.run(run()) == ["not json", "{}", "{}"]
+        assert asked == ["a", "a"]
+
+
+class TestDatabaseTier:
+    def test_skipped_inside_unit_of_work(self, monkeypatch, provider):
+        opened = []
+
+        def fake_get_connection(readonly=False):
+            opened.append(readonly)
+            raise RuntimeError("no database here")
+
+        monkeypatch.setattr(ai_provider, "AI_CACHE_DB", True)
+        monkeypatch.setattr(ai_provider, "get_connection", fake_get_connection)
+        set_cache_ttl(PROMPT, 600)
+
+        token = connection._uow_conn.set(object())
+        try:
+            ai_provider.generate_ai_response(PROMPT, "in unit")
+        finally:
+            connection._uow_conn.reset(token)
+        assert opened == []
+
+        # Outside a unit both tiers are used (failures are only logged)
+        ai_provider.generate_ai_response(PROMPT, "outside")
+        assert opened == [True, False]
@@ -0,0 +1,132 @@
+"""test_20_reply_stream — Streamed intel chat replies stop at the separator.
+
+The AI stream is stubbed (no browser, servers, database or API keys
+needed). The "---" separator and the JSON after it must never reach a
+"delta" event, however the model splits them across chunks.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.routers.nexus import intel as intel_router
+from backend.routers.nexus.intel import REPLY_SEPARATOR, _ReplyStream
+
+REPLY = "好的，已記錄王經理的職稱。\n下次會議是什麼時候？\n"
+FIELDS = '{"contact_title": "採購主管"}'
+ANSWER = f"{REPLY}{REPLY_SEPARATOR}\n{FIELDS}"
+
+
+def _deltas(chunks: list[str]) -> list[str]:
+    reply = _ReplyStream()
+    deltas = [reply.feed(c) for c in chunks]
+    deltas.append(reply.flush())
+    assert reply.text == "".join(chunks)
+    return [d for d in deltas if d]
+
+
+def _split(text: str, *cuts: int) -> list[str]:
+    bounds = [0, *cuts, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+class TestReplyStream:
+    def test_separator_in_one_chunk(self):
+        assert "".join(_deltas([REPLY, f"{REPLY_SEPARATOR}\n{FIELDS}"])) == REPLY
+
+    @pytest.mark.parametrize("offset", [1, 2])
+    def test_separator_split_over_two_chunks(self, offset):
+        at = len(REPLY) + offset
+        deltas = _deltas(_split(ANSWER, at))
+        assert "".join(deltas) == REPLY
+        assert not any("-" in d for d in deltas)
+
+    def test_separator_split_over_three_chunks(self):
+        at = len(REPLY)
+        deltas = _deltas(_split(ANSWER, at + 1, at + 2))
+        assert "".join(deltas) == REPLY
+        assert not any("-" in d for d in deltas)
+
+    def test_character_by_character(self):
+        deltas = _deltas(list(ANSWER))
+        assert "".join(deltas) == REPLY
+        assert not any("-" in d for d in deltas)
+
+    def test_no_separator(self):
+        text = "只有回覆，沒有欄位。"
+        assert "".join(_deltas(_split(text, 3, 6))) == text
+
+    def test_dashes_that_are_not_the_separator(self):
+        text = "範圍 10-20 台，預算 -- 待確認 -"
+        assert "".join(_deltas(list(text))) == text
+
+    def test_held_back_tail_goes_out_with_the_next_chunk(self):
+        reply = _ReplyStream()
+        assert reply.feed("價格 -") == "價格 "
+        assert reply.feed("-") == ""
+        assert reply.feed(" 待議") == "-- 待議"
+
+    def test_trailing_json_is_withheld(self):
+        reply = _ReplyStream()
+        assert reply.feed(f"{REPLY}{REPLY_SEPARATOR}") == REPLY
+        assert reply.feed("\n{") == ""
+        assert reply.feed('"a": 1}') == ""
+        assert reply.flush() == ""
+        assert reply.text == f"{REPLY}{REPLY_SEPARATOR}\n" + '{"a": 1}'
+
+
+def _events(raw: list[bytes]) -> list[tuple[str, dict]]:
+    events = []
+    for chunk in raw:
+        name, data = chunk.decode().strip().split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data[len("data: ") :])))
+    return events
+
+
+class TestStreamChat:
+    """_stream_chat() events for a stubbed model stream."""
+
+    def _run(self, monkeypatch, chunks: list[str]):
+        saved = []
+
+        async def fake_stream(system_prompt, prompt):
+            for chunk in chunks:
+                yield chunk
+
+        def fake_save(intel, current, message, ai_raw):
+            saved.append(ai_raw)
+            return {"ai_reply": ai_raw.split(REPLY_SEPARATOR)[0].strip()}
+
+        monkeypatch.setattr(intel_router, "stream_ai_response_async", fake_stream)
+        monkeypatch.setattr(intel_router, "_save_chat_turn", fake_save)
+
+        async def collect():
+            stream = intel_router._stream_chat({"id": 1}, {}, "hi", "prompt")
+            return [event async for event in stream]
+
+        return _events(asyncio.run(collect())), saved
+
+    def test_deltas_then_done(self, monkeypatch):
+        at = len(REPLY)
+        events, saved = self._run(monkeypatch, _split(ANSWER, 5, at + 1, at + 2))
+        names = [name for name, _ in events]
+        assert names[-1] == "done"
+        assert set(names[:-1]) == {"delta"}
+        text = "".join(data["text"] for name, data in events if name == "delta")
+        assert text == REPLY
+        assert saved == [ANSWER]
+
+    def test_error_event(self, monkeypatch):
+        async def failing_stream(system_prompt, prompt):
+            yield REPLY
+            raise RuntimeError("connection reset")
+
+        monkeypatch.setattr(intel_router, "stream_ai_response_async", failing_stream)
+
+        async def collect():
+            stream = intel_router._stream_chat({"id": 1}, {}, "hi", "prompt")
+            return [event async for event in stream]
+
+        events = _events(asyncio.run(collect()))
+        assert events[-1] == ("error", {"detail": "AI reply failed"})
@@ -0,0 +1,266 @@
+"""test_21_ai_resilience — Retries, circuit breakers and provider fallback.
+
+Provider calls are stub functions (no browser, servers or API keys
+needed).
+"""
+
+import asyncio
+import email.utils
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from services import ai_provider
+from services.ai_provider import (
+    AIProviderUnavailable,
+    _CircuitBreaker,
+    _after_failure,
+    _breaker,
+    _call_with_fallback,
+    _call_with_fallback_async,
+    _is_transient,
+    _retry_after,
+)
+
+
+class _APIError(Exception):
+    """Shaped like the openai / anthropic SDK status errors."""
+
+    def __init__(self, status: int, retry_after: str | None = None):
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+        headers = {} if retry_after is None else {"retry-after": retry_after}
+        self.response = SimpleNamespace(headers=headers)
+
+
+class _GoogleError(Exception):
+    """Shaped like google.api_core errors, which carry ``code``."""
+
+    def __init__(self, code: int):
+        super().__init__(f"code {code}")
+        self.code = code
+
+
+class APIConnectionError(Exception):
+    pass
+
+
+class ReadTimeout(Exception):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers(monkeypatch):
+    monkeypatch.setattr(ai_provider, "_breakers", {})
+    monkeypatch.setattr(ai_provider, "AI_RETRIES", 1)
+    monkeypatch.setattr(ai_provider, "AI_RETRY_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(ai_provider, "AI_RETRY_MAX_SECONDS", 8.0)
+    monkeypatch.setattr(ai_provider, "AI_BREAKER_FAILURES", 2)
+    monkeypatch.setattr(ai_provider, "AI_BREAKER_COOLDOWN_SECONDS", 60.0)
+    monkeypatch.setattr(ai_provider, "_provider_chain", lambda: ["a", "b", "c"])
+
+
+class TestClassification:
+    @pytest.mark.parametrize(
+        "error",
+        [
+            _APIError(429),
+            _APIError(500),
+            _APIError(503),
+            _APIError(529),
+            _APIError(408),
+            _GoogleError(503),
+            ConnectionError("reset"),
+            TimeoutError(),
+            APIConnectionError(),
+            ReadTimeout(),
+        ],
+    )
+    def test_transient(self, error):
+        assert _is_transient(error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            _APIError(400),
+            _APIError(401),
+            _APIError(403),
+            _APIError(404),
+            _GoogleError(400),
+            ValueError("empty reply"),
+            KeyError("choices"),
+        ],
+    )
+    def test_not_transient(self, error):
+        assert not _is_transient(error)
+
+    def test_retry_after_seconds(self):
+        assert _retry_after(_APIError(429, "3")) == 3.0
+        assert _retry_after(_APIError(429, "1.5")) == 1.5
+        assert _retry_after(_APIError(429, "-4")) == 0.0
+
+    def test_retry_after_http_date(self):
+        later = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 28 <= _retry_after(_APIError(503, later)) <= 30
+        earlier = email.utils.formatdate(time.time() - 30, usegmt=True)
+        assert _retry_after(_APIError(503, earlier)) == 0.0
+
+    def test_retry_after_missing_or_garbage(self):
+        assert _retry_after(_APIError(429)) is None
+        assert _retry_after(_APIError(429, "soon")) is None
+        assert _retry_after(ValueError("no response")) is None
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = _CircuitBreaker(failures=2, cooldown=60)
+        breaker.record_failure()
+        assert breaker.allow() and not breaker.is_open
+        breaker.record_failure()
+        assert breaker.is_open
+        assert not breaker.allow()
+
+    def test_success_resets_the_count(self):
+        breaker = _CircuitBreaker(failures=2, cooldown=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow()
+
+    def test_half_open_single_trial(self):
+        breaker = _CircuitBreaker(failures=1, cooldown=0.05)
+        breaker.record_failure()
+        assert not breaker.allow()
+        time.sleep(0.06)
+        assert breaker.allow()  # the trial
+        assert not breaker.allow()  # others wait for its verdict
+        breaker.record_success()
+        assert breaker.allow() and breaker.allow()
+
+    def test_failed_trial_reopens(self):
+        breaker = _CircuitBreaker(failures=3, cooldown=0.05)
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.is_open and not breaker.allow()
+
+    def test_released_trial_lets_another_run(self):
+        breaker = _CircuitBreaker(failures=1, cooldown=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.release_trial()
+        assert breaker.allow()
+
+    def test_open_for_extends_cooldown(self):
+        breaker = _CircuitBreaker(failures=5, cooldown=0.01)
+        breaker.record_failure(open_for=60)
+        time.sleep(0.02)
+        assert breaker.is_open and not breaker.allow()
+
+
+class TestAfterFailure:
+    def test_transient_is_retried(self):
+        assert _after_failure("a", _APIError(503), attempt=0) == 0.0
+        assert _after_failure("b", _APIError(429, "2"), attempt=0) == 2.0
+
+    def test_retries_are_bounded(self):
+        assert _after_failure("a", _APIError(503), attempt=1) is None
+
+    def test_timeouts_move_on(self):
+        assert _after_failure("a", TimeoutError(), attempt=0) is None
+        assert _breaker("a")._consecutive == 1
+
+    def test_long_retry_after_opens_breaker(self):
+        assert _after_failure("a", _APIError(429, "120"), attempt=0) is None
+        assert _breaker("a").is_open
+
+    def test_auth_errors_count_as_failures(self):
+        assert _after_failure("a", _APIError(401), attempt=0) is None
+        assert _after_failure("a", _APIError(403), attempt=0) is None
+        assert _breaker("a").is_open
+
+    @pytest.mark.parametrize("error", [_APIError(400), ValueError("blocked")])
+    def test_other_client_errors_leave_breaker_alone(self, error):
+        _after_failure("a", _APIError(503), attempt=0)
+        assert _after_failure("a", error, attempt=0) is None
+        assert _breaker("a")._consecutive == 1
+        # ... so alternating 429 / 400 still opens it
+        _after_failure("a", _APIError(429), attempt=0)
+        assert _breaker("a").is_open
+
+
+def _stub(script: dict[str, list]):
+    """call(provider, arg) answering from per-provider queues; an Exception
+    entry is raised. Returns (call, log of providers called)."""
+    log = []
+
+    def call(provider, arg):
+        log.append(provider)
+        outcome = script[provider].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return f"{outcome} {arg}"
+
+    return call, log
+
+
+class TestCallWithFallback:
+    def test_first_provider_answers(self):
+        call, log = _stub({"a": ["ok from a"]})
+        assert _call_with_fallback(call, "x") == "ok from a x"
+        assert log == ["a"]
+
+    def test_retry_then_next_provider(self):
+        call, log = _stub({"a": [_APIError(503), _APIError(503)], "b": ["ok"]})
+        assert _call_with_fallback(call, "x") == "ok x"
+        assert log == ["a", "a", "b"]
+
+    def test_client_error_is_not_retried(self):
+        call, log = _stub({"a": [_APIError(400)], "b": ["ok"]})
+        assert _call_with_fallback(call, "x") == "ok x"
+        assert log == ["a", "b"]
+
+    def test_last_error_is_raised(self):
+        errors = {p: [ValueError(f"{p} blocked")] for p in "abc"}
+        call, log = _stub(errors)
+        with pytest.raises(ValueError, match="c blocked"):
+            _call_with_fallback(call, "x")
+        assert log == ["a", "b", "c"]
+
+    def test_open_breaker_is_skipped(self):
+        _breaker("a").record_failure(open_for=60)
+        call, log = _stub({"b": ["ok"]})
+        assert _call_with_fallback(call, "x") == "ok x"
+        assert log == ["b"]
+
+    def test_all_open(self):
+        for p in "abc":
+            _breaker(p).record_failure(open_for=60)
+        call, log = _stub({})
+        with pytest.raises(AIProviderUnavailable):
+            _call_with_fallback(call, "x")
+        assert log == []
+
+    def test_broken_key_opens_breaker(self):
+        call, log = _stub({"a": [_APIError(401)] * 2, "b": ["ok", "ok"]})
+        for _ in range(2):
+            assert _call_with_fallback(call, "x") == "ok x"
+        assert _breaker("a").is_open
+        call, log = _stub({"b": ["ok"]})
+        _call_with_fallback(call, "x")
+        assert log == ["b"]
+
+    def test_async_order(self):
+        call, log = _stub(
+            {"a": [_APIError(529), _APIError(529)], "b": [TimeoutError()], "c": ["ok"]}
+        )
+
+        async def acall(provider, arg):
+            return call(provider, arg)
+
+        assert asyncio.run(_call_with_fallback_async(acall, "x")) == "ok x"
+        assert log == ["a", "a", "b", "c"]